@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Compares the generated model classes with the ones quicktype used to generate
+
+    python benchmarks/bench_codecs.py [--users 1000] [--rounds 20]
+"""
+import argparse
+import json
+import sys
+import time
+from os.path import dirname, join
+
+sys.path.insert(0, join(dirname(__file__), "..", "src"))
+sys.path.insert(0, dirname(__file__))
+
+from slack_scim.v1 import users as generated  # noqa: E402
+import quicktype_users as quicktype  # noqa: E402
+
+
+def build_users_page(count: int) -> str:
+    resources = []
+    for i in range(count):
+        resources.append({
+            "schemas": ["urn:scim:schemas:core:1.0"],
+            "id": f"W{i:08d}",
+            "externalId": f"ext-{i}",
+            "meta": {"created": "2020-01-01T00:00:00-08:00", "location": f"https://api.slack.com/scim/v1/Users/W{i:08d}"},
+            "userName": f"user{i}",
+            "nickName": f"user{i}",
+            "name": {"givenName": "Kazuhiro", "familyName": "Sera"},
+            "displayName": f"User {i}",
+            "profileUrl": f"https://example.slack.com/team/user{i}",
+            "title": "Engineer",
+            "timezone": "Asia/Tokyo",
+            "active": True,
+            "emails": [{"value": f"user{i}@example.com", "primary": True}],
+            "photos": [{"value": "https://example.com/a.png", "type": "photo"}],
+            "groups": [{"value": "S111", "display": "Engineering"}],
+            "addresses": [{"country": "JP", "primary": True, "locality": "Tokyo"}],
+            "phoneNumbers": [{"value": "000-0000-0000", "type": "mobile", "primary": True}],
+            "roles": [{"value": "member", "primary": True}],
+        })
+    return json.dumps({
+        "totalResults": count,
+        "itemsPerPage": count,
+        "startIndex": 1,
+        "schemas": ["urn:scim:schemas:core:1.0"],
+        "Resources": resources,
+    })
+
+
+def measure(f, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000, help="the number of users in the page")
+    parser.add_argument("--rounds", type=int, default=20, help="the number of measurements (the best one is used)")
+    args = parser.parse_args()
+
+    body = build_users_page(args.users)
+    data = json.loads(body)
+    assert generated.Users.from_dict(data).to_dict() == quicktype.Users.from_dict(data).to_dict()
+    generated_page = generated.Users.from_dict(data)
+    quicktype_page = quicktype.Users.from_dict(data)
+
+    results = [
+        ("json.loads", measure(lambda: json.loads(body), args.rounds), None),
+        (
+            "from_dict",
+            measure(lambda: generated.Users.from_dict(data), args.rounds),
+            measure(lambda: quicktype.Users.from_dict(data), args.rounds),
+        ),
+        ("lazy", measure(lambda: generated.Users.from_dict(data, lazy=True), args.rounds), None),
+        (
+            "to_dict",
+            measure(generated_page.to_dict, args.rounds),
+            measure(quicktype_page.to_dict, args.rounds),
+        ),
+    ]
+    print(f"A Users page with {args.users} users (best of {args.rounds})")
+    print(f"{'':<12}{'generated':>14}{'quicktype':>14}{'speedup':>10}")
+    for name, new, old in results:
+        if old is None:
+            print(f"{name:<12}{new * 1000:>11.2f} ms")
+        else:
+            print(f"{name:<12}{new * 1000:>11.2f} ms{old * 1000:>11.2f} ms{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
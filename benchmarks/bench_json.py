@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Compares the JSON codecs available for SCIMClient
+
+    python benchmarks/bench_json.py [--users 1000] [--rounds 20]
+"""
+import argparse
+import glob
+import sys
+from os.path import basename, dirname, join
+
+sys.path.insert(0, join(dirname(__file__), "..", "src"))
+sys.path.insert(0, dirname(__file__))
+
+from slack_scim.v1.json_codec import get_codec  # noqa: E402
+from bench_codecs import build_users_page, measure  # noqa: E402
+
+
+def available_codecs() -> list:
+    codecs = []
+    for name in ("json", "ujson", "orjson"):
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name} is not installed")
+    return codecs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000, help="the number of users in the generated page")
+    parser.add_argument("--rounds", type=int, default=20, help="the number of measurements (the best one is used)")
+    args = parser.parse_args()
+
+    fixture_dir = join(dirname(__file__), "..", "tests", "fixture")
+    documents = []
+    for path in sorted(glob.glob(join(fixture_dir, "*.json"))):
+        with open(path, "rb") as f:
+            documents.append((basename(path), f.read()))
+    documents.append((f"{args.users} users", build_users_page(args.users).encode("utf-8")))
+
+    codecs = available_codecs()
+    baseline = codecs[0]
+    print(f"Best of {args.rounds} rounds; the speedup is relative to {baseline.name}")
+    print(f"{'':<36}{'':>8}" + "".join(f"{c.name:>20}" for c in codecs))
+    for name, body in documents:
+        data = baseline.loads(body)
+        # Each fixture is small; repeat it to measure something
+        repeat = max(1, 200000 // len(body))
+        for operation, run in (
+            ("loads", lambda c: measure(lambda: [c.loads(body) for _ in range(repeat)], args.rounds)),
+            # request bodies are serialized with dumps_bytes
+            ("dumps", lambda c: measure(lambda: [c.dumps_bytes(data) for _ in range(repeat)], args.rounds)),
+        ):
+            times = [run(c) / repeat for c in codecs]
+            cells = "".join(f"{t * 1e6:>9.1f} us ({times[0] / t:>4.1f}x)" for t in times)
+            print(f"{name:<36}{operation:>8}{cells}")
+
+
+if __name__ == "__main__":
+    main()
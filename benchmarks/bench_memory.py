@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Measures the memory held by the model classes per user, for the users in the test fixtures
+
+    python benchmarks/bench_memory.py [--copies 10000]
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from os.path import dirname, join
+
+sys.path.insert(0, join(dirname(__file__), "..", "src"))
+sys.path.insert(0, dirname(__file__))
+
+from slack_scim.v1 import users as generated  # noqa: E402
+import quicktype_users as quicktype  # noqa: E402
+
+fixture_dir = join(dirname(__file__), "..", "tests", "fixture")
+
+
+def load_fixture_users() -> list:
+    resources = []
+    for name in ["v1_users_1.json", "v1_users_2.json"]:
+        with open(join(fixture_dir, name)) as f:
+            resources.extend(json.load(f)["Resources"])
+    for name in ["v1_user_1.json", "v1_user_2.json"]:
+        with open(join(fixture_dir, name)) as f:
+            resources.append(json.load(f))
+    return resources
+
+
+def bytes_per_user(resource_class, resources: list, copies: int) -> float:
+    # The decoded JSON is shared by all the copies, so only the model objects are counted
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [resource_class.from_dict(resources[i % len(resources)]) for i in range(copies)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10000, help="the number of users to hold in memory")
+    args = parser.parse_args()
+
+    resources = load_fixture_users()
+    new = bytes_per_user(generated.Resource, resources, args.copies)
+    old = bytes_per_user(quicktype.Resource, resources, args.copies)
+    print(f"{args.copies} users decoded from {len(resources)} fixture users")
+    print(f"{'generated (__slots__)':<24}{new:>10.0f} bytes/user")
+    print(f"{'quicktype (__dict__)':<24}{old:>10.0f} bytes/user")
+    print(f"{'saved':<24}{(old - new) / old * 100:>9.0f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+"""Measures the decoding, the request building and the API calls, saving the results as JSON
+
+    python benchmarks/bench_suite.py [--users 1000] [--rounds 20] [--output results.json]
+    python benchmarks/bench_suite.py --compare baseline.json [results.json] [--threshold 10]
+
+Without results.json, --compare runs the suite and compares the new results with the baseline.
+It exits with 1 if any benchmark is slower than the baseline by more than threshold percent.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import types
+from os.path import dirname, join, abspath
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+root_dir = abspath(join(dirname(__file__), ".."))
+sys.path.insert(0, join(root_dir, "src"))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, dirname(__file__))
+
+from slack_scim import SCIMClient, ClientTuning, User, Users  # noqa: E402
+from slack_scim.v1.internal_utils import _build_http_request, _to_non_null_dict, _to_user_dict  # noqa: E402
+from slack_scim.v1.request import SCIMRequest  # noqa: E402
+from slack_scim.v1.version import __version__  # noqa: E402
+from bench_codecs import build_users_page  # noqa: E402
+from tests.v1.mock_server import MockHandler, MockServerThread  # noqa: E402
+
+
+class PagingHandler(MockHandler):
+    # Serves a directory of total_users synthetic users on /Users, honoring startIndex and count
+    total_users = 0
+    resources: List[dict] = []
+    _pages: Dict[Tuple[int, int], bytes] = {}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path != "/Users" or not self.is_valid_token():
+            return super().do_GET()
+        query = parse_qs(parsed.query)
+        start_index = int(query.get("startIndex", ["1"])[0])
+        count = int(query.get("count", ["100"])[0])
+        body = self._pages.get((start_index, count))
+        if body is None:
+            chunk = self.resources[start_index - 1:start_index - 1 + count]
+            body = json.dumps({
+                "totalResults": self.total_users,
+                "itemsPerPage": len(chunk),
+                "startIndex": start_index,
+                "schemas": ["urn:scim:schemas:core:1.0"],
+                "Resources": chunk,
+            }).encode("utf-8")
+            self._pages[(start_index, count)] = body
+        self.send_response(200)
+        self.send_header("content-type", "application/json;charset=utf-8")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server(total_users: int) -> MockServerThread:
+    PagingHandler.total_users = total_users
+    PagingHandler.resources = json.loads(build_users_page(total_users))["Resources"]
+    PagingHandler._pages = {}
+    # MockServerThread reports the URL to the object given as the test
+    owner = types.SimpleNamespace(server_started=threading.Event())
+    thread = MockServerThread(owner, PagingHandler)
+    thread.start()
+    owner.server_started.wait()
+    thread.server_url = owner.server_url
+    return thread
+
+
+def timings(f: Callable[[], None], rounds: int) -> List[float]:
+    result = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        f()
+        result.append(time.perf_counter() - started)
+    return result
+
+
+def benchmarks(args, server_url: str) -> List[Tuple[str, Callable[[], None], int]]:
+    # (name, function, the number of operations done by a call of the function)
+    body = build_users_page(args.users)
+    data = json.loads(body)
+    resources = data["Resources"]
+    users = [User.from_dict(r) for r in resources]
+    page = Users.from_dict(data)
+    page_dict = page.to_dict()
+
+    client = SCIMClient(token="xoxp-123-123", base_url=server_url, tuning=ClientTuning())
+    request = SCIMRequest(token=client.token, http_method="GET", url=f"{server_url}/Users/W111")
+    calls = args.calls
+    writes = [
+        SCIMRequest(
+            token=client.token,
+            http_method="PUT",
+            url=f"{server_url}/Users/{u.id}",
+            json_body=_to_user_dict(u, SCIMClient.schema_values),
+        )
+        for u in users
+    ]
+
+    def api_calls():
+        for _ in range(calls):
+            client.api_call(request)
+
+    def paginate():
+        for _ in client.iter_users(page_size=args.page_size):
+            pass
+
+    return [
+        ("User.from_dict", lambda: [User.from_dict(r) for r in resources], len(resources)),
+        ("User.to_dict", lambda: [u.to_dict() for u in users], len(users)),
+        ("Users.from_dict", lambda: Users.from_dict(data), len(resources)),
+        ("Users.to_dict", page.to_dict, len(resources)),
+        ("_to_non_null_dict", lambda: _to_non_null_dict(page_dict), len(resources)),
+        ("_build_http_request", lambda: [_build_http_request(r, client.json_codec) for r in writes], len(writes)),
+        ("api_call", api_calls, calls),
+        ("iter_users", paginate, args.users),
+    ]
+
+
+def run(args) -> dict:
+    os.chdir(root_dir)  # the mock server reads the fixtures with relative paths
+    thread = start_mock_server(args.users)
+    try:
+        results = {}
+        for name, f, operations in benchmarks(args, thread.server_url):
+            if args.only and not any(o in name for o in args.only):
+                continue
+            f()  # warm up
+            times = timings(f, args.rounds)
+            best = min(times)
+            results[name] = {
+                "best": best,
+                "median": statistics.median(times),
+                "operations": operations,
+                "operations_per_second": operations / best if best > 0 else None,
+            }
+            print(f"{name:<24}{best * 1000:>10.2f} ms{operations / best:>14.0f} ops/s")
+    finally:
+        thread.stop()
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "parameters": {"users": args.users, "rounds": args.rounds, "calls": args.calls, "page_size": args.page_size},
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """Prints the change of the best times; returns True if nothing is slower than threshold percent"""
+    ok = True
+    print(f"{'':<24}{'baseline':>13}{'current':>13}{'change':>10}")
+    for name, new in current["results"].items():
+        old: Optional[dict] = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:<24}{'-':>13}{new['best'] * 1000:>10.2f} ms")
+            continue
+        if old["operations"] != new["operations"]:
+            print(f"{name:<24} skipped: measured with different parameters")
+            continue
+        change = (new["best"] / old["best"] - 1) * 100
+        regressed = change > threshold
+        ok = ok and not regressed
+        mark = "  REGRESSION" if regressed else ""
+        print(f"{name:<24}{old['best'] * 1000:>10.2f} ms{new['best'] * 1000:>10.2f} ms{change:>+9.1f}%{mark}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000, help="the number of users in a page and in the directory")
+    parser.add_argument("--rounds", type=int, default=20, help="the number of measurements (the best one is compared)")
+    parser.add_argument("--calls", type=int, default=200, help="the number of api_call round trips in a measurement")
+    parser.add_argument("--page-size", type=int, default=100, help="the page size of iter_users")
+    parser.add_argument("--only", nargs="*", help="runs only the benchmarks whose names contain any of these")
+    parser.add_argument("--output", help="the file to save the results as JSON")
+    parser.add_argument("--compare", nargs="+", metavar="RESULTS", help="baseline.json [results.json]")
+    parser.add_argument("--threshold", type=float, default=10.0, help="the slowdown in percent to report as failure")
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes baseline.json and optionally results.json")
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+    else:
+        current = run(args)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        if not compare(baseline, current, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
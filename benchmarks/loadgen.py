@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+"""Replays a workload through SCIMClient at increasing concurrency levels to size bulk jobs
+
+    python benchmarks/loadgen.py --fake --mix read_user=60,search_users=20,patch_user=15,create_user=5
+    python benchmarks/loadgen.py --base-url https://api.slack.com/scim/v1 --token xoxp-... \\
+        --mix read_user=80,search_users=20 --concurrency 1,2,4,8 --operations 500
+
+Each step reports the throughput, the latency percentiles, and the error and 429 rates.
+--estimate tells how long a job of that many operations would take at each step's throughput.
+Write operations change the directory; they are allowed against a real server only with --allow-writes.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from os.path import abspath, dirname, join
+from typing import Callable, Dict, List, Optional
+
+root_dir = abspath(join(dirname(__file__), ".."))
+sys.path.insert(0, join(root_dir, "src"))
+sys.path.insert(0, root_dir)
+
+from slack_scim import (  # noqa: E402
+    ConnectionPool,
+    MetricsAggregator,
+    RateLimiter,
+    SCIMApiError,
+    SCIMClient,
+)
+from slack_scim.v1.instrumentation import _percentile  # noqa: E402
+
+WRITE_OPERATIONS = {"create_user", "patch_user", "delete_user", "patch_group"}
+
+
+class Targets:
+    def __init__(self, user_ids: List[str], group_ids: List[str], user_names: List[str]):
+        """The existing resources the operations read and write, sampled from the server before the run"""
+        self.user_ids = user_ids
+        self.group_ids = group_ids
+        self.user_names = user_names
+        self.created: List[str] = []
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._run = f"{int(time.time())}"
+
+    def next_name(self) -> str:
+        return f"loadgen-{self._run}-{next(self._sequence)}"
+
+    def add_created(self, id: str):
+        with self._lock:
+            self.created.append(id)
+
+    def pop_created(self) -> Optional[str]:
+        with self._lock:
+            return self.created.pop() if self.created else None
+
+
+def sample_targets(client: SCIMClient, count: int) -> Targets:
+    users = client.search_users(count=count).resources or []
+    groups = client.search_groups(count=count).resources or []
+    return Targets([u.id for u in users], [g.id for g in groups], [u.user_name for u in users])
+
+
+def build_operations(targets: Targets, page_size: int) -> Dict[str, Callable[[SCIMClient, random.Random], None]]:
+    def create_user(client: SCIMClient, r: random.Random):
+        name = targets.next_name()
+        created = client.create_user({
+            "userName": name,
+            "displayName": name,
+            "emails": [{"value": f"{name}@example.com", "primary": True}],
+        })
+        targets.add_created(created.id)
+
+    def delete_user(client: SCIMClient, r: random.Random):
+        id = targets.pop_created()
+        if id is None:
+            create_user(client, r)
+        else:
+            client.delete_user(id)
+
+    def patch_group(client: SCIMClient, r: random.Random):
+        member = {"value": r.choice(targets.user_ids)}
+        if r.random() < 0.5:
+            member["operation"] = "delete"
+        client.patch_group(r.choice(targets.group_ids), {"members": [member]})
+
+    return {
+        "read_user": lambda client, r: client.read_user(r.choice(targets.user_ids)),
+        "search_users": lambda client, r: client.search_users(
+            count=page_size, start_index=r.randint(1, max(1, len(targets.user_ids)))),
+        "filter_users": lambda client, r: client.search_users(
+            filter=f'userName eq "{r.choice(targets.user_names)}"'),
+        "create_user": create_user,
+        "patch_user": lambda client, r: client.patch_user(
+            r.choice(targets.user_ids), {"title": f"Title {r.randint(1, 1000)}"}),
+        "delete_user": delete_user,
+        "read_group": lambda client, r: client.read_group(r.choice(targets.group_ids)),
+        "search_groups": lambda client, r: client.search_groups(count=page_size),
+        "patch_group": patch_group,
+    }
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parses read_user=60,search_users=40, or a JSON file with the same weights"""
+    if os.path.isfile(value):
+        with open(value) as f:
+            return {k: float(v) for k, v in json.load(f).items()}
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def run_step(
+    make_client: Callable[[int], SCIMClient],
+    operations: Dict[str, Callable[[SCIMClient, random.Random], None]],
+    mix: Dict[str, float],
+    *,
+    concurrency: int,
+    count: Optional[int],
+    duration: Optional[float],
+    seed: int,
+) -> dict:
+    client = make_client(concurrency)
+    names = list(mix.keys())
+    weights = [mix[n] for n in names]
+    remaining = itertools.count()
+    lock = threading.Lock()
+    latencies: Dict[str, List[float]] = {n: [] for n in names}
+    errors: Dict[str, Dict[str, int]] = {n: {} for n in names}
+
+    def worker(index: int):
+        r = random.Random(seed * 1000 + index)
+        deadline = time.monotonic() + duration if duration else None
+        while True:
+            if count is not None and next(remaining) >= count:
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            name = r.choices(names, weights)[0]
+            started = time.perf_counter()
+            error = None
+            try:
+                operations[name](client, r)
+            except SCIMApiError as e:
+                error = str(e.status)
+            except Exception as e:
+                error = type(e).__name__
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies[name].append(elapsed)
+                if error is not None:
+                    errors[name][error] = errors[name].get(error, 0) + 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(worker, i) for i in range(concurrency)]:
+            future.result()
+    wall_time = time.perf_counter() - started
+    client.connection_pool.close()
+
+    metrics = client.hooks[0].snapshot()
+    http_requests = sum(m.count + m.retries for m in metrics.values())
+    rate_limited = sum(b.throttled for b in client.rate_limiter.budgets().values())
+    all_latencies = sorted(v for values in latencies.values() for v in values)
+    failed = sum(sum(e.values()) for e in errors.values())
+    return {
+        "concurrency": concurrency,
+        "operations": len(all_latencies),
+        "seconds": wall_time,
+        "throughput": len(all_latencies) / wall_time if wall_time > 0 else 0.0,
+        "p50": _percentile(all_latencies, 0.5),
+        "p90": _percentile(all_latencies, 0.9),
+        "p99": _percentile(all_latencies, 0.99),
+        "error_rate": failed / len(all_latencies) if all_latencies else 0.0,
+        "http_requests": http_requests,
+        "rate_limited": rate_limited,
+        "rate_limited_rate": rate_limited / http_requests if http_requests else 0.0,
+        "by_operation": {
+            name: {
+                "operations": len(values),
+                "p50": _percentile(sorted(values), 0.5),
+                "p99": _percentile(sorted(values), 0.99),
+                "errors": errors[name],
+            }
+            for name, values in latencies.items()
+            if values
+        },
+    }
+
+
+def print_step(step: dict, estimate: Optional[int]):
+    line = (
+        f"{step['concurrency']:>6}{step['operations']:>8}{step['throughput']:>10.1f}"
+        f"{step['p50'] * 1000:>9.1f}{step['p90'] * 1000:>9.1f}{step['p99'] * 1000:>9.1f}"
+        f"{step['error_rate'] * 100:>8.2f}%{step['rate_limited_rate'] * 100:>8.2f}%"
+    )
+    if estimate:
+        line += f"{estimate / step['throughput'] / 60 if step['throughput'] > 0 else float('inf'):>10.1f} min"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=SCIMClient.production_base_url, help="the SCIM API base URL")
+    parser.add_argument("--token", default=os.environ.get("SLACK_SCIM_TOKEN"), help="defaults to $SLACK_SCIM_TOKEN")
+    parser.add_argument("--mix", default="read_user=60,search_users=20,patch_user=15,create_user=5",
+                        help="operation weights such as read_user=60,patch_group=40, or a JSON file of them")
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="the concurrency levels to step through")
+    parser.add_argument("--operations", type=int, default=1000, help="the number of operations per step")
+    parser.add_argument("--duration", type=float, help="runs each step for these seconds instead of --operations")
+    parser.add_argument("--page-size", type=int, default=100, help="the count of search operations")
+    parser.add_argument("--estimate", type=int, help="the size of a job to estimate the duration of, e.g. 50000")
+    parser.add_argument("--allow-writes", action="store_true", help="allows write operations against --base-url")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="the file to save the results as JSON")
+    parser.add_argument("--fake", action="store_true", help="runs against a local fake server instead of --base-url")
+    parser.add_argument("--fake-users", type=int, default=1000)
+    parser.add_argument("--fake-groups", type=int, default=50)
+    parser.add_argument("--fake-latency", type=float, default=0.02, help="the median latency of the fake server")
+    parser.add_argument("--fake-rate-limit", type=float, help="the requests per second the fake server accepts")
+    parser.add_argument("--fake-error-ratio", type=float, default=0.0, help="the ratio of 503s of the fake server")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    server = None
+    if args.fake:
+        from tests.v1.fake_server import FakeSCIMServer, lognormal
+
+        server = FakeSCIMServer(
+            latency=lognormal(args.fake_latency, 0.5) if args.fake_latency > 0 else None,
+            rate_limit=args.fake_rate_limit,
+            error_ratio=args.fake_error_ratio,
+            seed=args.seed,
+        ).start()
+        server.directory.add_users(args.fake_users)
+        server.directory.add_groups(args.fake_groups, members_per_group=10)
+        base_url, token = server.url, "xoxp-loadgen"
+    else:
+        base_url, token = args.base_url, args.token
+        if not token:
+            parser.error("--token or $SLACK_SCIM_TOKEN is required")
+        writes = sorted(WRITE_OPERATIONS.intersection(mix))
+        if writes and not args.allow_writes:
+            parser.error(f"{', '.join(writes)} change the directory at {base_url}; add --allow-writes to run them")
+
+    def make_client(concurrency: int) -> SCIMClient:
+        return SCIMClient(
+            token=token,
+            base_url=base_url,
+            connection_pool=ConnectionPool(max_connections_per_host=concurrency),
+            rate_limiter=RateLimiter(),
+            hooks=[MetricsAggregator()],
+        )
+
+    try:
+        sampling_client = make_client(1)
+        targets = sample_targets(sampling_client, max(args.page_size, 100))
+        sampling_client.connection_pool.close()
+        if not targets.user_ids:
+            sys.exit("No users found to run the operations on")
+        operations = build_operations(targets, args.page_size)
+        unknown = [name for name in mix if name not in operations]
+        if unknown:
+            parser.error(f"Unknown operations: {', '.join(unknown)}; choose from {', '.join(operations)}")
+        if not targets.group_ids and any(name in mix for name in ("read_group", "patch_group")):
+            sys.exit("No groups found to run the group operations on")
+
+        print(f"{base_url}: {', '.join(f'{name}={weight:g}' for name, weight in mix.items())}")
+        header = f"{'conc':>6}{'ops':>8}{'ops/s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'errors':>9}{'429s':>9}"
+        print(header + (f"{args.estimate:>10} ops" if args.estimate else ""))
+        steps = []
+        for concurrency in [int(c) for c in args.concurrency.split(",")]:
+            step = run_step(
+                make_client,
+                operations,
+                mix,
+                concurrency=concurrency,
+                count=None if args.duration else args.operations,
+                duration=args.duration,
+                seed=args.seed,
+            )
+            steps.append(step)
+            print_step(step, args.estimate)
+    finally:
+        if server is not None:
+            server.stop()
+
+    best = max(steps, key=lambda s: s["throughput"])
+    print(f"Best throughput: {best['throughput']:.1f} ops/s at concurrency {best['concurrency']}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"base_url": base_url, "mix": mix, "steps": steps}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
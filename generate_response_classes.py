@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+"""Generates the model classes in src/slack_scim/v1 from the JSON schemas in json-schema/v1
+
+The generated from_dict/to_dict methods are straight-line code specialized for each property,
+which is several times faster than the generic from_union-based functions quicktype used to generate.
+
+    python generate_response_classes.py
+"""
+import json
+import re
+from os.path import dirname, join
+from typing import Dict, List, Optional, Tuple
+
+base_dir = dirname(__file__)
+schema_dir = join(base_dir, "json-schema", "v1")
+output_dir = join(base_dir, "src", "slack_scim", "v1")
+
+# (module name, schema name)
+targets = [
+    ("groups", "Groups"),
+    ("group", "Group"),
+    ("users", "Users"),
+    ("user", "User"),
+    ("service_provider_configs", "ServiceProviderConfigs"),
+]
+
+helper_functions = '''T = TypeVar("T")
+
+
+def from_str(x: Any) -> str:
+    assert isinstance(x, str)
+    return x
+
+
+def from_none(x: Any) -> Any:
+    assert x is None
+    return x
+
+
+def from_union(fs, x):
+    for f in fs:
+        try:
+            return f(x)
+        except:
+            pass
+    assert False
+
+
+def from_bool(x: Any) -> bool:
+    assert isinstance(x, bool)
+    return x
+
+
+def from_int(x: Any) -> int:
+    assert isinstance(x, int) and not isinstance(x, bool)
+    return x
+
+
+def from_list(f: Callable[[Any], T], x: Any) -> List[T]:
+    assert isinstance(x, list)
+    return [f(y) for y in x]
+
+
+def to_class(c: Type[T], x: Any) -> dict:
+    assert isinstance(x, c)
+    return cast(Any, x).to_dict()
+'''
+
+primitive_types = {"string": "str", "boolean": "bool", "integer": "int"}
+primitive_checks = {
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "integer": "isinstance({v}, int) and not isinstance({v}, bool)",
+}
+
+
+def to_class_name(definition_name: str) -> str:
+    return re.sub(r"[^0-9A-Za-z]", "", definition_name)
+
+
+def to_snake_case(key: str) -> str:
+    name = re.sub(r"\.", "", key)
+    name = re.sub(r"[^0-9A-Za-z]+", "_", name)
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    return re.sub(r"_+", "_", name).strip("_").lower()
+
+
+def to_module_function_name(class_name: str) -> str:
+    return to_snake_case(class_name)
+
+
+class Property:
+    def __init__(self, key: str, schema: dict):
+        self.key = key
+        self.name = to_snake_case(key)
+        self.is_list = schema.get("type") == "array"
+        # Properties added after the first release have a default value,
+        # and come last in the constructor to keep the positional arguments compatible
+        self.has_default = "default" in schema
+        item = schema["items"] if self.is_list else schema
+        if "$ref" in item:
+            self.class_name: Optional[str] = to_class_name(item["$ref"].split("/")[-1])
+            self.primitive: Optional[str] = None
+        else:
+            self.class_name = None
+            self.primitive = item["type"]
+
+    @property
+    def item_type(self) -> str:
+        return self.class_name or primitive_types[self.primitive]
+
+    @property
+    def type_hint(self) -> str:
+        return f"Optional[List[{self.item_type}]]" if self.is_list else f"Optional[{self.item_type}]"
+
+    def item_check(self, v: str) -> str:
+        if self.class_name:
+            return f"isinstance({v}, {self.class_name})"
+        return primitive_checks[self.primitive].format(v=v)
+
+
+class ModelClass:
+    def __init__(self, definition_name: str, schema: dict):
+        self.name = to_class_name(definition_name)
+        self.is_root = False
+        self.properties: List[Property] = sorted(
+            [Property(k, v) for k, v in schema.get("properties", {}).items()],
+            key=lambda p: (p.has_default, p.name),
+        )
+
+    @property
+    def dependencies(self) -> List[str]:
+        return [p.class_name for p in self.properties if p.class_name]
+
+    @property
+    def tracks_changes(self) -> bool:
+        """User and Group remember the decoded data to find the changed attributes for PATCH requests
+
+        The resources in search results don't, as holding their JSON would double the memory for large directories.
+        """
+        return self.is_root and any(p.key == "id" for p in self.properties)
+
+    @property
+    def supports_lazy(self) -> bool:
+        """Arrays of objects can be decoded lazily"""
+        return any(p.is_list and p.class_name for p in self.properties)
+
+
+def load_classes(schema_name: str) -> Tuple[List[ModelClass], str]:
+    with open(join(schema_dir, f"{schema_name}.json")) as f:
+        schema = json.load(f)
+    classes: Dict[str, ModelClass] = {}
+    for definition_name, definition in schema["definitions"].items():
+        c = ModelClass(definition_name, definition)
+        classes[c.name] = c
+
+    # Dependencies first, otherwise in alphabetical order
+    ordered: List[ModelClass] = []
+
+    def visit(name: str):
+        c = classes[name]
+        if c in ordered:
+            return
+        for dependency in sorted(c.dependencies):
+            visit(dependency)
+        ordered.append(c)
+
+    for name in sorted(classes.keys()):
+        visit(name)
+    root = to_class_name(schema["$ref"].split("/")[-1])
+    classes[root].is_root = True
+    return ordered, root
+
+
+def generate_decoder(c: ModelClass, classes: Dict[str, ModelClass]) -> List[str]:
+    lines = ["    @staticmethod"]
+    if c.supports_lazy:
+        lines.append(f"    def from_dict(obj: Any, lazy: bool = False) -> '{c.name}':")
+    else:
+        lines.append(f"    def from_dict(obj: Any) -> '{c.name}':")
+    lines.append("        assert isinstance(obj, dict)")
+    for p in c.properties:
+        v = p.name
+        lines.append(f'        {v} = obj.get("{p.key}")')
+        if p.is_list:
+            lines.append(f"        if {v} is not None:")
+            lines.append(f"            assert isinstance({v}, list)")
+            if p.class_name:
+                if classes[p.class_name].supports_lazy:
+                    lazy_decoder = f"lambda x: {p.class_name}.from_dict(x, True)"
+                else:
+                    lazy_decoder = f"{p.class_name}.from_dict"
+                lines.append("            if lazy:")
+                lines.append(f"                {v} = LazyList({v}, {lazy_decoder})")
+                lines.append("            else:")
+                lines.append(f"                {v} = [{p.class_name}.from_dict(x) for x in {v}]")
+            else:
+                lines.append(f"            assert all({p.item_check('x')} for x in {v})")
+                lines.append(f"            {v} = list({v})")
+        elif p.class_name:
+            lines.append(f"        if {v} is not None:")
+            lines.append(f"            {v} = {p.class_name}.from_dict({v})")
+        else:
+            lines.append(f"        assert {v} is None or {p.item_check(v)}")
+    args = ", ".join(p.name for p in c.properties)
+    lines.append(f"        return {c.name}({args})")
+    return lines
+
+
+def generate_encoder(c: ModelClass) -> List[str]:
+    lines = ["    def to_dict(self) -> dict:"]
+    for p in c.properties:
+        v = p.name
+        lines.append(f"        {v} = self.{v}")
+        if p.is_list:
+            lines.append(f"        if {v} is not None:")
+            if p.class_name:
+                lines.append(f"            assert isinstance({v}, (list, LazyList))")
+            else:
+                lines.append(f"            assert isinstance({v}, list)")
+            lines.append(f"            assert all({p.item_check('x')} for x in {v})")
+            if p.class_name:
+                lines.append(f"            {v} = [x.to_dict() for x in {v}]")
+            else:
+                lines.append(f"            {v} = list({v})")
+        elif p.class_name:
+            lines.append(f"        if {v} is not None:")
+            lines.append(f"            assert {p.item_check(v)}")
+            lines.append(f"            {v} = {v}.to_dict()")
+        else:
+            lines.append(f"        assert {v} is None or {p.item_check(v)}")
+    if c.properties:
+        lines.append("        return {")
+        for p in c.properties:
+            lines.append(f'            "{p.key}": {p.name},')
+        lines.append("        }")
+    else:
+        lines.append("        return {}")
+    return lines
+
+
+def generate_class(c: ModelClass, classes: Dict[str, ModelClass]) -> List[str]:
+    lines = [f"class {c.name}:"]
+    # No __dict__ for each instance, which matters when holding a whole directory in memory
+    if c.properties:
+        lines.append("    __slots__ = (")
+        for p in c.properties:
+            lines.append(f'        "{p.name}",')
+        if c.tracks_changes:
+            lines.append('        "_original",')
+        lines.append("    )")
+    else:
+        lines.append("    __slots__ = ()")
+    lines.append("")
+    for p in c.properties:
+        lines.append(f"    {p.name}: {p.type_hint}")
+    if c.properties:
+        lines.append("")
+    params = ", ".join(f"{p.name}: {p.type_hint}" + (" = None" if p.has_default else "") for p in c.properties)
+    lines.append(f"    def __init__(self{', ' if params else ''}{params}) -> None:")
+    for p in c.properties:
+        lines.append(f"        self.{p.name} = {p.name}")
+    if c.tracks_changes:
+        lines.append("        self._original: Optional[dict] = None")
+    if not c.properties:
+        lines.append("        pass")
+    lines.append("")
+    lines.extend(generate_decoder(c, classes))
+    lines.append("")
+    lines.extend(generate_encoder(c))
+    if c.tracks_changes:
+        lines.extend([
+            "",
+            "    def changed_attributes(self) -> Optional[List[str]]:",
+            '        """Returns the JSON names of the attributes changed since this object was returned by the client',
+            "",
+            "        None is returned for the objects not returned by the client, such as the ones built with from_dict.",
+            '        """',
+            "        if self._original is None:",
+            "            return None",
+            "        return changed_attributes(self._original, self.to_dict())",
+        ])
+    return lines
+
+
+def generate_module(schema_name: str) -> str:
+    classes, root = load_classes(schema_name)
+    function_prefix = to_module_function_name(root)
+    parts = [
+        f"# This code is generated by generate_response_classes.py from json-schema/v1/{schema_name}.json",
+        "# Don't edit this file manually.",
+        "#",
+        "# To use this code, make sure you",
+        "#",
+        "#     import json",
+        "#",
+        "# and then, to convert JSON from a string, do",
+        "#",
+        f"#     result = {function_prefix}_from_dict(json.loads(json_string))",
+        "",
+        "from typing import Optional, Any, List, TypeVar, Callable, Type, cast",
+        "",
+    ]
+    if any(c.tracks_changes for c in classes):
+        parts.append("from .changes import changed_attributes")
+    parts.extend([
+        "from .lazy_list import LazyList",
+        "",
+        "",
+        helper_functions,
+    ])
+    for c in classes:
+        parts.append("")
+        parts.extend(generate_class(c, {c.name: c for c in classes}))
+        parts.append("")
+    parts.extend([
+        "",
+        f"def {function_prefix}_from_dict(s: Any) -> {root}:",
+        f"    return {root}.from_dict(s)",
+        "",
+        "",
+        f"def {function_prefix}_to_dict(x: {root}) -> Any:",
+        f"    return to_class({root}, x)",
+        "",
+    ])
+    return "\n".join(parts)
+
+
+def main():
+    for module_name, schema_name in targets:
+        with open(join(output_dir, f"{module_name}.py"), "w") as f:
+            f.write(generate_module(schema_name))
+
+
+if __name__ == "__main__":
+    main()
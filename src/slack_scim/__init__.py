@@ -7,4 +7,20 @@ from .v1.service_provider_configs import ServiceProviderConfigs
 from .v1.user import User
 from .v1.users import Users
 from .v1.request import SCIMRequest
-from .v1.response import SCIMResponse
\ No newline at end of file
+from .v1.response import SCIMResponse
+from .v1.connection_pool import ConnectionPool
+from .v1.rate_limiter import RateLimiter
+from .v1.retry import RetryPolicy
+from .v1.batch import BatchExecutor, BatchResults
+from .v1.async_client import AsyncSCIMClient
+from .v1.async_connection_pool import AsyncConnectionPool
+from .v1.lazy_list import LazyList
+from .v1.streaming import ResourceStream
+from .v1.snapshot import DirectorySnapshot
+from .v1.sync import DirectorySync
+from .v1.membership import MembershipIndex
+from .v1.cache import ResponseCache, CacheStats
+from .v1.single_flight import SingleFlight, AsyncSingleFlight
+from .v1.tuning import ClientTuning
+from .v1.json_codec import JSONCodec
+from .v1.instrumentation import InstrumentationHook, MetricsAggregator, RequestEvent
@@ -0,0 +1,588 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, Optional, Union
+from urllib.parse import quote
+
+from .async_connection_pool import AsyncConnectionPool
+from .client import SCIMClient
+from .compression import (
+    ACCEPT_ENCODING,
+    DEFAULT_MAX_DECODED_SIZE,
+    CompressionCounter,
+    CompressionStats,
+    content_encoding,
+    decode_body,
+)
+from .errors import SCIMApiError
+from .group import Group
+from .groups import Groups, Resource as GroupsResource
+from .json_codec import JSONCodec, default_codec
+from .internal_utils import (
+    _build_http_request,
+    _build_search_query,
+    _debug_log_completion,
+    _debug_log_request,
+    _decode_group,
+    _decode_user,
+    _ensure_group_id,
+    _ensure_user_id,
+    _to_group_dict,
+    _to_patch_dict,
+    _to_user_dict,
+)
+from .membership import MembershipIndex
+from .pagination import PageEvent, async_iterate_resources
+from .request import SCIMRequest
+from .response import SCIMResponse
+from .service_provider_configs import ServiceProviderConfigs
+from .single_flight import AsyncSingleFlight
+from .user import User
+from .users import Users, Resource as UsersResource
+
+
+class AsyncSCIMClient:
+    _logger = logging.getLogger(__name__)
+
+    production_base_url = SCIMClient.production_base_url
+    schema_values = SCIMClient.schema_values
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = production_base_url,
+        connection_pool: Optional[AsyncConnectionPool] = None,
+        max_concurrency: int = 100,
+        membership_index: Optional[MembershipIndex] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        json_codec: Optional[JSONCodec] = None,
+        compress: bool = True,
+        max_decoded_size: Optional[int] = DEFAULT_MAX_DECODED_SIZE,
+    ):
+        """Slack SCIM API Client for asyncio apps
+
+        https://api.slack.com/scim
+
+        This class provides the same methods as SCIMClient as coroutines.
+        An instance keeps persistent connections to the server in its connection pool,
+        which works only within a single event loop.
+
+        :param token: An OAuth token with the admin scope is required to access the SCIM API.
+        :param base_url: the default one is the production URL. If you want to use proxy URL or test server URL,
+            Give the URL to this parameter.
+        :param connection_pool: the pool of keep-alive HTTP connections used for API calls.
+            A new one with the default settings is created if absent.
+        :param max_concurrency: the maximum number of API calls running at the same time.
+            Further calls wait for their turn, so that you can safely start thousands of calls at once.
+        :param membership_index: the index to apply the membership changes made by this client's group operations to
+        :param single_flight: shares a single request among the identical GET requests running at the same time.
+            Its coalesced attribute tells how many requests were saved. Every request is sent if absent.
+        :param json_codec: the JSON implementation used for the request and response bodies.
+            The default one is orjson or ujson if installed, otherwise the standard library's json module.
+        :param compress: asks the server to compress the response bodies with gzip or deflate.
+            They are decompressed on the fly; compression_stats tells the numbers of bytes received and decoded.
+        :param max_decoded_size: the maximum number of bytes a compressed response body can expand to;
+            a larger one raises SCIMError instead of exhausting the memory. None disables the limit.
+        """
+        self.token: str = token
+        self.base_url: str = base_url
+        self.connection_pool: AsyncConnectionPool = connection_pool or AsyncConnectionPool()
+        self.max_concurrency: int = max_concurrency
+        self.membership_index: Optional[MembershipIndex] = membership_index
+        self.single_flight: Optional[AsyncSingleFlight] = single_flight
+        self.json_codec: JSONCodec = json_codec or default_codec()
+        self.compress: bool = compress
+        self._compression = CompressionCounter()
+        self.max_decoded_size: Optional[int] = max_decoded_size
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __repr__(self):
+        d: dict = {"token": "(redacted)", "base_url": self.base_url}
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """The numbers of response body bytes received and decoded so far"""
+        return self._compression.stats
+
+    # ----------------------------------------------
+    # User Management
+    # ----------------------------------------------
+
+    async def create_user(
+        self,
+        user: Union[dict, User]
+    ) -> User:
+        """Creates a new user.
+
+        https://api.slack.com/scim#users
+
+        :param user: if you give a dict value here, be noted that keys must be camel-cased,
+            not your familiar snake-case style.
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        req = SCIMRequest(
+            token=self.token,
+            http_method="POST",
+            url=f"{self.base_url}/Users",
+            json_body=_to_user_dict(user, self.schema_values),
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return _decode_user(resp._parse_json())
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def patch_user(
+        self,
+        id: str,
+        user: Union[dict, User]
+    ) -> User:
+        """Partially updates a user.
+
+        When the given user was returned by this library, only the attributes changed since then are sent.
+        Removed items of multi-valued attributes are sent with "operation": "delete".
+
+        https://api.slack.com/scim#users
+
+        :param id: user ID
+        :param user: if you give a dict value here, be noted that keys must be camel-cased,
+            not your familiar snake-case style.
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        id = _ensure_user_id(id, user)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="PATCH",
+            url=f"{self.base_url}/Users/{quote(id)}",
+            json_body=_to_patch_dict(user, self.schema_values),
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return _decode_user(resp._parse_json()) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def update_user(
+        self,
+        id: str,
+        user: Union[dict, User],
+    ) -> User:
+        """Overwrites the whole user data.
+
+        https://api.slack.com/scim#users
+
+        :param id: user ID
+        :param user: if you give a dict value here, be noted that keys must be camel-cased,
+            not your familiar snake-case style.
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        id = _ensure_user_id(id, user)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="PUT",
+            url=f"{self.base_url}/Users/{quote(id)}",
+            json_body=_to_user_dict(user, self.schema_values),
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return _decode_user(resp._parse_json()) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def delete_user(
+        self,
+        id: str,
+    ) -> User:
+        """Deletes a user.
+
+        https://api.slack.com/scim#users
+
+        :param id: user ID
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        req = SCIMRequest(
+            token=self.token,
+            http_method="DELETE",
+            url=f"{self.base_url}/Users/{quote(id)}",
+        )
+        resp = await self.api_call(req)
+        if not resp.is_success():
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def read_user(
+        self,
+        id: str,
+    ) -> User:
+        """Finds a user by user ID.
+
+        https://api.slack.com/scim#users
+
+        :param id: user ID
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        req = SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.base_url}/Users/{quote(id)}",
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return _decode_user(resp._parse_json()) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def search_users(
+        self,
+        *,
+        filter: str = None,
+        count: int = None,
+        start_index: int = None,
+        lazy: bool = False,
+    ) -> Users:
+        """Searches the users matching the given filter.
+
+        https://api.slack.com/scim#users
+
+        :param filter: https://api.slack.com/scim#filter
+        :param count: the number of results to return in a response
+        :param start_index: the index to fetch as the first item
+        :param lazy: decodes each resource only when it is accessed for the first time;
+            resources becomes a LazyList keeping the parsed JSON in its raw attribute
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        query = _build_search_query(filter, count, start_index)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.base_url}/Users",
+            query_params=query
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return Users.from_dict(resp._parse_json(), lazy=lazy) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    def iter_users(
+        self,
+        *,
+        filter: str = None,
+        page_size: int = None,
+        start_index: int = 1,
+        on_page: Optional[Callable[[PageEvent], None]] = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[UsersResource]:
+        """Iterates over all the users matching the given filter, fetching pages as needed.
+
+        The next page is fetched in background while you process the current one.
+
+        https://api.slack.com/scim#users
+
+        :param filter: https://api.slack.com/scim#filter
+        :param page_size: the number of results to fetch in a request
+        :param start_index: the index to fetch as the first item
+        :param on_page: a function called with a PageEvent for every fetched page
+        :param lazy: decodes the nested objects such as emails only when they are accessed for the first time
+        :return: users
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        return async_iterate_resources(
+            lambda index, count: self.search_users(filter=filter, count=count, start_index=index, lazy=lazy),
+            page_size=page_size,
+            start_index=start_index,
+            on_page=on_page,
+        )
+
+    # ----------------------------------------------
+    # Group Management
+    # ----------------------------------------------
+
+    async def create_group(
+        self,
+        group: Union[dict, Group]
+    ) -> Group:
+        """Creates a new group.
+
+        https://api.slack.com/scim#groups
+
+        :param user: if you give a dict value here, be noted that keys must be camel-cased,
+            not your familiar snake-case style.
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+
+        req = SCIMRequest(
+            token=self.token,
+            http_method="POST",
+            url=f"{self.base_url}/Groups",
+            json_body=_to_group_dict(group, self.schema_values),
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            created = _decode_group(resp._parse_json()) if resp.raw_body else None
+            if self.membership_index is not None and created is not None:
+                self.membership_index.apply_group(created)
+            return created
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def patch_group(
+        self,
+        id: str,
+        group: Union[dict, Group]
+    ) -> Group:
+        """Partially updates a group.
+
+        When the given group was returned by this library, only the attributes changed since then are sent.
+        Removed items of multi-valued attributes are sent with "operation": "delete".
+
+        https://api.slack.com/scim#groups
+
+        :param id: group ID
+        :param user: if you give a dict value here, be noted that keys must be camel-cased,
+            not your familiar snake-case style.
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        id = _ensure_group_id(id, group)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="PATCH",
+            url=f"{self.base_url}/Groups/{quote(id)}",
+            json_body=_to_patch_dict(group, self.schema_values),
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            if self.membership_index is not None:
+                self.membership_index.apply_group_patch(id, req.json_body)
+            return _decode_group(resp._parse_json()) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def update_group(
+        self,
+        id: str,
+        group: Union[dict, Group],
+    ) -> Group:
+        """Overwrites the whole group.
+
+        https://api.slack.com/scim#groups
+
+        :param id: group ID
+        :param user: if you give a dict value here, be noted that keys must be camel-cased,
+            not your familiar snake-case style.
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        id = _ensure_group_id(id, group)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="PUT",
+            url=f"{self.base_url}/Groups/{quote(id)}",
+            json_body=_to_group_dict(group, self.schema_values),
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            if self.membership_index is not None:
+                self.membership_index.apply_group(req.json_body, id=id)
+            return _decode_group(resp._parse_json()) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def delete_group(
+        self,
+        id: str,
+    ) -> Group:
+        """Deletes a group.
+
+        https://api.slack.com/scim#groups
+
+        :param id: group ID
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        req = SCIMRequest(
+            token=self.token,
+            http_method="DELETE",
+            url=f"{self.base_url}/Groups/{quote(id)}",
+        )
+        resp = await self.api_call(req)
+        if not resp.is_success():
+            raise SCIMApiError.from_response(resp, self.json_codec)
+        if self.membership_index is not None:
+            self.membership_index.remove_group(id)
+
+    async def read_group(
+        self,
+        id: str,
+    ) -> Group:
+        """Finds a group by group ID.
+
+        https://api.slack.com/scim#groups
+
+        :param id: group ID
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        req = SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.base_url}/Groups/{quote(id)}",
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return _decode_group(resp._parse_json()) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    async def search_groups(
+        self,
+        *,
+        filter: str = None,
+        count: int = None,
+        start_index: int = None,
+        lazy: bool = False,
+    ) -> Groups:
+        """Searches the groups matching the given filter.
+
+        https://api.slack.com/scim#users
+
+        :param filter: https://api.slack.com/scim#filter
+        :param count: the number of results to return in a response
+        :param start_index: the index to fetch as the first item
+        :param lazy: decodes each resource only when it is accessed for the first time;
+            resources becomes a LazyList keeping the parsed JSON in its raw attribute
+        :return: API response
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        query = _build_search_query(filter, count, start_index)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.base_url}/Groups",
+            query_params=query
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return Groups.from_dict(resp._parse_json(), lazy=lazy) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    def iter_groups(
+        self,
+        *,
+        filter: str = None,
+        page_size: int = None,
+        start_index: int = 1,
+        on_page: Optional[Callable[[PageEvent], None]] = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[GroupsResource]:
+        """Iterates over all the groups matching the given filter, fetching pages as needed.
+
+        The next page is fetched in background while you process the current one.
+
+        https://api.slack.com/scim#groups
+
+        :param filter: https://api.slack.com/scim#filter
+        :param page_size: the number of results to fetch in a request
+        :param start_index: the index to fetch as the first item
+        :param on_page: a function called with a PageEvent for every fetched page
+        :param lazy: decodes the nested objects such as members only when they are accessed for the first time
+        :return: groups
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        return async_iterate_resources(
+            lambda index, count: self.search_groups(filter=filter, count=count, start_index=index, lazy=lazy),
+            page_size=page_size,
+            start_index=start_index,
+            on_page=on_page,
+        )
+
+    # ----------------------------------------------
+    # ServiceProviderConfigs
+    # ----------------------------------------------
+
+    async def get_service_provider_configs(self) -> ServiceProviderConfigs:
+        """Fetches ServiceProviderConfigs
+
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        :return: API response
+        """
+        req = SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.base_url}/ServiceProviderConfigs",
+        )
+        resp = await self.api_call(req)
+        if resp.is_success():
+            return ServiceProviderConfigs.from_dict(resp._parse_json()) if resp.raw_body else None
+        else:
+            raise SCIMApiError.from_response(resp, self.json_codec)
+
+    # ----------------------------------------------
+    # HTTP Client
+    # ----------------------------------------------
+
+    async def api_call(self, api_request: SCIMRequest) -> SCIMResponse:
+        """A general method to call the Slack SCIM APIs
+
+        :param api_request: API request information
+        :return: API response
+        :raise Exception: only when unexpected errors occur,
+            never raises exceptions when getting an error code
+            with unsuccessful HTTP status from Slack
+        """
+        http_method, url, headers, req_body = _build_http_request(api_request, self.json_codec)
+        if self.compress:
+            headers["Accept-Encoding"] = ACCEPT_ENCODING
+        if self.single_flight is None:
+            return await self._send(http_method, url, headers, req_body)
+        if http_method != "GET":
+            try:
+                return await self._send(http_method, url, headers, req_body)
+            finally:
+                self.single_flight.forget_all()
+        # The identical requests sent at the same time share a single response
+        key = (url, headers.get("Authorization"))
+        return await self.single_flight.do(key, lambda: self._send(http_method, url, headers, req_body))
+
+    async def _send(self, http_method: str, url: str, headers: dict, req_body: Optional[bytes]) -> SCIMResponse:
+        _debug_log_request(self._logger, http_method, url, headers, req_body)
+
+        if self._semaphore is None:
+            # Created lazily to bind it to the running event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            async with self._semaphore:
+                http_response = await self.connection_pool.request(
+                    method=http_method,
+                    url=url,
+                    body=req_body,
+                    headers=headers,
+                )
+            charset: str = http_response.headers.get_content_charset() or "utf-8"
+            received: bytes = await http_response.read()
+            encoding = content_encoding(http_response.headers)
+            raw_body: bytes = decode_body(received, encoding, self.max_decoded_size)
+            self._compression.add(encoding, len(received), len(raw_body))
+
+            api_response = SCIMResponse(
+                status=http_response.status,
+                reason=http_response.reason,
+                headers=http_response.headers,
+                raw_body=raw_body,
+                charset=charset,
+                json_codec=self.json_codec,
+            )
+            _debug_log_completion(self._logger, http_method, url, api_response)
+            return api_response
+
+        except Exception as e:
+            self._logger.error(f"Failed to send a request to Slack SCIM API server: {e}")
+            raise e
@@ -0,0 +1,304 @@
+import asyncio
+import io
+import logging
+import os
+import re
+import ssl
+import time
+from http.client import HTTPMessage, parse_headers
+from typing import Dict, List, Optional, Tuple
+
+from .connection_pool import ConnectionPool, ConnectionPoolStats
+from .errors import SCIMError
+
+_NO_BODY_STATUSES = (204, 304)
+
+
+class _AsyncConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+# The same checks as http.client.HTTPConnection makes, so that nothing can inject headers or requests
+_is_legal_header_name = re.compile(r"[^:\s][^:\r\n]*").fullmatch
+_is_illegal_header_value = re.compile(r"\n(?![ \t])|\r(?![ \t\n])").search
+_contains_disallowed_pchar = re.compile(r"[\x00-\x20\x7f]").search
+
+
+class _StaleConnectionError(ConnectionError):
+    pass
+
+
+class AsyncPooledResponse:
+    def __init__(
+        self,
+        *,
+        status: int,
+        reason: str,
+        headers: HTTPMessage,
+        body: bytes,
+    ):
+        """An HTTP response received through an AsyncConnectionPool
+
+        The body is fully read before this object is returned, so the connection has already gone back to the pool.
+        """
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class AsyncConnectionPool:
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 100,
+        idle_timeout: float = 60.0,
+        timeout: Optional[float] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        """A pool of persistent HTTP/1.1 connections built on asyncio streams
+
+        This is the non-blocking counterpart of ConnectionPool. An instance must be used within a single event loop.
+
+        :param max_connections_per_host: the maximum number of idle connections kept for each host
+        :param idle_timeout: the number of seconds an idle connection can be kept in the pool
+        :param timeout: the timeout in seconds for connecting and for each read from the server
+        :param ssl_context: the SSL context shared by all the HTTPS connections;
+            the default one is created only once for the pool
+        """
+        if max_connections_per_host < 1:
+            raise SCIMError("max_connections_per_host must be a positive number")
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        # (scheme, host, port) -> [(connection, released_at), ...]
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[_AsyncConnection, float]]] = {}
+        self._pid = os.getpid()
+        self._stats = ConnectionPoolStats()
+
+    def __repr__(self):
+        d: dict = {
+            "max_connections_per_host": self.max_connections_per_host,
+            "idle_timeout": self.idle_timeout,
+            "timeout": self.timeout,
+        }
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    @property
+    def stats(self) -> ConnectionPoolStats:
+        """Returns a snapshot of the counters"""
+        return ConnectionPoolStats(**self._stats.to_dict())
+
+    async def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncPooledResponse:
+        """Sends an HTTP request over a pooled connection and reads the whole response
+
+        :param method: HTTP method
+        :param url: absolute URL
+        :param body: request body
+        :param headers: request headers
+        :return: the response
+        """
+        if os.getpid() != self._pid:
+            # The sockets are shared with the parent process; never write to them from the child
+            self._idle = {}
+            self._pid = os.getpid()
+        key, path = ConnectionPool._parse_url(url)
+        request_bytes = self._build_request(method, key, path, body, headers or {})
+        self._stats.requests += 1
+        connection, reused = await self._get(key)
+        try:
+            return await self._send(key, connection, method, request_bytes)
+        except _StaleConnectionError:
+            connection.close()
+            self._stats.connections_discarded += 1
+            if not reused:
+                raise ConnectionResetError("The server closed the connection without sending a response")
+            # The server has closed the idle connection; the request never reached the app
+            connection, _ = await self._get(key, fresh=True)
+        except BaseException:
+            connection.close()
+            self._stats.connections_discarded += 1
+            raise
+        try:
+            return await self._send(key, connection, method, request_bytes)
+        except BaseException:
+            connection.close()
+            self._stats.connections_discarded += 1
+            raise
+
+    def clear(self):
+        """Closes all the idle connections"""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def close(self):
+        self.clear()
+
+    # ----------------------------------------------
+
+    @staticmethod
+    def _build_request(
+        method: str,
+        key: Tuple[str, str, int],
+        path: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> bytes:
+        scheme, host, port = key
+        default_port = 443 if scheme == "https" else 80
+        if _contains_disallowed_pchar(method) or _contains_disallowed_pchar(path):
+            raise ValueError(f"Invalid HTTP request line: {method!r} {path!r}")
+        for k, v in headers.items():
+            if not _is_legal_header_name(k):
+                raise ValueError(f"Invalid header name {k!r}")
+            if _is_illegal_header_value(str(v)):
+                raise ValueError(f"Invalid header value {v!r}")
+        lines = [f"{method} {path} HTTP/1.1"]
+        names = {k.lower() for k in headers.keys()}
+        if "host" not in names:
+            lines.append(f"Host: {host}" if port == default_port else f"Host: {host}:{port}")
+        if "accept-encoding" not in names:
+            lines.append("Accept-Encoding: identity")
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body or b'')}")
+        for k, v in headers.items():
+            lines.append(f"{k}: {v}")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head + body if body else head
+
+    async def _get(self, key: Tuple[str, str, int], fresh: bool = False) -> Tuple[_AsyncConnection, bool]:
+        connections = self._idle.get(key)
+        now = time.monotonic()
+        while not fresh and connections:
+            connection, released_at = connections.pop()
+            if now - released_at > self.idle_timeout or connection.reader.at_eof():
+                connection.close()
+                self._stats.connections_discarded += 1
+                continue
+            self._stats.connections_reused += 1
+            return connection, True
+        self._stats.connections_created += 1
+        scheme, host, port = key
+        reader, writer = await self._with_timeout(asyncio.open_connection(
+            host,
+            port,
+            ssl=self.ssl_context if scheme == "https" else None,
+        ))
+        return _AsyncConnection(reader, writer), False
+
+    def _put(self, key: Tuple[str, str, int], connection: _AsyncConnection):
+        if os.getpid() == self._pid:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.max_connections_per_host:
+                connections.append((connection, time.monotonic()))
+                return
+        connection.close()
+        self._stats.connections_discarded += 1
+
+    async def _with_timeout(self, aw):
+        if self.timeout is None:
+            return await aw
+        return await asyncio.wait_for(aw, self.timeout)
+
+    async def _send(
+        self,
+        key: Tuple[str, str, int],
+        connection: _AsyncConnection,
+        method: str,
+        request_bytes: bytes,
+    ) -> AsyncPooledResponse:
+        reader = connection.reader
+        try:
+            connection.writer.write(request_bytes)
+            await self._with_timeout(connection.writer.drain())
+            status_line = await self._with_timeout(reader.readline())
+        except (ConnectionResetError, BrokenPipeError, ConnectionAbortedError):
+            raise _StaleConnectionError()
+        if not status_line:
+            raise _StaleConnectionError()
+
+        while True:
+            version, status, reason = self._parse_status_line(status_line)
+            headers = await self._read_headers(reader)
+            if status != 100:
+                break
+            status_line = await self._with_timeout(reader.readline())
+
+        will_close = self._will_close(version, headers)
+        if method == "HEAD" or status in _NO_BODY_STATUSES or 100 <= status < 200:
+            body = b""
+        elif "chunked" in (headers.get("transfer-encoding") or "").lower():
+            body = await self._read_chunked(reader)
+        elif headers.get("content-length") is not None:
+            body = await self._with_timeout(reader.readexactly(int(headers.get("content-length"))))
+        else:
+            body = await self._with_timeout(reader.read())
+            will_close = True
+
+        if will_close:
+            connection.close()
+            self._stats.connections_discarded += 1
+        else:
+            self._put(key, connection)
+        return AsyncPooledResponse(status=status, reason=reason, headers=headers, body=body)
+
+    @staticmethod
+    def _parse_status_line(line: bytes) -> Tuple[str, int, str]:
+        parts = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise SCIMError(f"Invalid HTTP status line: {line!r}")
+        reason = parts[2] if len(parts) == 3 else ""
+        return parts[0], int(parts[1]), reason
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> HTTPMessage:
+        lines = []
+        while True:
+            line = await self._with_timeout(reader.readline())
+            if line in (b"\r\n", b"\n", b""):
+                break
+            lines.append(line)
+        return parse_headers(io.BytesIO(b"".join(lines) + b"\r\n"))
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await self._with_timeout(reader.readline())
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # skip the trailers
+                await self._read_headers(reader)
+                return b"".join(chunks)
+            chunks.append(await self._with_timeout(reader.readexactly(size)))
+            await self._with_timeout(reader.readexactly(2))
+
+    @staticmethod
+    def _will_close(version: str, headers: HTTPMessage) -> bool:
+        connection = (headers.get("connection") or "").lower()
+        if "close" in connection:
+            return True
+        if version == "HTTP/1.0":
+            return "keep-alive" not in connection
+        return False
@@ -0,0 +1,272 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from .group import Group
+from .user import User
+
+
+class BatchItemResult:
+    def __init__(
+        self,
+        *,
+        index: int,
+        item: Any,
+        value: Any = None,
+        error: Optional[Exception] = None,
+    ):
+        """The outcome of an operation in a batch
+
+        :param index: the position of the item in the given iterable
+        :param item: the given item
+        :param value: the value returned by the operation, such as the created User
+        :param error: the exception raised by the operation, usually a SCIMApiError
+        """
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["index"] = self.index
+        result["item"] = self.item
+        result["value"] = self.value
+        result["error"] = self.error
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class BatchProgress:
+    def __init__(
+        self,
+        *,
+        completed: int,
+        succeeded: int,
+        failed: int,
+        elapsed: float,
+    ):
+        """The progress of a batch, also used as the summary of a completed batch
+
+        :param completed: the number of finished operations
+        :param succeeded: the number of successful operations
+        :param failed: the number of failed operations
+        :param elapsed: the number of seconds since the batch started
+        """
+        self.completed = completed
+        self.succeeded = succeeded
+        self.failed = failed
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self) -> float:
+        """Completed operations per second"""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["completed"] = self.completed
+        result["succeeded"] = self.succeeded
+        result["failed"] = self.failed
+        result["elapsed"] = self.elapsed
+        result["throughput"] = self.throughput
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class BatchResults(Sequence[BatchItemResult]):
+    def __init__(self, results: List[BatchItemResult], summary: BatchProgress):
+        """The outcomes of all the operations in a batch, in the same order as the given items
+
+        :param results: the outcome for each item
+        :param summary: the counts and the throughput of the batch
+        """
+        self.results = results
+        self.summary = summary
+
+    def __getitem__(self, i):
+        return self.results[i]
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> List[BatchItemResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[BatchItemResult]:
+        return [r for r in self.results if not r.ok]
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.summary.to_dict()}>"
+
+
+class BatchExecutor:
+    def __init__(
+        self,
+        client: "SCIMClient",  # noqa: F821
+        *,
+        concurrency: int = 4,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """Runs many write operations on a bounded pool of threads
+
+        An operation failure doesn't stop the batch; it is returned as the error of its item.
+        All the calls go through the client, so its rate limiter and retry policy apply to them.
+
+        :param client: the client to run the operations with
+        :param concurrency: the default number of operations running at the same time
+        :param on_progress: a function called with a BatchProgress every time an operation finishes.
+            It is called from the thread running the batch; an exception raised by it stops the batch
+            and is raised by run() once the operations in flight have finished.
+        :param chunk_size: the number of items taken ahead of their execution;
+            the batch_chunk_size of the client's tuning is used if absent
+        """
+        self.client = client
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+
+    # ----------------------------------------------
+    # User Management
+    # ----------------------------------------------
+
+    def create_users(self, users: Iterable[Union[dict, User]], *, concurrency: int = None) -> BatchResults:
+        """Creates the given users. The value of each result is the created User."""
+        return self.run(self.client.create_user, users, concurrency=concurrency)
+
+    def patch_users(
+        self,
+        users: Iterable[Tuple[str, Union[dict, User]]],
+        *,
+        concurrency: int = None,
+    ) -> BatchResults:
+        """Partially updates users. Each item is a pair of a user ID and the changes."""
+        return self.run(lambda item: self.client.patch_user(*item), users, concurrency=concurrency)
+
+    def update_users(
+        self,
+        users: Iterable[Tuple[str, Union[dict, User]]],
+        *,
+        concurrency: int = None,
+    ) -> BatchResults:
+        """Overwrites users. Each item is a pair of a user ID and the whole user data."""
+        return self.run(lambda item: self.client.update_user(*item), users, concurrency=concurrency)
+
+    def delete_users(self, ids: Iterable[str], *, concurrency: int = None) -> BatchResults:
+        """Deletes the users with the given IDs."""
+        return self.run(self.client.delete_user, ids, concurrency=concurrency)
+
+    # ----------------------------------------------
+    # Group Management
+    # ----------------------------------------------
+
+    def create_groups(self, groups: Iterable[Union[dict, Group]], *, concurrency: int = None) -> BatchResults:
+        """Creates the given groups. The value of each result is the created Group."""
+        return self.run(self.client.create_group, groups, concurrency=concurrency)
+
+    def patch_groups(
+        self,
+        groups: Iterable[Tuple[str, Union[dict, Group]]],
+        *,
+        concurrency: int = None,
+    ) -> BatchResults:
+        """Partially updates groups. Each item is a pair of a group ID and the changes."""
+        return self.run(lambda item: self.client.patch_group(*item), groups, concurrency=concurrency)
+
+    def update_groups(
+        self,
+        groups: Iterable[Tuple[str, Union[dict, Group]]],
+        *,
+        concurrency: int = None,
+    ) -> BatchResults:
+        """Overwrites groups. Each item is a pair of a group ID and the whole group data."""
+        return self.run(lambda item: self.client.update_group(*item), groups, concurrency=concurrency)
+
+    def delete_groups(self, ids: Iterable[str], *, concurrency: int = None) -> BatchResults:
+        """Deletes the groups with the given IDs."""
+        return self.run(self.client.delete_group, ids, concurrency=concurrency)
+
+    # ----------------------------------------------
+
+    def run(
+        self,
+        operation: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        concurrency: int = None,
+    ) -> BatchResults:
+        """Runs an operation for each item
+
+        The items are consumed lazily, so that a generator producing a large number of items works.
+        The number of items taken ahead of their execution is chunk_size, or the batch_chunk_size of the client's tuning.
+
+        :param operation: a function receiving an item
+        :param items: the items to process
+        :param concurrency: the number of operations running at the same time
+        :return: the outcomes in the same order as the items
+        """
+        concurrency = concurrency or self.concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive number")
+        started = time.monotonic()
+        results: List[BatchItemResult] = []
+        lock = threading.Lock()
+        counts = {"succeeded": 0, "failed": 0}
+
+        def progress() -> BatchProgress:
+            return BatchProgress(
+                completed=counts["succeeded"] + counts["failed"],
+                succeeded=counts["succeeded"],
+                failed=counts["failed"],
+                elapsed=time.monotonic() - started,
+            )
+
+        def execute(result: BatchItemResult) -> BatchProgress:
+            try:
+                result.value = operation(result.item)
+            except Exception as e:
+                result.error = e
+            with lock:
+                counts["succeeded" if result.error is None else "failed"] += 1
+                return progress()
+
+        def report(done: Set[Future]):
+            # future.result() raises what execute() didn't catch, and on_progress runs outside the workers,
+            # so that neither of their exceptions is lost
+            for current in sorted((f.result() for f in done), key=lambda p: p.completed):
+                if self.on_progress:
+                    self.on_progress(current)
+
+        # The tuning is resolved, which may fetch ServiceProviderConfigs, only when chunk_size is not given
+        chunk_size = max(self.chunk_size or self.client.tuning.batch_chunk_size or concurrency * 2, concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="slack_scim-batch") as executor:
+            in_flight: Set[Future] = set()
+            for index, item in enumerate(items):
+                if len(in_flight) >= chunk_size:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    report(done)
+                result = BatchItemResult(index=index, item=item)
+                results.append(result)
+                in_flight.add(executor.submit(execute, result))
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                report(done)
+        return BatchResults(results, progress())
@@ -0,0 +1,199 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .response import SCIMResponse
+
+# The URLs of a single user or group, such as https://api.slack.com/scim/v1/Users/W123
+_RESOURCE_PATH = re.compile(r"/(Users|Groups)/[^/]+$")
+
+
+class CacheStats:
+    def __init__(
+        self,
+        *,
+        hits: int,
+        misses: int,
+        evictions: int,
+        invalidations: int,
+        size: int,
+    ):
+        """The statistics of a ResponseCache
+
+        :param hits: the number of reads served from the cache, including cached 404s
+        :param misses: the number of reads sent to the server
+        :param evictions: the number of entries dropped to stay within the capacity
+        :param invalidations: the number of entries dropped by write operations
+        :param size: the number of entries currently cached
+        """
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.invalidations = invalidations
+        self.size = size
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["hits"] = self.hits
+        result["misses"] = self.misses
+        result["evictions"] = self.evictions
+        result["invalidations"] = self.invalidations
+        result["size"] = self.size
+        result["hit_rate"] = self.hit_rate
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        *,
+        max_size: int = 10000,
+        ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """A thread-safe TTL + LRU cache of read_user and read_group responses
+
+        Only GET requests to a single user or group are cached. Successful responses are kept for ttl seconds,
+        and 404 Not Found ones for negative_ttl seconds. Any other write to a user or group drops its entry,
+        whatever the result is. As the groups attribute of users reflects the group memberships,
+        writes to groups also drop all the cached users.
+        A response to a read started before a write finished is never cached, so reads never see data older
+        than the latest write made through the client.
+
+        The entries are keyed by URL and Authorization header, so a cache shared by clients with different tokens
+        never returns a response to a token that did not receive it. Writes drop the entries of all the tokens.
+
+        :param max_size: the maximum number of entries; the least recently used ones are evicted first
+        :param ttl: the number of seconds to keep a successful response
+        :param negative_ttl: the number of seconds to keep a 404 response; 0 disables negative caching
+        :param clock: the function returning the current time in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[float, SCIMResponse]]" = OrderedDict()
+        # The number of entries of each Authorization header, to drop the entries of every token on writes
+        self._authorizations: Dict[Optional[str], int] = {}
+        # Incremented by every invalidation, to detect the writes made during a read
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.stats.to_dict()}>"
+
+    @staticmethod
+    def is_cacheable(url: str) -> bool:
+        """Returns True if the URL is the one of a single user or group"""
+        parts = urlsplit(url)
+        return not parts.query and _RESOURCE_PATH.search(parts.path) is not None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+    def get(self, url: str, authorization: Optional[str] = None) -> Optional[SCIMResponse]:
+        """Returns the cached response if it has not expired yet
+
+        :param url: the request URL
+        :param authorization: the Authorization header of the request
+        """
+        key = (url, authorization)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return response
+                self._remove(key)
+            self._misses += 1
+            return None
+
+    def put(self, url: str, response: SCIMResponse, generation: int, authorization: Optional[str] = None):
+        """Caches a response if it is a 200 or 404 one
+
+        :param url: the request URL
+        :param response: the response
+        :param generation: the generation when the request was sent; the response is ignored if it has changed
+        :param authorization: the Authorization header of the request
+        """
+        if response.status == 200:
+            ttl = self.ttl
+        elif response.status == 404:
+            ttl = self.negative_ttl
+        else:
+            return
+        if ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            key = (url, authorization)
+            if key not in self._entries:
+                self._authorizations[authorization] = self._authorizations.get(authorization, 0) + 1
+            self._entries[key] = (self.clock() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, url: str):
+        """Drops the entries a write to the URL can make stale"""
+        path = urlsplit(url).path
+        with self._lock:
+            self._generation += 1
+            keys = [(url, authorization) for authorization in self._authorizations]
+            if "/Groups" in path:
+                keys += [key for key in self._entries.keys() if "/Users/" in key[0]]
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+                    self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._authorizations.clear()
+
+    def _remove(self, key: Tuple[str, Optional[str]]):
+        # Drops an entry and forgets its Authorization header with its last entry; call with the lock held
+        del self._entries[key]
+        authorization = key[1]
+        count = self._authorizations[authorization] - 1
+        if count > 0:
+            self._authorizations[authorization] = count
+        else:
+            del self._authorizations[authorization]
@@ -0,0 +1,85 @@
+from typing import Any, List, Optional, Tuple
+
+# The attributes never sent in a PATCH request
+_READ_ONLY_ATTRIBUTES = {"id", "meta", "schemas", "Errors"}
+
+
+def _normalize(value: Any) -> Any:
+    # Drops the absent values so that an attribute set to None equals a missing one
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value if v is not None]
+    if hasattr(value, "to_dict"):
+        return _normalize(value.to_dict())
+    return value
+
+
+def _changed_keys(original: dict, current: dict) -> List[str]:
+    keys = list(current.keys()) + [k for k in original.keys() if k not in current]
+    return [k for k in keys if k not in _READ_ONLY_ATTRIBUTES and original.get(k) != current.get(k)]
+
+
+def changed_attributes(original: dict, current: dict) -> List[str]:
+    """Returns the JSON names of the top-level attributes that differ between two representations of a resource
+
+    :param original: the resource as it was decoded
+    :param current: the current resource as a dict
+    :return: the attribute names such as ["title", "emails"]
+    """
+    return _changed_keys(_normalize(original), _normalize(current))
+
+
+def _diff_multi_valued(old: list, new: list) -> Optional[list]:
+    # Returns the items to send, or None if the attribute has to be replaced as a whole
+    if not all(isinstance(item, dict) and item.get("value") for item in old + new):
+        return None
+    new_values = {item["value"] for item in new}
+    deleted = [{"value": item["value"], "operation": "delete"} for item in old if item["value"] not in new_values]
+    changed = [item for item in new if item not in old]
+    return deleted + changed
+
+
+def build_patch(original: dict, current: dict) -> Tuple[dict, List[str]]:
+    """Builds the smallest SCIM 1.1 PATCH body turning the original resource into the current one
+
+    - Changed simple attributes are sent with their new values
+    - Only the changed sub-attributes of complex attributes such as name are sent
+    - Multi-valued attributes such as emails and members send the added and modified items,
+      plus {"value": ..., "operation": "delete"} for the removed ones.
+      Those whose items don't have a value, such as addresses, are replaced as a whole.
+    - Removed attributes are listed in meta.attributes
+
+    :param original: the resource as it was decoded
+    :param current: the current resource as a dict
+    :return: the PATCH body (without schemas) and the names of the changed attributes
+    """
+    old_resource, new_resource = _normalize(original), _normalize(current)
+    changed = _changed_keys(old_resource, new_resource)
+    patch: dict = {}
+    removed: List[str] = []
+    for key in changed:
+        old, new = old_resource.get(key), new_resource.get(key)
+        if new is None:
+            removed.append(key)
+        elif isinstance(old, list) and isinstance(new, list):
+            items = _diff_multi_valued(old, new)
+            if items is None:
+                removed.append(key)
+                patch[key] = new
+            else:
+                patch[key] = items
+        elif isinstance(old, dict) and isinstance(new, dict):
+            sub_attributes = {}
+            for sub_key in _changed_keys(old, new):
+                if sub_key in new:
+                    sub_attributes[sub_key] = new[sub_key]
+                else:
+                    removed.append(f"{key}.{sub_key}")
+            if sub_attributes:
+                patch[key] = sub_attributes
+        else:
+            patch[key] = new
+    if removed:
+        patch["meta"] = {"attributes": removed}
+    return patch, changed
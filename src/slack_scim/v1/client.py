@@ -1,23 +1,50 @@
-import copy
-import json
 import logging
-import platform
-import sys
-from http.client import HTTPResponse
-from typing import Union
-from urllib.error import HTTPError
-from urllib.parse import urlencode, quote
-from urllib.request import Request, urlopen
-
-from . import version
-from .errors import SCIMApiError, SCIMError
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Optional, Union
+from urllib.parse import quote
+
+from .batch import BatchExecutor, BatchProgress
+from .cache import ResponseCache
+from .compression import (
+    ACCEPT_ENCODING,
+    DEFAULT_MAX_DECODED_SIZE,
+    CompressionCounter,
+    CompressionStats,
+    DecodingReader,
+    content_encoding,
+)
+from .connection_pool import ConnectionPool
+from .errors import SCIMApiError
 from .group import Group
-from .groups import Groups
+from .groups import Groups, Resource as GroupsResource
+from .json_codec import JSONCodec, default_codec
+from .internal_utils import (
+    _build_http_request,
+    _build_search_query,
+    _debug_log_completion,
+    _debug_log_request,
+    _decode_group,
+    _decode_user,
+    _ensure_group_id,
+    _ensure_user_id,
+    _to_group_dict,
+    _to_patch_dict,
+    _to_user_dict,
+)
+from .instrumentation import InstrumentationHook, RequestEvent, _emit, endpoint_template
+from .membership import MembershipIndex
+from .pagination import PageEvent, iterate_resources, scan_resources
+from .rate_limiter import RateLimiter, endpoint_family
 from .request import SCIMRequest
+from .retry import RetryPolicy
 from .response import SCIMResponse
 from .service_provider_configs import ServiceProviderConfigs
+from .single_flight import SingleFlight
+from .streaming import ResourceStream, _to_resource_stream
+from .tuning import ClientTuning
 from .user import User
-from .users import Users
+from .users import Users, Resource as UsersResource
 
 
 class SCIMClient:
@@ -28,32 +55,124 @@ class SCIMClient:
         "urn:scim:schemas:core:1.0",
         "urn:scim:schemas:extension:enterprise:1.0"
     ]
+    # The seconds to use the default tuning for after failing to fetch ServiceProviderConfigs
+    tuning_retry_interval = 60.0
 
     def __init__(
         self,
         token: str,
-        base_url: str = production_base_url
+        base_url: str = production_base_url,
+        connection_pool: Optional[ConnectionPool] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        membership_index: Optional[MembershipIndex] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        tuning: Optional[ClientTuning] = None,
+        json_codec: Optional[JSONCodec] = None,
+        compress: bool = True,
+        hooks: Optional[List[InstrumentationHook]] = None,
+        max_decoded_size: Optional[int] = DEFAULT_MAX_DECODED_SIZE,
     ):
         """Slack SCIM API Client
 
         https://api.slack.com/scim
 
-        As this class doesn't have any other state apart from the token and base_Url, if your app is fine with
-        reusing the same settings for requests, you can use an instance as singleton in your app.s
+        An instance keeps persistent connections to the server in its connection pool.
+        If your app is fine with reusing the same settings for requests,
+        you can use an instance as singleton in your app.
 
         :param token: An OAuth token with the admin scope is required to access the SCIM API.
             The simplest way to acquire this token is for an admin on a Workspace to create a new Slack app,
             add the admin OAuth scope, install the app, and use the generated token.
         :param base_url: the default one is the production URL. If you want to use proxy URL or test server URL,
             Give the URL to this parameter.
+        :param connection_pool: the pool of keep-alive HTTP connections used for API calls.
+            A new one with the default settings is created if absent.
+        :param rate_limiter: the scheduler pacing API calls per endpoint family.
+            The default one waits for Retry-After seconds and sends the request again on 429 responses.
+        :param retry_policy: the policy to retry requests failed with network errors or 5xx statuses.
+            The default one retries GET, PUT and DELETE requests up to 3 times.
+        :param membership_index: the index to apply the membership changes made by this client's group operations to
+        :param response_cache: the cache of read_user and read_group responses, invalidated by the write operations.
+            Nothing is cached if absent.
+        :param single_flight: shares a single request among the identical GET requests sent at the same time
+            from multiple threads. Its coalesced attribute tells how many requests were saved.
+            Every request is sent if absent.
+        :param tuning: the default page size and batch chunk size.
+            If absent, they are derived from the ServiceProviderConfigs fetched when they are needed for the first time.
+        :param json_codec: the JSON implementation used for the request and response bodies.
+            The default one is orjson or ujson if installed, otherwise the standard library's json module.
+        :param compress: asks the server to compress the response bodies with gzip or deflate.
+            They are decompressed on the fly; compression_stats tells the numbers of bytes received and decoded.
+        :param hooks: the InstrumentationHooks receiving a RequestEvent when every API call starts and ends,
+            such as a MetricsAggregator
+        :param max_decoded_size: the maximum number of bytes a compressed response body can expand to;
+            a larger one raises SCIMError instead of exhausting the memory. None disables the limit.
         """
         self.token: str = token
         self.base_url: str = base_url
+        self.connection_pool: ConnectionPool = connection_pool or ConnectionPool()
+        self.rate_limiter: RateLimiter = rate_limiter or RateLimiter()
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.membership_index: Optional[MembershipIndex] = membership_index
+        self.response_cache: Optional[ResponseCache] = response_cache
+        self.single_flight: Optional[SingleFlight] = single_flight
+        self._tuning: Optional[ClientTuning] = tuning
+        self._tuning_lock = threading.Lock()
+        self._tuning_retry_at = 0.0
+        self.json_codec: JSONCodec = json_codec or default_codec()
+        self.compress: bool = compress
+        self._compression = CompressionCounter()
+        self.hooks: List[InstrumentationHook] = list(hooks or [])
+        self.max_decoded_size: Optional[int] = max_decoded_size
 
     def __repr__(self):
         d: dict = {"token": "(redacted)", "base_url": self.base_url}
         return f"<slack_scim.{self.__class__.__name__}: {d}>"
 
+    @property
+    def tuning(self) -> ClientTuning:
+        """The default page size and batch chunk size, tuned with the ServiceProviderConfigs fetched only once
+
+        While ServiceProviderConfigs cannot be fetched, the defaults are used,
+        and the fetch is tried again after tuning_retry_interval seconds.
+        """
+        if self._tuning is None:
+            with self._tuning_lock:
+                if self._tuning is None:
+                    if time.monotonic() < self._tuning_retry_at:
+                        return ClientTuning()
+                    tuning = self._fetch_tuning()
+                    if tuning is None:
+                        self._tuning_retry_at = time.monotonic() + self.tuning_retry_interval
+                        return ClientTuning()
+                    self._tuning = tuning
+        return self._tuning
+
+    @tuning.setter
+    def tuning(self, tuning: ClientTuning):
+        self._tuning = tuning
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """The numbers of response body bytes received and decoded so far"""
+        return self._compression.stats
+
+    def _page_size_for(self, page_size: Optional[int]) -> Optional[int]:
+        # An explicit page size is used without fetching ServiceProviderConfigs for the tuning;
+        # the pagination follows the number of resources the server actually returns anyway
+        if page_size and self._tuning is None:
+            return page_size
+        return self.tuning.page_size_for(page_size)
+
+    def _fetch_tuning(self) -> Optional[ClientTuning]:
+        try:
+            return ClientTuning.from_service_provider_configs(self.get_service_provider_configs())
+        except Exception as e:
+            self._logger.warning(f"Failed to fetch ServiceProviderConfigs; using the default page sizes for now: {e}")
+            return None
+
     # ----------------------------------------------
     # User Management
     # ----------------------------------------------
@@ -75,13 +194,9 @@ class SCIMClient:
             token=self.token,
             http_method="POST",
             url=f"{self.base_url}/Users",
-            json_body=self._to_user_dict(user),
+            json_body=_to_user_dict(user, self.schema_values),
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return User.from_dict(json.loads(resp.body))
-        else:
-            raise SCIMApiError.from_response(resp)
+        return self._request(req, _decode_user)
 
     def patch_user(
         self,
@@ -90,6 +205,9 @@ class SCIMClient:
     ) -> User:
         """Partially updates a user.
 
+        When the given user was returned by this library, only the attributes changed since then are sent.
+        Removed items of multi-valued attributes are sent with "operation": "delete".
+
         https://api.slack.com/scim#users
 
         :param id: user ID
@@ -98,18 +216,14 @@ class SCIMClient:
         :return: API response
         :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
         """
-        id = self._ensure_user_id(id, user)
+        id = _ensure_user_id(id, user)
         req = SCIMRequest(
             token=self.token,
             http_method="PATCH",
             url=f"{self.base_url}/Users/{quote(id)}",
-            json_body=self._to_user_dict(user),
+            json_body=_to_patch_dict(user, self.schema_values),
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return User.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        return self._request(req, _decode_user)
 
     def update_user(
         self,
@@ -126,18 +240,14 @@ class SCIMClient:
         :return: API response
         :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
         """
-        id = self._ensure_user_id(id, user)
+        id = _ensure_user_id(id, user)
         req = SCIMRequest(
             token=self.token,
             http_method="PUT",
             url=f"{self.base_url}/Users/{quote(id)}",
-            json_body=self._to_user_dict(user),
+            json_body=_to_user_dict(user, self.schema_values),
         )
-        resp = self.api_call(req)
-        if resp.status == 200:
-            return User.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        return self._request(req, _decode_user)
 
     def delete_user(
         self,
@@ -156,9 +266,7 @@ class SCIMClient:
             http_method="DELETE",
             url=f"{self.base_url}/Users/{quote(id)}",
         )
-        resp = self.api_call(req)
-        if not resp.is_success():
-            raise SCIMApiError.from_response(resp)
+        self._request(req)
 
     def read_user(
         self,
@@ -177,18 +285,15 @@ class SCIMClient:
             http_method="GET",
             url=f"{self.base_url}/Users/{quote(id)}",
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return User.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        return self._request(req, _decode_user)
 
     def search_users(
         self,
         *,
         filter: str = None,
         count: int = None,
-        start_index: int = None
+        start_index: int = None,
+        lazy: bool = False,
     ) -> Users:
         """Searches the users matching the given filter.
 
@@ -197,44 +302,114 @@ class SCIMClient:
         :param filter: https://api.slack.com/scim#filter
         :param count: the number of results to return in a response
         :param start_index: the index to fetch as the first item
+        :param lazy: decodes each resource only when it is accessed for the first time;
+            resources becomes a LazyList keeping the parsed JSON in its raw attribute
         :return: API response
         :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
         """
-        query = {}
-        if filter:
-            query["filter"] = filter
-        if count:
-            query["count"] = count
-        if start_index:
-            query["startIndex"] = start_index
+        query = _build_search_query(filter, count, start_index)
         req = SCIMRequest(
             token=self.token,
             http_method="GET",
             url=f"{self.base_url}/Users",
             query_params=query
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return Users.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
-
-    def _ensure_user_id(self, id: str, user: User) -> str:
-        if id:
-            return id
-        else:
-            if user:
-                return user.id
-            else:
-                raise SCIMError("User ID is missing for update_user call")
-
-    def _to_user_dict(self, user: Union[dict, User]) -> dict:
-        if user:
-            user_dict: dict = user if isinstance(user, dict) else user.to_dict()
-            user_dict["schemas"] = self.schema_values
-            return user_dict
-        else:
-            return None
+        return self._request(req, lambda data: Users.from_dict(data, lazy=lazy))
+
+    def iter_users(
+        self,
+        *,
+        filter: str = None,
+        page_size: int = None,
+        start_index: int = 1,
+        on_page: Optional[Callable[[PageEvent], None]] = None,
+        lazy: bool = False,
+    ) -> Iterator[UsersResource]:
+        """Iterates over all the users matching the given filter, fetching pages as needed.
+
+        The next page is fetched in background while you process the current one.
+
+        https://api.slack.com/scim#users
+
+        :param filter: https://api.slack.com/scim#filter
+        :param page_size: the number of results to fetch in a request
+        :param start_index: the index to fetch as the first item
+        :param on_page: a function called with a PageEvent for every fetched page
+        :param lazy: decodes the nested objects such as emails only when they are accessed for the first time
+        :return: users
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        return iterate_resources(
+            lambda index, count: self.search_users(filter=filter, count=count, start_index=index, lazy=lazy),
+            page_size=self._page_size_for(page_size),
+            start_index=start_index,
+            on_page=on_page,
+        )
+
+    def scan_users(
+        self,
+        *,
+        filter: str = None,
+        page_size: int = None,
+        concurrency: int = 4,
+        ordered: bool = True,
+        on_page: Optional[Callable[[PageEvent], None]] = None,
+        lazy: bool = False,
+    ) -> Iterator[UsersResource]:
+        """Fetches all the users matching the given filter, requesting multiple pages in parallel.
+
+        After the first page, the remaining pages are fetched and decoded by a pool of threads.
+        This is much faster than iter_users for full directory scans.
+
+        https://api.slack.com/scim#users
+
+        :param filter: https://api.slack.com/scim#filter
+        :param page_size: the number of results to fetch in a request
+        :param concurrency: the maximum number of requests running at the same time
+        :param ordered: yields users in the server's order if True, otherwise in the order pages arrive
+        :param on_page: a function called with a PageEvent for every fetched page
+        :param lazy: decodes the nested objects such as emails only when they are accessed for the first time
+        :return: users
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        return scan_resources(
+            lambda index, count: self.search_users(filter=filter, count=count, start_index=index, lazy=lazy),
+            page_size=self._page_size_for(page_size),
+            concurrency=concurrency,
+            ordered=ordered,
+            on_page=on_page,
+        )
+
+    def stream_users(
+        self,
+        *,
+        filter: str = None,
+        count: int = None,
+        start_index: int = None
+    ) -> ResourceStream[UsersResource]:
+        """Searches the users matching the given filter, receiving the results incrementally.
+
+        Each user is yielded as soon as its JSON has arrived, so only one user at a time is held in memory
+        and the processing overlaps the transfer of a large page.
+        Failures in the middle of a response are not retried.
+
+        https://api.slack.com/scim#users
+
+        :param filter: https://api.slack.com/scim#filter
+        :param count: the number of results to return in a response
+        :param start_index: the index to fetch as the first item
+        :return: an iterable of users; close it when you stop iterating before the end
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        query = _build_search_query(filter, count, start_index)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.base_url}/Users",
+            query_params=query
+        )
+        resp = self.api_call(req, stream=True)
+        return _to_resource_stream(resp, UsersResource.from_dict, self.json_codec)
 
     # ----------------------------------------------
     # Group Management
@@ -258,13 +433,12 @@ class SCIMClient:
             token=self.token,
             http_method="POST",
             url=f"{self.base_url}/Groups",
-            json_body=self._to_group_dict(group),
+            json_body=_to_group_dict(group, self.schema_values),
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return Group.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        created = self._request(req, _decode_group)
+        if self.membership_index is not None and created is not None:
+            self.membership_index.apply_group(created)
+        return created
 
     def patch_group(
         self,
@@ -273,6 +447,9 @@ class SCIMClient:
     ) -> Group:
         """Partially updates a group.
 
+        When the given group was returned by this library, only the attributes changed since then are sent.
+        Removed items of multi-valued attributes are sent with "operation": "delete".
+
         https://api.slack.com/scim#groups
 
         :param id: group ID
@@ -281,18 +458,17 @@ class SCIMClient:
         :return: API response
         :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
         """
-        id = self._ensure_group_id(id, group)
+        id = _ensure_group_id(id, group)
         req = SCIMRequest(
             token=self.token,
             http_method="PATCH",
             url=f"{self.base_url}/Groups/{quote(id)}",
-            json_body=self._to_group_dict(group),
+            json_body=_to_patch_dict(group, self.schema_values),
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return Group.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        patched = self._request(req, _decode_group)
+        if self.membership_index is not None:
+            self.membership_index.apply_group_patch(id, req.json_body)
+        return patched
 
     def update_group(
         self,
@@ -309,18 +485,17 @@ class SCIMClient:
         :return: API response
         :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
         """
-        id = self._ensure_group_id(id, group)
+        id = _ensure_group_id(id, group)
         req = SCIMRequest(
             token=self.token,
             http_method="PUT",
             url=f"{self.base_url}/Groups/{quote(id)}",
-            json_body=self._to_group_dict(group),
+            json_body=_to_group_dict(group, self.schema_values),
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return Group.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        updated = self._request(req, _decode_group)
+        if self.membership_index is not None:
+            self.membership_index.apply_group(req.json_body, id=id)
+        return updated
 
     def delete_group(
         self,
@@ -339,9 +514,9 @@ class SCIMClient:
             http_method="DELETE",
             url=f"{self.base_url}/Groups/{quote(id)}",
         )
-        resp = self.api_call(req)
-        if not resp.is_success():
-            raise SCIMApiError.from_response(resp)
+        self._request(req)
+        if self.membership_index is not None:
+            self.membership_index.remove_group(id)
 
     def read_group(
         self,
@@ -360,18 +535,15 @@ class SCIMClient:
             http_method="GET",
             url=f"{self.base_url}/Groups/{quote(id)}",
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return Group.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        return self._request(req, _decode_group)
 
     def search_groups(
         self,
         *,
         filter: str = None,
         count: int = None,
-        start_index: int = None
+        start_index: int = None,
+        lazy: bool = False,
     ) -> Groups:
         """Searches the groups matching the given filter.
 
@@ -380,44 +552,114 @@ class SCIMClient:
         :param filter: https://api.slack.com/scim#filter
         :param count: the number of results to return in a response
         :param start_index: the index to fetch as the first item
+        :param lazy: decodes each resource only when it is accessed for the first time;
+            resources becomes a LazyList keeping the parsed JSON in its raw attribute
         :return: API response
         :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
         """
-        query = {}
-        if filter:
-            query["filter"] = filter
-        if count:
-            query["count"] = count
-        if start_index:
-            query["startIndex"] = start_index
+        query = _build_search_query(filter, count, start_index)
         req = SCIMRequest(
             token=self.token,
             http_method="GET",
             url=f"{self.base_url}/Groups",
             query_params=query
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return Groups.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
-
-    def _ensure_group_id(self, id: str, group: Group) -> str:
-        if id:
-            return id
-        else:
-            if group:
-                return group.id
-            else:
-                raise SCIMError("Group ID is missing for update_group call")
-
-    def _to_group_dict(self, group: Union[dict, Group]) -> dict:
-        if group:
-            group_dict: dict = group if isinstance(group, dict) else group.to_dict()
-            group_dict["schemas"] = self.schema_values
-            return group_dict
-        else:
-            return None
+        return self._request(req, lambda data: Groups.from_dict(data, lazy=lazy))
+
+    def iter_groups(
+        self,
+        *,
+        filter: str = None,
+        page_size: int = None,
+        start_index: int = 1,
+        on_page: Optional[Callable[[PageEvent], None]] = None,
+        lazy: bool = False,
+    ) -> Iterator[GroupsResource]:
+        """Iterates over all the groups matching the given filter, fetching pages as needed.
+
+        The next page is fetched in background while you process the current one.
+
+        https://api.slack.com/scim#groups
+
+        :param filter: https://api.slack.com/scim#filter
+        :param page_size: the number of results to fetch in a request
+        :param start_index: the index to fetch as the first item
+        :param on_page: a function called with a PageEvent for every fetched page
+        :param lazy: decodes the nested objects such as members only when they are accessed for the first time
+        :return: groups
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        return iterate_resources(
+            lambda index, count: self.search_groups(filter=filter, count=count, start_index=index, lazy=lazy),
+            page_size=self._page_size_for(page_size),
+            start_index=start_index,
+            on_page=on_page,
+        )
+
+    def scan_groups(
+        self,
+        *,
+        filter: str = None,
+        page_size: int = None,
+        concurrency: int = 4,
+        ordered: bool = True,
+        on_page: Optional[Callable[[PageEvent], None]] = None,
+        lazy: bool = False,
+    ) -> Iterator[GroupsResource]:
+        """Fetches all the groups matching the given filter, requesting multiple pages in parallel.
+
+        After the first page, the remaining pages are fetched and decoded by a pool of threads.
+        This is much faster than iter_groups for full directory scans.
+
+        https://api.slack.com/scim#groups
+
+        :param filter: https://api.slack.com/scim#filter
+        :param page_size: the number of results to fetch in a request
+        :param concurrency: the maximum number of requests running at the same time
+        :param ordered: yields groups in the server's order if True, otherwise in the order pages arrive
+        :param on_page: a function called with a PageEvent for every fetched page
+        :param lazy: decodes the nested objects such as members only when they are accessed for the first time
+        :return: groups
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        return scan_resources(
+            lambda index, count: self.search_groups(filter=filter, count=count, start_index=index, lazy=lazy),
+            page_size=self._page_size_for(page_size),
+            concurrency=concurrency,
+            ordered=ordered,
+            on_page=on_page,
+        )
+
+    def stream_groups(
+        self,
+        *,
+        filter: str = None,
+        count: int = None,
+        start_index: int = None
+    ) -> ResourceStream[GroupsResource]:
+        """Searches the groups matching the given filter, receiving the results incrementally.
+
+        Each group is yielded as soon as its JSON has arrived, so only one group at a time is held in memory
+        and the processing overlaps the transfer of a large page.
+        Failures in the middle of a response are not retried.
+
+        https://api.slack.com/scim#groups
+
+        :param filter: https://api.slack.com/scim#filter
+        :param count: the number of results to return in a response
+        :param start_index: the index to fetch as the first item
+        :return: an iterable of groups; close it when you stop iterating before the end
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack
+        """
+        query = _build_search_query(filter, count, start_index)
+        req = SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.base_url}/Groups",
+            query_params=query
+        )
+        resp = self.api_call(req, stream=True)
+        return _to_resource_stream(resp, GroupsResource.from_dict, self.json_codec)
 
     # ----------------------------------------------
     # ServiceProviderConfigs
@@ -434,137 +676,251 @@ class SCIMClient:
             http_method="GET",
             url=f"{self.base_url}/ServiceProviderConfigs",
         )
-        resp = self.api_call(req)
-        if resp.is_success():
-            return ServiceProviderConfigs.from_dict(json.loads(resp.body)) if resp.body else None
-        else:
-            raise SCIMApiError.from_response(resp)
+        return self._request(req, ServiceProviderConfigs.from_dict)
+
+    # ----------------------------------------------
+    # Batch Operations
+    # ----------------------------------------------
+
+    def batch(
+        self,
+        *,
+        concurrency: int = 4,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> BatchExecutor:
+        """Returns an executor running many user/group write operations concurrently.
+
+            results = client.batch(concurrency=8).create_users(new_users)
+            for failure in results.failed:
+                print(failure.item, failure.error)
+
+        :param concurrency: the default number of operations running at the same time
+        :param on_progress: a function called with a BatchProgress every time an operation finishes
+        :param chunk_size: the number of items taken ahead of their execution;
+            the batch_chunk_size of tuning is used if absent
+        :return: batch executor
+        """
+        return BatchExecutor(self, concurrency=concurrency, on_progress=on_progress, chunk_size=chunk_size)
 
     # ----------------------------------------------
     # HTTP Client
     # ----------------------------------------------
 
-    def api_call(self, api_request: SCIMRequest) -> SCIMResponse:
+    def api_call(self, api_request: SCIMRequest, *, stream: bool = False) -> SCIMResponse:
         """A general method to call the Slack SCIM APIs
 
         :param api_request: API request information
+        :param stream: leaves the body of a successful response unread;
+            read it from the stream attribute of the response, then close it
         :return: API response
         :raise Exception: only when unexpected errors occur,
             never raises exceptions when getting an error code
             with unsuccessful HTTP status from Slack
         """
-        http_method = api_request.http_method.upper()
-        url = api_request.url
-        if api_request.query_params:
-            params = copy.copy(api_request.query_params)
-            if http_method == "GET" and api_request.body_params:
-                params.update(api_request.body_params)
-            q = urlencode(params)
-            url = url + (f"&{q}" if "?" in url else f"?{q}")
-            pass
-
-        headers = copy.copy(api_request.headers)
-        headers["Authorization"] = f"Bearer {api_request.token}"
-        headers["User-Agent"] = self._build_user_agent()
-
-        # The SCIM API never handles binary data
-        if api_request.json_body:
-            body: dict = self._to_non_null_dict(copy.copy(api_request.json_body))
-            req_body: str = None if http_method == "GET" else json.dumps(body)
-            headers["Content-Type"] = "application/json;charset=utf-8"
-        else:
-            req_body: str = None if http_method == "GET" else urlencode(api_request.body_params)
-            headers["Content-Type"] = "application/x-www-form-urlencoded;charset=utf-8"
-
-        req_data: bytes = req_body.encode("utf-8") if req_body else None
+        return self._call(api_request, stream=stream)
+
+    def _request(self, api_request: SCIMRequest, decode: Optional[Callable[[Any], Any]] = None) -> Any:
+        # Calls an API and decodes the response body with the given function, raising SCIMApiError on errors
+        return self._call(api_request, decode=decode, raise_on_error=True)
 
+    def _call(
+        self,
+        api_request: SCIMRequest,
+        *,
+        stream: bool = False,
+        decode: Optional[Callable[[Any], Any]] = None,
+        raise_on_error: bool = False,
+    ) -> Any:
+        http_method, url, headers, req_body = _build_http_request(api_request, self.json_codec)
+        if self.compress:
+            headers["Accept-Encoding"] = ACCEPT_ENCODING
+        if not self.hooks:
+            api_response = self._dispatch(http_method, url, headers, req_body, stream, None)
+            return self._decode(api_response, decode) if raise_on_error else api_response
+
+        event = RequestEvent(
+            method=http_method,
+            endpoint=endpoint_template(url),
+            url=url,
+            request_bytes=len(req_body) if req_body else 0,
+        )
+        _emit(self.hooks, "on_request_start", event, self._logger)
         try:
-            http_request: Request = Request(
-                method=http_method,
-                url=url,
-                data=req_data,
-                headers=headers
-            )
-            self._debug_log_request(http_request, req_body)
+            api_response = self._dispatch(http_method, url, headers, req_body, stream, event)
+            event.status = api_response.status
+            if not raise_on_error:
+                return api_response
+            started = time.perf_counter()
+            try:
+                return self._decode(api_response, decode)
+            finally:
+                event.decode_time = time.perf_counter() - started
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event._finish()
+            _emit(self.hooks, "on_request_end", event, self._logger)
+
+    def _decode(self, api_response: SCIMResponse, decode: Optional[Callable[[Any], Any]]) -> Any:
+        if not api_response.is_success():
+            raise SCIMApiError.from_response(api_response, self.json_codec)
+        if decode is None or not api_response.raw_body:
+            return None
+        return decode(api_response._parse_json())
+
+    def _dispatch(
+        self,
+        http_method: str,
+        url: str,
+        headers: dict,
+        req_body: Optional[bytes],
+        stream: bool,
+        event: Optional[RequestEvent],
+    ) -> SCIMResponse:
+        # Serves the request from the cache or the identical request in flight if possible
+        if stream:
+            return self._send(http_method, url, headers, req_body, stream, event)
+        cache = self.response_cache
+        if http_method != "GET":
+            try:
+                return self._send(http_method, url, headers, req_body, stream, event)
+            finally:
+                # The write may have been applied even if it failed
+                if self.single_flight is not None:
+                    self.single_flight.forget_all()
+                if cache is not None:
+                    cache.invalidate(url)
+        if cache is not None and cache.is_cacheable(url):
+            authorization = headers.get("Authorization")
+            cached = cache.get(url, authorization)
+            if cached is not None:
+                if event is not None:
+                    event.cached = True
+                return cached
+            generation = cache.generation
+            api_response = self._send_get(url, headers, event)
+            cache.put(url, api_response, generation, authorization)
+            return api_response
+        return self._send_get(url, headers, event)
+
+    def _send_get(self, url: str, headers: dict, event: Optional[RequestEvent]) -> SCIMResponse:
+        if self.single_flight is None:
+            return self._send("GET", url, headers, None, False, event)
+        # The identical requests sent at the same time share a single response
+        key = (url, headers.get("Authorization"))
+        sent = []
 
-            http_response: HTTPResponse = urlopen(http_request)
-            charset: str = http_response.headers.get_content_charset()
-            raw_body: bytes = http_response.read()
-            resp_body: str = raw_body.decode(charset) if raw_body else None
+        def send() -> SCIMResponse:
+            sent.append(True)
+            return self._send("GET", url, headers, None, False, event)
 
-            api_response = SCIMResponse(
+        api_response = self.single_flight.do(key, send)
+        if event is not None:
+            event.coalesced = not sent
+        return api_response
+
+    def _send(
+        self,
+        http_method: str,
+        url: str,
+        headers: dict,
+        req_body: Optional[bytes],
+        stream: bool,
+        event: Optional[RequestEvent] = None,
+    ) -> SCIMResponse:
+        # Sends a request, retrying it as the rate limiter and the retry policy tell
+        family = endpoint_family(http_method, url)
+
+        self.retry_policy.on_request()
+        rate_limited_retries = 0
+        retries = 0
+        while True:
+            waited = self.rate_limiter.acquire(family)
+            if event is not None:
+                event.rate_limit_wait += waited or 0.0
+            _debug_log_request(self._logger, http_method, url, headers, req_body)
+            try:
+                api_response = self._perform_http_request(http_method, url, headers, req_body, stream, event)
+            except Exception as e:
+                if self.retry_policy.should_retry(http_method=http_method, retry_count=retries, error=e):
+                    retries += 1
+                    self._logger.warning(f"Retrying a request to Slack SCIM API server after an error: {e}")
+                    self._wait_for_retry(retries, event)
+                    continue
+                self._logger.error(f"Failed to send a request to Slack SCIM API server: {e}")
+                raise e
+            _debug_log_completion(self._logger, http_method, url, api_response)
+
+            retry_after = self.rate_limiter.on_response(family, api_response.status, api_response.headers)
+            if retry_after is not None:
+                if rate_limited_retries < self.rate_limiter.max_retries:
+                    rate_limited_retries += 1
+                    if event is not None:
+                        event.retries += 1
+                    continue
+            elif self.retry_policy.should_retry(
+                http_method=http_method,
+                retry_count=retries,
+                status=api_response.status,
+            ):
+                retries += 1
+                self._logger.warning(f"Retrying a request to Slack SCIM API server after {api_response.status}")
+                self._wait_for_retry(retries, event)
+                continue
+            return api_response
+
+    def _wait_for_retry(self, retries: int, event: Optional[RequestEvent]):
+        waited = self.retry_policy.wait(retries)
+        if event is not None:
+            event.retries += 1
+            event.retry_wait += waited or 0.0
+
+    def _perform_http_request(
+        self,
+        http_method: str,
+        url: str,
+        headers: dict,
+        req_data: bytes,
+        stream: bool = False,
+        event: Optional[RequestEvent] = None,
+    ) -> SCIMResponse:
+        http_response = self.connection_pool.request(
+            method=http_method,
+            url=url,
+            body=req_data,
+            headers=headers,
+        )
+        if event is not None:
+            event.connect_time += http_response.connect_time
+            event.ttfb += http_response.ttfb
+        # Decompresses the body if needed, feeding the decoded bytes to the stream parser as they arrive
+        body = DecodingReader(
+            http_response,
+            content_encoding(http_response.headers),
+            self._compression.add,
+            max_size=self.max_decoded_size,
+        )
+        if stream and http_response.status < 300:
+            return SCIMResponse(
                 status=http_response.status,
                 reason=http_response.reason,
                 headers=http_response.headers,
-                body=resp_body,
-            )
-            self._debug_log_completion(http_request, api_response)
-            return api_response
-
-        except HTTPError as e:
-            # TODO: rate limit
-            api_response = SCIMResponse(
-                status=e.code,
-                reason=e.reason,
-                headers=e.headers,
-                body=e.read().decode("utf-8"),
+                body=None,
+                stream=body,
             )
-            self._debug_log_completion(http_request, api_response)
-            return api_response
-        except Exception as e:
-            self._logger.error(f"Failed to send a request to Slack SCIM API server: {e}")
-            raise e
-
-    def _to_non_null_dict(self, d: Union[dict, any]) -> dict:
-        """Recursively converts an object to dict"""
-        result = {}
-        if isinstance(d, dict):
-            for key, value in d.items():
-                if value is None:
-                    continue
-                if isinstance(value, dict):
-                    value = self._to_non_null_dict(value)
-                    result[key] = value
-                elif isinstance(value, list):
-                    new_list = []
-                    for v in value:
-                        v = self._to_non_null_dict(v)
-                        if v:
-                            new_list.append(v)
-                    result[key] = new_list
-                else:
-                    result[key] = value
-            return result
-        elif getattr(d, "to_dict", None):
-            return d.to_dict()
-        else:
-            return d
-
-    def _debug_log_request(self, req: Request, body: str):
-        if self._logger.level <= logging.DEBUG:
-            headers_part = "\n".join([
-                f"{k.lower()}: (redacted)" if k.lower() == "authorization" else f"{k.lower()}: {v}"
-                for k, v in req.headers.items()
-            ])
-            message = f"*** SCIM API Request ***\n" \
-                      f"{req.method} {req.full_url}\n" \
-                      f"{headers_part}\n\n" \
-                      f"{body or ''}\n"
-            self._logger.debug(message)
-
-    def _debug_log_completion(self, req: Request, resp: SCIMResponse):
-        if self._logger.level <= logging.DEBUG:
-            headers_part = "\n".join([f"{k}: {v}" for k, v in resp.headers.items()])
-            message = f"*** SCIM API Response ***\n" \
-                      f"{req.method} {req.full_url}\n" \
-                      f"{resp.status} {resp.reason}\n" \
-                      f"{headers_part}\n\n" \
-                      f"{resp.body or ''}\n"
-            self._logger.debug(message)
-
-    def _build_user_agent(self):
-        client = "{0}/{1}".format("slack_scim", version.__version__)
-        python_version = "Python/{v.major}.{v.minor}.{v.micro}".format(v=sys.version_info)
-        system_info = "{0}/{1}".format(platform.system(), platform.release())
-        user_agent_string = " ".join([python_version, client, system_info])
-        return user_agent_string
+        charset: str = http_response.headers.get_content_charset() or "utf-8"
+        started = time.perf_counter()
+        raw_body: bytes = body.read()
+        if event is not None:
+            event.read_time += time.perf_counter() - started
+            event.response_bytes += body.received_bytes
+        return SCIMResponse(
+            status=http_response.status,
+            reason=http_response.reason,
+            headers=http_response.headers,
+            raw_body=raw_body,
+            charset=charset,
+            json_codec=self.json_codec,
+        )
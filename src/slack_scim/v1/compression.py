@@ -0,0 +1,205 @@
+import threading
+import zlib
+from typing import Any, Callable, Optional
+
+from .errors import SCIMError
+
+# The Accept-Encoding header value sent when compression is enabled
+ACCEPT_ENCODING = "gzip, deflate"
+
+# The default limit of a decompressed response body, which protects the memory from decompression bombs
+DEFAULT_MAX_DECODED_SIZE = 256 * 1024 * 1024
+
+
+class CompressionStats:
+    def __init__(
+        self,
+        *,
+        responses: int = 0,
+        compressed_responses: int = 0,
+        received_bytes: int = 0,
+        decoded_bytes: int = 0,
+    ):
+        """The numbers of response body bytes received and decoded
+
+        :param responses: the number of response bodies read
+        :param compressed_responses: the number of them compressed with gzip or deflate
+        :param received_bytes: the number of body bytes received, compressed or not
+        :param decoded_bytes: the number of body bytes after decompression
+        """
+        self.responses = responses
+        self.compressed_responses = compressed_responses
+        self.received_bytes = received_bytes
+        self.decoded_bytes = decoded_bytes
+
+    @property
+    def ratio(self) -> float:
+        """The number of decoded bytes per received byte"""
+        return self.decoded_bytes / self.received_bytes if self.received_bytes > 0 else 1.0
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["responses"] = self.responses
+        result["compressed_responses"] = self.compressed_responses
+        result["received_bytes"] = self.received_bytes
+        result["decoded_bytes"] = self.decoded_bytes
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class CompressionCounter:
+    def __init__(self):
+        """A thread-safe accumulator of CompressionStats"""
+        self._lock = threading.Lock()
+        self._stats = CompressionStats()
+
+    @property
+    def stats(self) -> CompressionStats:
+        with self._lock:
+            return CompressionStats(**self._stats.to_dict())
+
+    def add(self, encoding: Optional[str], received_bytes: int, decoded_bytes: int):
+        with self._lock:
+            self._stats.responses += 1
+            self._stats.compressed_responses += 1 if encoding else 0
+            self._stats.received_bytes += received_bytes
+            self._stats.decoded_bytes += decoded_bytes
+
+
+def content_encoding(headers: Any) -> Optional[str]:
+    """Returns gzip or deflate if the body is compressed with either of them, otherwise None"""
+    value = (headers.get("Content-Encoding") or "").strip().lower()
+    if value in ("gzip", "x-gzip"):
+        return "gzip"
+    if value == "deflate":
+        return "deflate"
+    return None
+
+
+class _Decompressor:
+    def __init__(self, encoding: str, max_size: Optional[int] = DEFAULT_MAX_DECODED_SIZE):
+        # 32 + MAX_WBITS accepts both gzip and zlib headers
+        self._decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        # Some servers send raw deflate data without the zlib header for "deflate"
+        self._raw_deflate_allowed = encoding == "deflate"
+        self._started = False
+        self._max_size = max_size
+        self._decoded_size = 0
+
+    def decompress(self, data: bytes) -> bytes:
+        try:
+            result = self._decompressor.decompress(data, self._max_length())
+        except zlib.error:
+            if not self._raw_deflate_allowed or self._started:
+                raise
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            result = self._decompressor.decompress(data, self._max_length())
+        self._started = True
+        return self._count(result)
+
+    def flush(self) -> bytes:
+        if self._max_size is None:
+            return self._count(self._decompressor.flush())
+        # flush() has no output limit; decompress() with a limit reads what is left of the input
+        return self._count(self._decompressor.decompress(self._decompressor.unconsumed_tail, self._max_length()))
+
+    def _max_length(self) -> int:
+        # Asks for one byte more than allowed, to tell a body of exactly max_size bytes from a larger one
+        return 0 if self._max_size is None else self._max_size - self._decoded_size + 1
+
+    def _count(self, result: bytes) -> bytes:
+        self._decoded_size += len(result)
+        if self._max_size is not None and self._decoded_size > self._max_size:
+            raise SCIMError(f"The decompressed response body exceeds {self._max_size} bytes")
+        return result
+
+
+def decode_body(data: bytes, encoding: Optional[str], max_size: Optional[int] = DEFAULT_MAX_DECODED_SIZE) -> bytes:
+    """Decompresses a whole response body
+
+    :param data: the body as received
+    :param encoding: gzip, deflate or None for an uncompressed body
+    :param max_size: the maximum number of decompressed bytes; None for no limit
+    :raise SCIMError: if the decompressed body is larger than max_size
+    """
+    if not encoding or not data:
+        return data
+    decompressor = _Decompressor(encoding, max_size)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+class DecodingReader:
+    def __init__(
+        self,
+        response: Any,
+        encoding: Optional[str],
+        on_finish: Optional[Callable[[Optional[str], int, int], None]] = None,
+        max_size: Optional[int] = DEFAULT_MAX_DECODED_SIZE,
+    ):
+        """Reads a response body, decompressing it on the fly
+
+        Each read returns the bytes decompressed from the compressed chunk read from the socket,
+        so that consumers such as ResourceStream receive data as soon as it arrives.
+
+        :param response: the response to read the body of, such as a PooledResponse
+        :param encoding: gzip, deflate or None for an uncompressed body
+        :param on_finish: called once with the encoding and the numbers of received and decoded bytes
+            when the body has been read or closed
+        :param max_size: the maximum number of decompressed bytes; None for no limit.
+            Reading beyond it raises SCIMError.
+        """
+        self._response = response
+        self.encoding = encoding
+        self._decompressor = _Decompressor(encoding, max_size) if encoding else None
+        self._on_finish = on_finish
+        self._finished = False
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.received_bytes = 0
+        self.decoded_bytes = 0
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Reads the decoded body
+
+        :param amt: the number of bytes to read from the socket at most; reads everything if None
+        :return: the decoded bytes; empty at the end of the body
+        """
+        if self._finished:
+            return b""
+        while True:
+            data = self._response.read() if amt is None else self._response.read(amt)
+            self.received_bytes += len(data)
+            if self._decompressor is None:
+                result = data
+            else:
+                result = self._decompressor.decompress(data) if data else b""
+                if not data or amt is None:
+                    result += self._decompressor.flush()
+            self.decoded_bytes += len(result)
+            if not data or amt is None:
+                self._finish()
+                return result
+            if result:
+                return result
+
+    def close(self):
+        self._finish()
+        self._response.close()
+
+    def _finish(self):
+        if not self._finished:
+            self._finished = True
+            if self._on_finish is not None:
+                self._on_finish(self.encoding, self.received_bytes, self.decoded_bytes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
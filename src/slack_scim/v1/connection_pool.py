@@ -0,0 +1,407 @@
+import base64
+import logging
+import os
+import selectors
+import ssl
+import threading
+import time
+import weakref
+from http.client import HTTPConnection, HTTPSConnection, HTTPResponse, HTTPMessage, RemoteDisconnected
+from socket import _GLOBAL_DEFAULT_TIMEOUT
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass_environment
+
+from .errors import SCIMError
+
+# Errors meaning that a kept-alive connection was closed by the server while it was idle
+_STALE_CONNECTION_ERRORS = (RemoteDisconnected, ConnectionResetError, BrokenPipeError, ConnectionAbortedError)
+
+# The methods that can be sent again even if the server may have processed the first attempt
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class _RequestNotSent(Exception):
+    # Raised with the error that happened while writing a request, which the server cannot have processed
+    def __init__(self, error: Exception):
+        super().__init__(error)
+        self.error = error
+
+_all_pools: "weakref.WeakSet[ConnectionPool]" = weakref.WeakSet()
+
+
+def _reset_all_pools_after_fork():
+    for pool in list(_all_pools):
+        pool._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_all_pools_after_fork)
+
+
+def _is_dropped(connection: HTTPConnection) -> bool:
+    # An idle connection closed by the server becomes readable, as there is nothing else to read but EOF
+    if connection.sock is None:
+        return True
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(connection.sock, selectors.EVENT_READ)
+            return bool(selector.select(0))
+    except (OSError, ValueError):
+        return True
+
+
+class ConnectionPoolStats:
+    def __init__(
+        self,
+        *,
+        requests: int = 0,
+        connections_created: int = 0,
+        connections_reused: int = 0,
+        connections_discarded: int = 0,
+    ):
+        """Counters describing how a ConnectionPool has been used so far
+
+        :param requests: the number of HTTP requests sent through the pool
+        :param connections_created: the number of newly established connections
+        :param connections_reused: the number of requests sent over an already established connection
+        :param connections_discarded: the number of connections closed because they were stale,
+            idle for too long, or there was no room left in the pool
+        """
+        self.requests = requests
+        self.connections_created = connections_created
+        self.connections_reused = connections_reused
+        self.connections_discarded = connections_discarded
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["requests"] = self.requests
+        result["connections_created"] = self.connections_created
+        result["connections_reused"] = self.connections_reused
+        result["connections_discarded"] = self.connections_discarded
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class PooledResponse:
+    def __init__(
+        self,
+        *,
+        pool: "ConnectionPool",
+        key: Tuple[str, str, int],
+        connection: HTTPConnection,
+        response: HTTPResponse,
+        connect_time: float = 0.0,
+        ttfb: float = 0.0,
+    ):
+        """An HTTP response whose connection goes back to the pool once the body has been fully read
+
+        :param pool: the pool that owns the connection
+        :param key: the (scheme, host, port) tuple the connection belongs to
+        :param connection: the underlying connection
+        :param response: the underlying response
+        :param connect_time: the seconds spent establishing a new connection; 0 for a reused one
+        :param ttfb: the seconds from sending the request until the response headers were received
+        """
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self.status: int = response.status
+        self.reason: str = response.reason
+        self.headers: HTTPMessage = response.headers
+        self.connect_time = connect_time
+        self.ttfb = ttfb
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Reads the response body. The connection is released when reaching the end of the body.
+
+        :param amt: the maximum number of bytes to read; reads everything if None
+        :return: the body bytes
+        """
+        if self._response is None:
+            return b""
+        try:
+            data = self._response.read() if amt is None else self._response.read(amt)
+        except Exception:
+            self.close()
+            raise
+        if amt is None or not data or self._response.isclosed():
+            self._release()
+        return data
+
+    def close(self):
+        """Closes the response. If the body has not been fully read, the connection is discarded."""
+        if self._response is None:
+            return
+        if self._response.isclosed():
+            self._release()
+        else:
+            self._response.close()
+            self._pool._discard(self._connection)
+            self._response = None
+            self._connection = None
+
+    def _release(self):
+        if self._response is None:
+            return
+        if self._response.will_close:
+            self._pool._discard(self._connection)
+        else:
+            self._pool._put(self._key, self._connection)
+        self._response = None
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ConnectionPool:
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 60.0,
+        timeout: Optional[float] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ):
+        """A thread-safe pool of persistent HTTP/1.1 connections
+
+        Connections are kept alive and reused across requests so that a series of API calls
+        doesn't have to pay for a new TCP connection and a new TLS handshake every time.
+        A pool detects that the process has been forked and never shares sockets with the parent process.
+
+        :param max_connections_per_host: the maximum number of idle connections kept for each host.
+            More connections than this can be opened concurrently, but the extra ones are closed after use.
+        :param idle_timeout: the number of seconds an idle connection can be kept in the pool
+        :param timeout: the socket timeout in seconds for connecting and reading
+        :param ssl_context: the SSL context shared by all the HTTPS connections;
+            the default one is created only once for the pool
+        :param proxies: the proxy URLs by scheme such as {"https": "http://proxy:3128", "no": "localhost"};
+            read from the HTTP_PROXY, HTTPS_PROXY and NO_PROXY environment variables as urlopen does if absent.
+            HTTPS requests are tunneled through the proxy with CONNECT.
+        """
+        if max_connections_per_host < 1:
+            raise SCIMError("max_connections_per_host must be a positive number")
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.proxies: Dict[str, str] = getproxies() if proxies is None else proxies
+        self._lock = threading.Lock()
+        # (scheme, host, port) -> [(connection, released_at), ...]
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[HTTPConnection, float]]] = {}
+        self._pid = os.getpid()
+        self._stats = ConnectionPoolStats()
+        _all_pools.add(self)
+
+    def __repr__(self):
+        d: dict = {
+            "max_connections_per_host": self.max_connections_per_host,
+            "idle_timeout": self.idle_timeout,
+            "timeout": self.timeout,
+        }
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    @property
+    def stats(self) -> ConnectionPoolStats:
+        """Returns a snapshot of the counters"""
+        with self._lock:
+            return ConnectionPoolStats(**self._stats.to_dict())
+
+    def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> PooledResponse:
+        """Sends an HTTP request over a pooled connection
+
+        :param method: HTTP method
+        :param url: absolute URL
+        :param body: request body
+        :param headers: request headers
+        :return: the response; read its body until the end or close it to release the connection
+        """
+        self._check_pid()
+        key, path = self._parse_url(url)
+        headers = headers or {}
+        proxy = self._proxy_for(key)
+        if proxy is not None and key[0] == "http":
+            # A plain HTTP request goes to the proxy with the absolute URL
+            path = url
+            headers = {**headers, **proxy[2]}
+        connection, reused = self._get(key)
+        try:
+            response, connect_time, ttfb = self._send(connection, method, path, body, headers)
+        except (_RequestNotSent,) + _STALE_CONNECTION_ERRORS as e:
+            self._discard(connection)
+            not_sent = isinstance(e, _RequestNotSent)
+            if not reused or not (not_sent or method.upper() in _IDEMPOTENT_METHODS):
+                # The server may have processed the request before closing the connection,
+                # so sending a POST or PATCH again is left to RetryPolicy
+                if not_sent:
+                    raise e.error from None
+                raise
+            # The server had closed the idle connection
+            connection, _ = self._get(key, fresh=True)
+            try:
+                response, connect_time, ttfb = self._send(connection, method, path, body, headers)
+            except _RequestNotSent as e:
+                self._discard(connection)
+                raise e.error from None
+            except Exception:
+                self._discard(connection)
+                raise
+        except Exception:
+            self._discard(connection)
+            raise
+        return PooledResponse(
+            pool=self,
+            key=key,
+            connection=connection,
+            response=response,
+            connect_time=connect_time,
+            ttfb=ttfb,
+        )
+
+    def clear(self):
+        """Closes all the idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def close(self):
+        self.clear()
+
+    # ----------------------------------------------
+
+    @staticmethod
+    def _parse_url(url: str) -> Tuple[Tuple[str, str, int], str]:
+        parsed = urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise SCIMError(f"Unsupported URL scheme: {url}")
+        port = parsed.port or (443 if scheme == "https" else 80)
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        return (scheme, parsed.hostname, port), path
+
+    @staticmethod
+    def _send(
+        connection: HTTPConnection,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> Tuple[HTTPResponse, float, float]:
+        # Connects explicitly to measure the connect time (including the TLS handshake) apart from the TTFB
+        connect_time = 0.0
+        if connection.sock is None:
+            started = time.perf_counter()
+            connection.connect()
+            connect_time = time.perf_counter() - started
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+        except _STALE_CONNECTION_ERRORS as e:
+            raise _RequestNotSent(e)
+        response = connection.getresponse()
+        return response, connect_time, time.perf_counter() - started
+
+    def _get(self, key: Tuple[str, str, int], fresh: bool = False) -> Tuple[HTTPConnection, bool]:
+        expired: List[HTTPConnection] = []
+        connection: Optional[HTTPConnection] = None
+        with self._lock:
+            self._stats.requests += 0 if fresh else 1
+            connections = self._idle.get(key)
+            now = time.monotonic()
+            while not fresh and connections:
+                candidate, released_at = connections.pop()
+                if now - released_at > self.idle_timeout or _is_dropped(candidate):
+                    expired.append(candidate)
+                    continue
+                connection = candidate
+                self._stats.connections_reused += 1
+                break
+            self._stats.connections_discarded += len(expired)
+            if connection is None:
+                self._stats.connections_created += 1
+        for c in expired:
+            c.close()
+        if connection is not None:
+            return connection, True
+        return self._new_connection(key), False
+
+    def _new_connection(self, key: Tuple[str, str, int]) -> HTTPConnection:
+        scheme, host, port = key
+        timeout = _GLOBAL_DEFAULT_TIMEOUT if self.timeout is None else self.timeout
+        proxy = self._proxy_for(key)
+        if proxy is not None:
+            proxy_host, proxy_port, proxy_headers = proxy
+            if scheme == "https":
+                connection = HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=self.ssl_context)
+                connection.set_tunnel(host, port, headers=proxy_headers)
+                return connection
+            return HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+        if scheme == "https":
+            return HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context)
+        return HTTPConnection(host, port, timeout=timeout)
+
+    def _proxy_for(self, key: Tuple[str, str, int]) -> Optional[Tuple[str, int, Dict[str, str]]]:
+        # Returns the host, the port and the headers of the proxy to use for the key, if any
+        scheme, host, port = key
+        proxy_url = self.proxies.get(scheme)
+        if not proxy_url or proxy_bypass_environment(f"{host}:{port}", self.proxies):
+            return None
+        if "://" not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        parsed = urlsplit(proxy_url)
+        headers = {}
+        if parsed.username is not None:
+            credentials = f"{unquote(parsed.username)}:{unquote(parsed.password or '')}"
+            headers["Proxy-Authorization"] = f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('ascii')}"
+        return parsed.hostname, parsed.port or 80, headers
+
+    def _put(self, key: Tuple[str, str, int], connection: HTTPConnection):
+        with self._lock:
+            if os.getpid() == self._pid:
+                connections = self._idle.setdefault(key, [])
+                if len(connections) < self.max_connections_per_host:
+                    connections.append((connection, time.monotonic()))
+                    return
+            self._stats.connections_discarded += 1
+        connection.close()
+
+    def _discard(self, connection: Optional[HTTPConnection]):
+        if connection is None:
+            return
+        with self._lock:
+            self._stats.connections_discarded += 1
+        connection.close()
+
+    def _check_pid(self):
+        if os.getpid() != self._pid:
+            self._reset_after_fork()
+
+    def _reset_after_fork(self):
+        # The sockets are shared with the parent process; never write to them from the child
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._pid = os.getpid()
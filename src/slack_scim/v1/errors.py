@@ -1,6 +1,6 @@
-import json
-from typing import Dict
+from typing import Dict, Optional
 
+from .json_codec import JSONCodec, default_codec
 from .response import SCIMResponse
 
 
@@ -42,10 +42,10 @@ class SCIMApiError(SCIMError):
         self.errors = errors
 
     @classmethod
-    def from_response(cls, resp: SCIMResponse) -> "SCIMApiError":
+    def from_response(cls, resp: SCIMResponse, json_codec: Optional[JSONCodec] = None) -> "SCIMApiError":
         errors = {}
-        if resp.body:
-            b = json.loads(resp.body)
+        if resp.raw_body:
+            b = (json_codec or default_codec()).loads(resp.raw_body)
             errors = b["Errors"] if "Errors" in b else {}
         return SCIMApiError(
             status=resp.status,
@@ -1,3 +1,6 @@
+# This code is generated by generate_response_classes.py from json-schema/v1/Group.json
+# Don't edit this file manually.
+#
 # To use this code, make sure you
 #
 #     import json
@@ -8,6 +11,9 @@
 
 from typing import Optional, Any, List, TypeVar, Callable, Type, cast
 
+from .changes import changed_attributes
+from .lazy_list import LazyList
+
 
 T = TypeVar("T")
 
@@ -31,6 +37,16 @@ def from_union(fs, x):
     assert False
 
 
+def from_bool(x: Any) -> bool:
+    assert isinstance(x, bool)
+    return x
+
+
+def from_int(x: Any) -> int:
+    assert isinstance(x, int) and not isinstance(x, bool)
+    return x
+
+
 def from_list(f: Callable[[Any], T], x: Any) -> List[T]:
     assert isinstance(x, list)
     return [f(y) for y in x]
@@ -42,6 +58,11 @@ def to_class(c: Type[T], x: Any) -> dict:
 
 
 class Member:
+    __slots__ = (
+        "display",
+        "value",
+    )
+
     display: Optional[str]
     value: Optional[str]
 
@@ -52,40 +73,74 @@ class Member:
     @staticmethod
     def from_dict(obj: Any) -> 'Member':
         assert isinstance(obj, dict)
-        display = from_union([from_str, from_none], obj.get("display"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        display = obj.get("display")
+        assert display is None or isinstance(display, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Member(display, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["display"] = from_union([from_str, from_none], self.display)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
+        display = self.display
+        assert display is None or isinstance(display, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "display": display,
+            "value": value,
+        }
 
 
 class Meta:
+    __slots__ = (
+        "created",
+        "location",
+        "last_modified",
+    )
+
     created: Optional[str]
     location: Optional[str]
+    last_modified: Optional[str]
 
-    def __init__(self, created: Optional[str], location: Optional[str]) -> None:
+    def __init__(self, created: Optional[str], location: Optional[str], last_modified: Optional[str] = None) -> None:
         self.created = created
         self.location = location
+        self.last_modified = last_modified
 
     @staticmethod
     def from_dict(obj: Any) -> 'Meta':
         assert isinstance(obj, dict)
-        created = from_union([from_str, from_none], obj.get("created"))
-        location = from_union([from_str, from_none], obj.get("location"))
-        return Meta(created, location)
+        created = obj.get("created")
+        assert created is None or isinstance(created, str)
+        location = obj.get("location")
+        assert location is None or isinstance(location, str)
+        last_modified = obj.get("lastModified")
+        assert last_modified is None or isinstance(last_modified, str)
+        return Meta(created, location, last_modified)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["created"] = from_union([from_str, from_none], self.created)
-        result["location"] = from_union([from_str, from_none], self.location)
-        return result
+        created = self.created
+        assert created is None or isinstance(created, str)
+        location = self.location
+        assert location is None or isinstance(location, str)
+        last_modified = self.last_modified
+        assert last_modified is None or isinstance(last_modified, str)
+        return {
+            "created": created,
+            "location": location,
+            "lastModified": last_modified,
+        }
 
 
 class Group:
+    __slots__ = (
+        "display_name",
+        "id",
+        "members",
+        "meta",
+        "schemas",
+        "_original",
+    )
+
     display_name: Optional[str]
     id: Optional[str]
     members: Optional[List[Member]]
@@ -98,25 +153,67 @@ class Group:
         self.members = members
         self.meta = meta
         self.schemas = schemas
+        self._original: Optional[dict] = None
 
     @staticmethod
-    def from_dict(obj: Any) -> 'Group':
+    def from_dict(obj: Any, lazy: bool = False) -> 'Group':
         assert isinstance(obj, dict)
-        display_name = from_union([from_str, from_none], obj.get("displayName"))
-        id = from_union([from_str, from_none], obj.get("id"))
-        members = from_union([lambda x: from_list(Member.from_dict, x), from_none], obj.get("members"))
-        meta = from_union([Meta.from_dict, from_none], obj.get("meta"))
-        schemas = from_union([lambda x: from_list(from_str, x), from_none], obj.get("schemas"))
+        display_name = obj.get("displayName")
+        assert display_name is None or isinstance(display_name, str)
+        id = obj.get("id")
+        assert id is None or isinstance(id, str)
+        members = obj.get("members")
+        if members is not None:
+            assert isinstance(members, list)
+            if lazy:
+                members = LazyList(members, Member.from_dict)
+            else:
+                members = [Member.from_dict(x) for x in members]
+        meta = obj.get("meta")
+        if meta is not None:
+            meta = Meta.from_dict(meta)
+        schemas = obj.get("schemas")
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
         return Group(display_name, id, members, meta, schemas)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["displayName"] = from_union([from_str, from_none], self.display_name)
-        result["id"] = from_union([from_str, from_none], self.id)
-        result["members"] = from_union([lambda x: from_list(lambda x: to_class(Member, x), x), from_none], self.members)
-        result["meta"] = from_union([lambda x: to_class(Meta, x), from_none], self.meta)
-        result["schemas"] = from_union([lambda x: from_list(from_str, x), from_none], self.schemas)
-        return result
+        display_name = self.display_name
+        assert display_name is None or isinstance(display_name, str)
+        id = self.id
+        assert id is None or isinstance(id, str)
+        members = self.members
+        if members is not None:
+            assert isinstance(members, (list, LazyList))
+            assert all(isinstance(x, Member) for x in members)
+            members = [x.to_dict() for x in members]
+        meta = self.meta
+        if meta is not None:
+            assert isinstance(meta, Meta)
+            meta = meta.to_dict()
+        schemas = self.schemas
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        return {
+            "displayName": display_name,
+            "id": id,
+            "members": members,
+            "meta": meta,
+            "schemas": schemas,
+        }
+
+    def changed_attributes(self) -> Optional[List[str]]:
+        """Returns the JSON names of the attributes changed since this object was returned by the client
+
+        None is returned for the objects not returned by the client, such as the ones built with from_dict.
+        """
+        if self._original is None:
+            return None
+        return changed_attributes(self._original, self.to_dict())
 
 
 def group_from_dict(s: Any) -> Group:
@@ -1,3 +1,6 @@
+# This code is generated by generate_response_classes.py from json-schema/v1/Groups.json
+# Don't edit this file manually.
+#
 # To use this code, make sure you
 #
 #     import json
@@ -8,12 +11,14 @@
 
 from typing import Optional, Any, List, TypeVar, Callable, Type, cast
 
+from .lazy_list import LazyList
+
 
 T = TypeVar("T")
 
 
-def from_int(x: Any) -> int:
-    assert isinstance(x, int) and not isinstance(x, bool)
+def from_str(x: Any) -> str:
+    assert isinstance(x, str)
     return x
 
 
@@ -31,8 +36,13 @@ def from_union(fs, x):
     assert False
 
 
-def from_str(x: Any) -> str:
-    assert isinstance(x, str)
+def from_bool(x: Any) -> bool:
+    assert isinstance(x, bool)
+    return x
+
+
+def from_int(x: Any) -> int:
+    assert isinstance(x, int) and not isinstance(x, bool)
     return x
 
 
@@ -47,6 +57,11 @@ def to_class(c: Type[T], x: Any) -> dict:
 
 
 class Errors:
+    __slots__ = (
+        "code",
+        "description",
+    )
+
     code: Optional[int]
     description: Optional[str]
 
@@ -57,18 +72,29 @@ class Errors:
     @staticmethod
     def from_dict(obj: Any) -> 'Errors':
         assert isinstance(obj, dict)
-        code = from_union([from_int, from_none], obj.get("code"))
-        description = from_union([from_str, from_none], obj.get("description"))
+        code = obj.get("code")
+        assert code is None or isinstance(code, int) and not isinstance(code, bool)
+        description = obj.get("description")
+        assert description is None or isinstance(description, str)
         return Errors(code, description)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["code"] = from_union([from_int, from_none], self.code)
-        result["description"] = from_union([from_str, from_none], self.description)
-        return result
+        code = self.code
+        assert code is None or isinstance(code, int) and not isinstance(code, bool)
+        description = self.description
+        assert description is None or isinstance(description, str)
+        return {
+            "code": code,
+            "description": description,
+        }
 
 
 class Member:
+    __slots__ = (
+        "display",
+        "value",
+    )
+
     display: Optional[str]
     value: Optional[str]
 
@@ -79,40 +105,73 @@ class Member:
     @staticmethod
     def from_dict(obj: Any) -> 'Member':
         assert isinstance(obj, dict)
-        display = from_union([from_str, from_none], obj.get("display"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        display = obj.get("display")
+        assert display is None or isinstance(display, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Member(display, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["display"] = from_union([from_str, from_none], self.display)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
+        display = self.display
+        assert display is None or isinstance(display, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "display": display,
+            "value": value,
+        }
 
 
 class Meta:
+    __slots__ = (
+        "created",
+        "location",
+        "last_modified",
+    )
+
     created: Optional[str]
     location: Optional[str]
+    last_modified: Optional[str]
 
-    def __init__(self, created: Optional[str], location: Optional[str]) -> None:
+    def __init__(self, created: Optional[str], location: Optional[str], last_modified: Optional[str] = None) -> None:
         self.created = created
         self.location = location
+        self.last_modified = last_modified
 
     @staticmethod
     def from_dict(obj: Any) -> 'Meta':
         assert isinstance(obj, dict)
-        created = from_union([from_str, from_none], obj.get("created"))
-        location = from_union([from_str, from_none], obj.get("location"))
-        return Meta(created, location)
+        created = obj.get("created")
+        assert created is None or isinstance(created, str)
+        location = obj.get("location")
+        assert location is None or isinstance(location, str)
+        last_modified = obj.get("lastModified")
+        assert last_modified is None or isinstance(last_modified, str)
+        return Meta(created, location, last_modified)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["created"] = from_union([from_str, from_none], self.created)
-        result["location"] = from_union([from_str, from_none], self.location)
-        return result
+        created = self.created
+        assert created is None or isinstance(created, str)
+        location = self.location
+        assert location is None or isinstance(location, str)
+        last_modified = self.last_modified
+        assert last_modified is None or isinstance(last_modified, str)
+        return {
+            "created": created,
+            "location": location,
+            "lastModified": last_modified,
+        }
 
 
 class Resource:
+    __slots__ = (
+        "display_name",
+        "id",
+        "members",
+        "meta",
+        "schemas",
+    )
+
     display_name: Optional[str]
     id: Optional[str]
     members: Optional[List[Member]]
@@ -127,26 +186,67 @@ class Resource:
         self.schemas = schemas
 
     @staticmethod
-    def from_dict(obj: Any) -> 'Resource':
+    def from_dict(obj: Any, lazy: bool = False) -> 'Resource':
         assert isinstance(obj, dict)
-        display_name = from_union([from_str, from_none], obj.get("displayName"))
-        id = from_union([from_str, from_none], obj.get("id"))
-        members = from_union([lambda x: from_list(Member.from_dict, x), from_none], obj.get("members"))
-        meta = from_union([Meta.from_dict, from_none], obj.get("meta"))
-        schemas = from_union([lambda x: from_list(from_str, x), from_none], obj.get("schemas"))
+        display_name = obj.get("displayName")
+        assert display_name is None or isinstance(display_name, str)
+        id = obj.get("id")
+        assert id is None or isinstance(id, str)
+        members = obj.get("members")
+        if members is not None:
+            assert isinstance(members, list)
+            if lazy:
+                members = LazyList(members, Member.from_dict)
+            else:
+                members = [Member.from_dict(x) for x in members]
+        meta = obj.get("meta")
+        if meta is not None:
+            meta = Meta.from_dict(meta)
+        schemas = obj.get("schemas")
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
         return Resource(display_name, id, members, meta, schemas)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["displayName"] = from_union([from_str, from_none], self.display_name)
-        result["id"] = from_union([from_str, from_none], self.id)
-        result["members"] = from_union([lambda x: from_list(lambda x: to_class(Member, x), x), from_none], self.members)
-        result["meta"] = from_union([lambda x: to_class(Meta, x), from_none], self.meta)
-        result["schemas"] = from_union([lambda x: from_list(from_str, x), from_none], self.schemas)
-        return result
+        display_name = self.display_name
+        assert display_name is None or isinstance(display_name, str)
+        id = self.id
+        assert id is None or isinstance(id, str)
+        members = self.members
+        if members is not None:
+            assert isinstance(members, (list, LazyList))
+            assert all(isinstance(x, Member) for x in members)
+            members = [x.to_dict() for x in members]
+        meta = self.meta
+        if meta is not None:
+            assert isinstance(meta, Meta)
+            meta = meta.to_dict()
+        schemas = self.schemas
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        return {
+            "displayName": display_name,
+            "id": id,
+            "members": members,
+            "meta": meta,
+            "schemas": schemas,
+        }
 
 
 class Groups:
+    __slots__ = (
+        "errors",
+        "items_per_page",
+        "resources",
+        "schemas",
+        "start_index",
+        "total_results",
+    )
+
     errors: Optional[Errors]
     items_per_page: Optional[int]
     resources: Optional[List[Resource]]
@@ -163,25 +263,60 @@ class Groups:
         self.total_results = total_results
 
     @staticmethod
-    def from_dict(obj: Any) -> 'Groups':
+    def from_dict(obj: Any, lazy: bool = False) -> 'Groups':
         assert isinstance(obj, dict)
-        errors = from_union([Errors.from_dict, from_none], obj.get("Errors"))
-        items_per_page = from_union([from_int, from_none], obj.get("itemsPerPage"))
-        resources = from_union([lambda x: from_list(Resource.from_dict, x), from_none], obj.get("Resources"))
-        schemas = from_union([lambda x: from_list(from_str, x), from_none], obj.get("schemas"))
-        start_index = from_union([from_int, from_none], obj.get("startIndex"))
-        total_results = from_union([from_int, from_none], obj.get("totalResults"))
+        errors = obj.get("Errors")
+        if errors is not None:
+            errors = Errors.from_dict(errors)
+        items_per_page = obj.get("itemsPerPage")
+        assert items_per_page is None or isinstance(items_per_page, int) and not isinstance(items_per_page, bool)
+        resources = obj.get("Resources")
+        if resources is not None:
+            assert isinstance(resources, list)
+            if lazy:
+                resources = LazyList(resources, lambda x: Resource.from_dict(x, True))
+            else:
+                resources = [Resource.from_dict(x) for x in resources]
+        schemas = obj.get("schemas")
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        start_index = obj.get("startIndex")
+        assert start_index is None or isinstance(start_index, int) and not isinstance(start_index, bool)
+        total_results = obj.get("totalResults")
+        assert total_results is None or isinstance(total_results, int) and not isinstance(total_results, bool)
         return Groups(errors, items_per_page, resources, schemas, start_index, total_results)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["Errors"] = from_union([lambda x: to_class(Errors, x), from_none], self.errors)
-        result["itemsPerPage"] = from_union([from_int, from_none], self.items_per_page)
-        result["Resources"] = from_union([lambda x: from_list(lambda x: to_class(Resource, x), x), from_none], self.resources)
-        result["schemas"] = from_union([lambda x: from_list(from_str, x), from_none], self.schemas)
-        result["startIndex"] = from_union([from_int, from_none], self.start_index)
-        result["totalResults"] = from_union([from_int, from_none], self.total_results)
-        return result
+        errors = self.errors
+        if errors is not None:
+            assert isinstance(errors, Errors)
+            errors = errors.to_dict()
+        items_per_page = self.items_per_page
+        assert items_per_page is None or isinstance(items_per_page, int) and not isinstance(items_per_page, bool)
+        resources = self.resources
+        if resources is not None:
+            assert isinstance(resources, (list, LazyList))
+            assert all(isinstance(x, Resource) for x in resources)
+            resources = [x.to_dict() for x in resources]
+        schemas = self.schemas
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        start_index = self.start_index
+        assert start_index is None or isinstance(start_index, int) and not isinstance(start_index, bool)
+        total_results = self.total_results
+        assert total_results is None or isinstance(total_results, int) and not isinstance(total_results, bool)
+        return {
+            "Errors": errors,
+            "itemsPerPage": items_per_page,
+            "Resources": resources,
+            "schemas": schemas,
+            "startIndex": start_index,
+            "totalResults": total_results,
+        }
 
 
 def groups_from_dict(s: Any) -> Groups:
@@ -0,0 +1,321 @@
+import logging
+import math
+import random
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+# The resource part of a SCIM API URL path, such as /Users/W123 in /scim/v1/Users/W123
+_ENDPOINT_PATH = re.compile(r"/(Users|Groups|ServiceProviderConfigs)(/[^/]+)?$")
+
+# The phases of a request measured by RequestEvent
+PHASES = ("total", "connect", "ttfb", "read", "decode")
+
+
+def endpoint_template(url: str) -> str:
+    """Returns the endpoint of a URL with the resource ID replaced, such as /Users/{id}"""
+    path = urlsplit(url).path.rstrip("/")
+    match = _ENDPOINT_PATH.search(path)
+    if match is None:
+        return path or "/"
+    resource, id = match.groups()
+    return f"/{resource}/{{id}}" if id else f"/{resource}"
+
+
+class RequestEvent:
+    def __init__(
+        self,
+        *,
+        method: str,
+        endpoint: str,
+        url: str,
+        request_bytes: int = 0,
+    ):
+        """The measurements of an API call, given to the instrumentation hooks
+
+        on_request_start receives an event with only the request attributes set;
+        on_request_end receives the same event with the rest filled in.
+        The time attributes are in seconds. When the request was retried, connect_time, ttfb, read_time
+        and response_bytes are the sums over all the attempts. The body of a response returned as a stream
+        is read after the end, so read_time and response_bytes are left 0 for it.
+
+        :param method: HTTP method
+        :param endpoint: the endpoint template, such as /Users/{id}
+        :param url: the requested URL
+        :param request_bytes: the size of the request body
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.request_bytes = request_bytes
+        # The HTTP status of the last response; None if no response was received
+        self.status: Optional[int] = None
+        # The exception raised by the call, including SCIMApiError for unsuccessful statuses
+        self.error: Optional[BaseException] = None
+        # The size of the response body as received, before decompression
+        self.response_bytes = 0
+        # Establishing new connections, including the TLS handshakes
+        self.connect_time = 0.0
+        # Sending the request until the response headers arrive
+        self.ttfb = 0.0
+        # Receiving and decompressing the response body
+        self.read_time = 0.0
+        # Parsing the JSON body and building the returned objects
+        self.decode_time = 0.0
+        # The whole call, from on_request_start to on_request_end
+        self.total_time = 0.0
+        self.retries = 0
+        self.retry_wait = 0.0
+        self.rate_limit_wait = 0.0
+        # True if the response came from the ResponseCache
+        self.cached = False
+        # True if the response was shared with an identical request in flight
+        self.coalesced = False
+        self._started = time.perf_counter()
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.status is None or self.status >= 400
+
+    def _finish(self):
+        self.total_time = time.perf_counter() - self._started
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["method"] = self.method
+        result["endpoint"] = self.endpoint
+        result["url"] = self.url
+        result["status"] = self.status
+        result["error"] = repr(self.error) if self.error is not None else None
+        result["request_bytes"] = self.request_bytes
+        result["response_bytes"] = self.response_bytes
+        result["connect_time"] = self.connect_time
+        result["ttfb"] = self.ttfb
+        result["read_time"] = self.read_time
+        result["decode_time"] = self.decode_time
+        result["total_time"] = self.total_time
+        result["retries"] = self.retries
+        result["retry_wait"] = self.retry_wait
+        result["rate_limit_wait"] = self.rate_limit_wait
+        result["cached"] = self.cached
+        result["coalesced"] = self.coalesced
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class InstrumentationHook:
+    """The base class of the objects receiving the RequestEvents of a client
+
+    Override either or both methods. They are called in the thread making the API call,
+    so keep them fast. Exceptions raised by them are logged and never fail the API call.
+    """
+
+    def on_request_start(self, event: RequestEvent):
+        pass
+
+    def on_request_end(self, event: RequestEvent):
+        pass
+
+
+def _emit(hooks: Sequence[InstrumentationHook], name: str, event: RequestEvent, logger: logging.Logger):
+    for hook in hooks:
+        try:
+            getattr(hook, name)(event)
+        except Exception as e:
+            logger.warning(f"An instrumentation hook failed in {name}: {e}")
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    # Nearest-rank percentile
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class EndpointMetrics:
+    def __init__(
+        self,
+        *,
+        method: str,
+        endpoint: str,
+        count: int = 0,
+        errors: int = 0,
+        statuses: Optional[Dict[int, int]] = None,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        retries: int = 0,
+        retry_wait: float = 0.0,
+        rate_limit_wait: float = 0.0,
+        cached: int = 0,
+        coalesced: int = 0,
+        samples: Optional[Dict[str, List[float]]] = None,
+    ):
+        """The aggregated measurements of the API calls to an endpoint
+
+        :param method: HTTP method
+        :param endpoint: the endpoint template, such as /Users/{id}
+        :param count: the number of calls
+        :param errors: the number of calls failed with an exception or a 4xx/5xx status
+        :param statuses: the number of calls by HTTP status
+        :param request_bytes: the total size of the request bodies
+        :param response_bytes: the total size of the response bodies as received
+        :param retries: the total number of retries
+        :param retry_wait: the total seconds spent in backoff before retries
+        :param rate_limit_wait: the total seconds spent waiting for the rate limiter
+        :param cached: the number of calls served from the ResponseCache
+        :param coalesced: the number of calls sharing the response of an identical request
+        :param samples: the sampled seconds by phase (total, connect, ttfb, read, decode)
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.count = count
+        self.errors = errors
+        self.statuses = statuses or {}
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+        self.retries = retries
+        self.retry_wait = retry_wait
+        self.rate_limit_wait = rate_limit_wait
+        self.cached = cached
+        self.coalesced = coalesced
+        self.samples = {phase: sorted(values) for phase, values in (samples or {}).items()}
+
+    def percentile(self, q: float, phase: str = "total") -> float:
+        """Returns the q-quantile (0 < q <= 1) of the seconds spent in a phase
+
+        :param q: 0.5 for the median, 0.99 for the 99th percentile
+        :param phase: one of total, connect, ttfb, read and decode
+        """
+        return _percentile(self.samples.get(phase, []), q)
+
+    def mean(self, phase: str = "total") -> float:
+        values = self.samples.get(phase, [])
+        return sum(values) / len(values) if values else 0.0
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["method"] = self.method
+        result["endpoint"] = self.endpoint
+        result["count"] = self.count
+        result["errors"] = self.errors
+        result["statuses"] = dict(self.statuses)
+        result["request_bytes"] = self.request_bytes
+        result["response_bytes"] = self.response_bytes
+        result["retries"] = self.retries
+        result["retry_wait"] = self.retry_wait
+        result["rate_limit_wait"] = self.rate_limit_wait
+        result["cached"] = self.cached
+        result["coalesced"] = self.coalesced
+        for phase in PHASES:
+            result[phase] = {
+                "mean": self.mean(phase),
+                "p50": self.percentile(0.5, phase),
+                "p90": self.percentile(0.9, phase),
+                "p99": self.percentile(0.99, phase),
+                "max": self.percentile(1.0, phase),
+            }
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class MetricsAggregator(InstrumentationHook):
+    def __init__(self, *, max_samples: int = 10000, seed: Optional[int] = None):
+        """An in-memory InstrumentationHook aggregating the RequestEvents per endpoint
+
+            metrics = MetricsAggregator()
+            client = SCIMClient(token=token, hooks=[metrics])
+            ...
+            for key, m in metrics.snapshot().items():
+                print(key, m.count, m.percentile(0.99), m.percentile(0.99, "ttfb"))
+
+        The counters are exact. The percentiles are computed over a uniform sample of up to max_samples calls
+        per endpoint, so the memory usage stays constant however many calls are made.
+
+        :param max_samples: the maximum number of calls sampled per endpoint
+        :param seed: the seed of the sampling, for reproducible results
+        """
+        self.max_samples = max_samples
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, EndpointMetrics] = {}
+
+    def on_request_end(self, event: RequestEvent):
+        key = f"{event.method} {event.endpoint}"
+        timings = (event.total_time, event.connect_time, event.ttfb, event.read_time, event.decode_time)
+        with self._lock:
+            m = self._metrics.get(key)
+            if m is None:
+                m = EndpointMetrics(method=event.method, endpoint=event.endpoint)
+                m.samples = {phase: [] for phase in PHASES}
+                self._metrics[key] = m
+            m.count += 1
+            m.errors += 1 if event.failed else 0
+            if event.status is not None:
+                m.statuses[event.status] = m.statuses.get(event.status, 0) + 1
+            m.request_bytes += event.request_bytes
+            m.response_bytes += event.response_bytes
+            m.retries += event.retries
+            m.retry_wait += event.retry_wait
+            m.rate_limit_wait += event.rate_limit_wait
+            m.cached += 1 if event.cached else 0
+            m.coalesced += 1 if event.coalesced else 0
+            # Reservoir sampling keeps every call with the same probability
+            if m.count <= self.max_samples:
+                index = None
+            else:
+                index = self._random.randrange(m.count)
+                if index >= self.max_samples:
+                    return
+            for phase, value in zip(PHASES, timings):
+                if index is None:
+                    m.samples[phase].append(value)
+                else:
+                    m.samples[phase][index] = value
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """Returns the metrics so far, keyed by method and endpoint such as GET /Users/{id}"""
+        with self._lock:
+            return {
+                key: EndpointMetrics(
+                    method=m.method,
+                    endpoint=m.endpoint,
+                    count=m.count,
+                    errors=m.errors,
+                    statuses=dict(m.statuses),
+                    request_bytes=m.request_bytes,
+                    response_bytes=m.response_bytes,
+                    retries=m.retries,
+                    retry_wait=m.retry_wait,
+                    rate_limit_wait=m.rate_limit_wait,
+                    cached=m.cached,
+                    coalesced=m.coalesced,
+                    samples=m.samples,
+                )
+                for key, m in self._metrics.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._metrics = {}
+
+    def to_dict(self) -> dict:
+        return {key: m.to_dict() for key, m in self.snapshot().items()}
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
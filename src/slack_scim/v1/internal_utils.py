@@ -0,0 +1,182 @@
+import copy
+import logging
+import platform
+import sys
+from typing import Optional, Tuple, Union, Dict
+from urllib.parse import urlencode
+
+from . import version
+from .changes import build_patch
+from .errors import SCIMError
+from .group import Group
+from .json_codec import JSONCodec, default_codec
+from .request import SCIMRequest
+from .response import SCIMResponse
+from .user import User
+
+
+def _build_http_request(
+    api_request: SCIMRequest,
+    json_codec: Optional[JSONCodec] = None,
+) -> Tuple[str, str, Dict[str, str], Optional[bytes]]:
+    """Builds the HTTP method, URL, headers and body bytes for an API request"""
+    http_method = api_request.http_method.upper()
+    url = api_request.url
+    if api_request.query_params:
+        params = copy.copy(api_request.query_params)
+        if http_method == "GET" and api_request.body_params:
+            params.update(api_request.body_params)
+        q = urlencode(params)
+        url = url + (f"&{q}" if "?" in url else f"?{q}")
+
+    headers = copy.copy(api_request.headers)
+    headers["Authorization"] = f"Bearer {api_request.token}"
+    headers["User-Agent"] = _build_user_agent()
+
+    # The SCIM API never handles binary data
+    if api_request.raw_body is not None:
+        # Sent as-is, without parsing and encoding it again
+        req_body: bytes = None if http_method == "GET" else api_request.raw_body
+        headers.setdefault("Content-Type", "application/json;charset=utf-8")
+    elif api_request.json_body:
+        body: dict = _to_non_null_dict(copy.copy(api_request.json_body))
+        req_body: bytes = None if http_method == "GET" else (json_codec or default_codec()).dumps_bytes(body)
+        headers["Content-Type"] = "application/json;charset=utf-8"
+    else:
+        req_body: bytes = None if http_method == "GET" else urlencode(api_request.body_params).encode("utf-8")
+        headers["Content-Type"] = "application/x-www-form-urlencoded;charset=utf-8"
+    return http_method, url, headers, req_body or None
+
+
+def _build_search_query(filter: Optional[str], count: Optional[int], start_index: Optional[int]) -> dict:
+    query = {}
+    if filter:
+        query["filter"] = filter
+    if count:
+        query["count"] = count
+    if start_index:
+        query["startIndex"] = start_index
+    return query
+
+
+def _to_non_null_dict(d: Union[dict, any]) -> dict:
+    """Recursively converts an object to dict"""
+    result = {}
+    if isinstance(d, dict):
+        for key, value in d.items():
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                value = _to_non_null_dict(value)
+                result[key] = value
+            elif isinstance(value, list):
+                new_list = []
+                for v in value:
+                    v = _to_non_null_dict(v)
+                    if v:
+                        new_list.append(v)
+                result[key] = new_list
+            else:
+                result[key] = value
+        return result
+    elif getattr(d, "to_dict", None):
+        return d.to_dict()
+    else:
+        return d
+
+
+def _ensure_user_id(id: str, user: User) -> str:
+    if id:
+        return id
+    else:
+        if user:
+            return user.id
+        else:
+            raise SCIMError("User ID is missing for update_user call")
+
+
+def _to_user_dict(user: Union[dict, User], schemas: list) -> dict:
+    if user:
+        user_dict: dict = user if isinstance(user, dict) else user.to_dict()
+        user_dict["schemas"] = schemas
+        return user_dict
+    else:
+        return None
+
+
+def _decode_user(obj: dict) -> User:
+    """Decodes a user returned by the API, remembering the JSON to send only the changes in patch_user"""
+    user = User.from_dict(obj)
+    user._original = obj
+    return user
+
+
+def _decode_group(obj: dict) -> Group:
+    """Decodes a group returned by the API, remembering the JSON to send only the changes in patch_group"""
+    group = Group.from_dict(obj)
+    group._original = obj
+    return group
+
+
+def _to_patch_dict(resource: Union[dict, User, Group], schemas: list) -> dict:
+    """Builds a PATCH body with only the attributes changed since the resource was returned by the client"""
+    original = getattr(resource, "_original", None)
+    if original is not None:
+        patch, _ = build_patch(original, resource.to_dict())
+        if patch:
+            patch["schemas"] = schemas
+            return patch
+    # dicts, objects built by hand and unchanged objects are sent as-is
+    return _to_group_dict(resource, schemas) if isinstance(resource, Group) else _to_user_dict(resource, schemas)
+
+
+def _ensure_group_id(id: str, group: Group) -> str:
+    if id:
+        return id
+    else:
+        if group:
+            return group.id
+        else:
+            raise SCIMError("Group ID is missing for update_group call")
+
+
+def _to_group_dict(group: Union[dict, Group], schemas: list) -> dict:
+    if group:
+        group_dict: dict = group if isinstance(group, dict) else group.to_dict()
+        group_dict["schemas"] = schemas
+        return group_dict
+    else:
+        return None
+
+
+def _debug_log_request(logger: logging.Logger, method: str, url: str, headers: dict, body: Optional[bytes]):
+    # isEnabledFor() avoids decoding the bodies just to drop the message
+    if logger.isEnabledFor(logging.DEBUG):
+        headers_part = "\n".join([
+            f"{k.lower()}: (redacted)" if k.lower() == "authorization" else f"{k.lower()}: {v}"
+            for k, v in headers.items()
+        ])
+        message = f"*** SCIM API Request ***\n" \
+                  f"{method} {url}\n" \
+                  f"{headers_part}\n\n" \
+                  f"{body.decode('utf-8', 'replace') if body else ''}\n"
+        logger.debug(message)
+
+
+def _debug_log_completion(logger: logging.Logger, method: str, url: str, resp: SCIMResponse):
+    if logger.isEnabledFor(logging.DEBUG):
+        headers_part = "\n".join([f"{k}: {v}" for k, v in resp.headers.items()])
+        message = f"*** SCIM API Response ***\n" \
+                  f"{method} {url}\n" \
+                  f"{resp.status} {resp.reason}\n" \
+                  f"{headers_part}\n\n" \
+                  f"{resp.body or ''}\n"
+        logger.debug(message)
+
+
+def _build_user_agent():
+    client = "{0}/{1}".format("slack_scim", version.__version__)
+    python_version = "Python/{v.major}.{v.minor}.{v.micro}".format(v=sys.version_info)
+    system_info = "{0}/{1}".format(platform.system(), platform.release())
+    user_agent_string = " ".join([python_version, client, system_info])
+    return user_agent_string
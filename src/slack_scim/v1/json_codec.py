@@ -0,0 +1,86 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+
+class JSONCodec:
+    def __init__(
+        self,
+        *,
+        name: str,
+        loads: Callable[[Union[str, bytes]], Any],
+        dumps: Callable[[Any], str],
+        dumps_bytes: Optional[Callable[[Any], bytes]] = None,
+    ):
+        """A pair of functions encoding and decoding JSON
+
+        :param name: the name of the implementation such as orjson
+        :param loads: the function parsing a str or bytes JSON document
+        :param dumps: the function serializing an object into a str JSON document
+        :param dumps_bytes: the function serializing an object into a UTF-8 JSON document, used for request bodies;
+            dumps followed by encoding if absent
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.dumps_bytes = dumps_bytes or (lambda obj: self.dumps(obj).encode("utf-8"))
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.name}>"
+
+
+def stdlib_codec() -> JSONCodec:
+    return JSONCodec(name="json", loads=json.loads, dumps=json.dumps)
+
+
+def orjson_codec() -> JSONCodec:
+    """Returns the codec using orjson
+
+    :raise ImportError: if orjson is not installed
+    """
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    return JSONCodec(name="orjson", loads=orjson.loads, dumps=dumps, dumps_bytes=orjson.dumps)
+
+
+def ujson_codec() -> JSONCodec:
+    """Returns the codec using ujson
+
+    :raise ImportError: if ujson is not installed
+    """
+    import ujson
+
+    def dumps(obj: Any) -> str:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+    return JSONCodec(name="ujson", loads=ujson.loads, dumps=dumps)
+
+
+_factories = {"orjson": orjson_codec, "ujson": ujson_codec, "json": stdlib_codec}
+_default: Optional[JSONCodec] = None
+
+
+def get_codec(name: str) -> JSONCodec:
+    """Returns the codec with the given name: orjson, ujson or json (the standard library)
+
+    :raise ImportError: if the library is not installed
+    :raise ValueError: if the name is unknown
+    """
+    if name not in _factories:
+        raise ValueError(f"Unknown JSON codec: {name} (available: {', '.join(_factories.keys())})")
+    return _factories[name]()
+
+
+def default_codec() -> JSONCodec:
+    """Returns the fastest codec installed, trying orjson, ujson and the standard library in this order"""
+    global _default
+    if _default is None:
+        for factory in _factories.values():
+            try:
+                _default = factory()
+                break
+            except ImportError:
+                pass
+    return _default
@@ -0,0 +1,66 @@
+from typing import Any, Callable, Iterator, List, Sequence, TypeVar, Union, overload
+
+T = TypeVar("T")
+
+_NOT_DECODED = object()
+
+
+class LazyList(Sequence[T]):
+    __slots__ = ("raw", "_decode", "_items")
+
+    def __init__(self, raw: List[Any], decode: Callable[[Any], T]):
+        """A read-only list of model objects decoding each element when it is accessed for the first time
+
+        The decoded objects are cached, so modifications to them are kept.
+
+        :param raw: the elements before decoding, such as dicts parsed from JSON;
+            useful for filtering many elements without decoding them
+        :param decode: the function converting a raw element into a model object
+        """
+        self.raw = raw
+        self._decode = decode
+        self._items: List[Any] = [_NOT_DECODED] * len(raw)
+
+    def _get(self, index: int) -> T:
+        item = self._items[index]
+        if item is _NOT_DECODED:
+            item = self._decode(self.raw[index])
+            self._items[index] = item
+        return item
+
+    @overload
+    def __getitem__(self, i: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, s: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(i, slice):
+            return [self._get(index) for index in range(*i.indices(len(self._items)))]
+        if i < 0:
+            i += len(self._items)
+        if i < 0 or i >= len(self._items):
+            raise IndexError("list index out of range")
+        return self._get(i)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self._items)):
+            yield self._get(index)
+
+    @property
+    def decoded_count(self) -> int:
+        """The number of elements decoded so far"""
+        return sum(1 for item in self._items if item is not _NOT_DECODED)
+
+    def __reduce__(self):
+        # pickled and deep-copied as a plain list
+        return list, (list(self),)
+
+    def __repr__(self):
+        d: dict = {"length": len(self), "decoded": self.decoded_count}
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
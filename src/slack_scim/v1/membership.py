@@ -0,0 +1,155 @@
+import threading
+from typing import Dict, FrozenSet, Iterable, Optional, Union
+
+from .group import Group
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def _member_ids(members) -> FrozenSet[str]:
+    return frozenset(
+        m["value"] if isinstance(m, dict) else m.value
+        for m in members or []
+        if (m.get("value") if isinstance(m, dict) else m.value)
+    )
+
+
+class MembershipIndex:
+    def __init__(self):
+        """Maps users to the groups they belong to, and groups to their members
+
+        groups_of and members_of are single dict lookups returning immutable sets,
+        so they are safe to call from multiple threads while the index is being updated.
+        Give this index to SCIMClient as membership_index to apply the changes made by
+        create_group, patch_group, update_group and delete_group automatically.
+        """
+        self._lock = threading.Lock()
+        self._groups_by_user: Dict[str, FrozenSet[str]] = {}
+        self._members_by_group: Dict[str, FrozenSet[str]] = {}
+
+    def __repr__(self):
+        d: dict = {"users": len(self._groups_by_user), "groups": len(self._members_by_group)}
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    @staticmethod
+    def build(
+        client: "SCIMClient",  # noqa: F821
+        *,
+        page_size: Optional[int] = None,
+    ) -> "MembershipIndex":
+        """Builds an index from all the groups
+
+        The pages are streamed with SCIMClient#stream_groups, so only one group at a time is held in memory,
+        however large the groups are.
+
+        :param client: the client to fetch the groups with
+        :param page_size: the number of groups to fetch in a request
+        :return: a new index
+        """
+        index = MembershipIndex()
+        start_index = 1
+        while True:
+            with client.stream_groups(count=page_size, start_index=start_index) as stream:
+                count = 0
+                for group in stream:
+                    count += 1
+                    if group.id:
+                        index.set_members(group.id, _member_ids(group.members))
+                total_results = stream.total_results
+            start_index += count
+            if count == 0 or total_results is None or start_index > total_results:
+                return index
+
+    # ----------------------------------------------
+    # Queries
+    # ----------------------------------------------
+
+    def groups_of(self, user_id: str) -> FrozenSet[str]:
+        """Returns the IDs of the groups the user belongs to"""
+        return self._groups_by_user.get(user_id, _EMPTY)
+
+    def members_of(self, group_id: str) -> FrozenSet[str]:
+        """Returns the IDs of the members of the group"""
+        return self._members_by_group.get(group_id, _EMPTY)
+
+    def is_member(self, user_id: str, group_id: str) -> bool:
+        return group_id in self._groups_by_user.get(user_id, _EMPTY)
+
+    @property
+    def group_ids(self) -> FrozenSet[str]:
+        return frozenset(self._members_by_group.keys())
+
+    # ----------------------------------------------
+    # Updates
+    # ----------------------------------------------
+
+    def _change(self, group_id: str, added: Iterable[str], removed: Iterable[str]):
+        # Called with the lock held. The sets are replaced, never modified, so that readers never see them change.
+        members = set(self._members_by_group.get(group_id, _EMPTY))
+        for user_id in removed:
+            members.discard(user_id)
+            groups = self._groups_by_user.get(user_id, _EMPTY) - {group_id}
+            if groups:
+                self._groups_by_user[user_id] = groups
+            else:
+                self._groups_by_user.pop(user_id, None)
+        for user_id in added:
+            members.add(user_id)
+            self._groups_by_user[user_id] = self._groups_by_user.get(user_id, _EMPTY) | {group_id}
+        self._members_by_group[group_id] = frozenset(members)
+
+    def set_members(self, group_id: str, member_ids: Iterable[str]):
+        """Replaces the members of a group"""
+        new_members = frozenset(member_ids)
+        with self._lock:
+            current = self._members_by_group.get(group_id, _EMPTY)
+            self._change(group_id, new_members - current, current - new_members)
+
+    def add_members(self, group_id: str, member_ids: Iterable[str]):
+        with self._lock:
+            self._change(group_id, member_ids, ())
+
+    def remove_members(self, group_id: str, member_ids: Iterable[str]):
+        with self._lock:
+            self._change(group_id, (), member_ids)
+
+    def remove_group(self, group_id: str):
+        with self._lock:
+            self._change(group_id, (), self._members_by_group.get(group_id, _EMPTY))
+            del self._members_by_group[group_id]
+
+    def remove_user(self, user_id: str):
+        """Removes a user from all the groups, for example after deactivating them"""
+        with self._lock:
+            for group_id in self._groups_by_user.get(user_id, _EMPTY):
+                self._change(group_id, (), [user_id])
+
+    def apply_group(self, group: Union[dict, Group], *, id: Optional[str] = None):
+        """Replaces the members of a group with the ones in the given data, such as the body of a PUT request
+
+        :param group: the group
+        :param id: the ID of the group if the given data doesn't have it
+        """
+        group_dict = group if isinstance(group, dict) else group.to_dict()
+        group_id = id or group_dict.get("id")
+        if group_id:
+            self.set_members(group_id, _member_ids(group_dict.get("members")))
+
+    def apply_group_patch(self, group_id: str, patch: Union[dict, Group]):
+        """Applies the membership changes in a PATCH request body
+
+        Following SCIM 1.1, members with "operation": "delete" are removed, the other ones are added,
+        and "members" in meta.attributes removes all the members before that.
+
+        :param group_id: the ID of the patched group
+        :param patch: the PATCH request body
+        """
+        patch_dict = patch if isinstance(patch, dict) else patch.to_dict()
+        meta = patch_dict.get("meta") or {}
+        members = patch_dict.get("members") or []
+        with self._lock:
+            if "members" in (meta.get("attributes") or []):
+                self._change(group_id, (), self._members_by_group.get(group_id, _EMPTY))
+            removed = _member_ids(m for m in members if isinstance(m, dict) and m.get("operation") == "delete")
+            added = _member_ids(m for m in members if not (isinstance(m, dict) and m.get("operation") == "delete"))
+            self._change(group_id, added, removed)
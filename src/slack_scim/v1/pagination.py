@@ -0,0 +1,252 @@
+import asyncio
+import itertools
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, Optional, Set, Tuple
+
+
+class PageEvent:
+    def __init__(
+        self,
+        *,
+        start_index: int,
+        count: Optional[int],
+        resource_count: int,
+        total_results: Optional[int],
+        elapsed: float,
+        waited: float,
+    ):
+        """Describes a page fetched while iterating over search results
+
+        :param start_index: the startIndex the page was requested with
+        :param count: the count the page was requested with
+        :param resource_count: the number of resources in the page
+        :param total_results: the totalResults value in the page
+        :param elapsed: the number of seconds spent fetching and decoding the page
+        :param waited: the number of seconds the iteration was blocked waiting for the page;
+            this is smaller than elapsed when the page was prefetched while the previous one was consumed
+        """
+        self.start_index = start_index
+        self.count = count
+        self.resource_count = resource_count
+        self.total_results = total_results
+        self.elapsed = elapsed
+        self.waited = waited
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["start_index"] = self.start_index
+        result["count"] = self.count
+        result["resource_count"] = self.resource_count
+        result["total_results"] = self.total_results
+        result["elapsed"] = self.elapsed
+        result["waited"] = self.waited
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+def _timed(fetch_page: Callable[[int, Optional[int]], Any], start_index: int, count: Optional[int]) -> Tuple[Any, float]:
+    started = time.monotonic()
+    page = fetch_page(start_index, count)
+    return page, time.monotonic() - started
+
+
+def _next_start_index(page: Any, start_index: int) -> Optional[int]:
+    resources = page.resources if page else None
+    if not resources:
+        return None
+    next_start_index = start_index + len(resources)
+    if page.total_results is not None and next_start_index > page.total_results:
+        return None
+    return next_start_index
+
+
+def iterate_resources(
+    fetch_page: Callable[[int, Optional[int]], Any],
+    *,
+    page_size: Optional[int] = None,
+    start_index: int = 1,
+    on_page: Optional[Callable[[PageEvent], None]] = None,
+) -> Iterator[Any]:
+    """Yields the resources in search results one by one, fetching the next page in background.
+
+    While the caller consumes a page, the following page is fetched by a background thread.
+    At most two pages are held in memory at a time.
+
+    :param fetch_page: a function that receives startIndex and count, and returns a Users/Groups page
+    :param page_size: the count value for each page
+    :param start_index: the index to fetch as the first item
+    :param on_page: a function called with a PageEvent every time a page has been fetched
+    :return: resources
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slack_scim-prefetch")
+    current_index: Optional[int] = start_index
+    future: Optional[Future] = executor.submit(_timed, fetch_page, current_index, page_size)
+    try:
+        while future is not None:
+            waiting_started = time.monotonic()
+            page, elapsed = future.result()
+            waited = time.monotonic() - waiting_started
+            next_index = _next_start_index(page, current_index)
+            future = executor.submit(_timed, fetch_page, next_index, page_size) if next_index else None
+            if on_page:
+                on_page(PageEvent(
+                    start_index=current_index,
+                    count=page_size,
+                    resource_count=len(page.resources or []) if page else 0,
+                    total_results=page.total_results if page else None,
+                    elapsed=elapsed,
+                    waited=waited,
+                ))
+            resources = page.resources if page else None
+            page = None  # don't keep the page in this frame while yielding
+            for resource in resources or []:
+                yield resource
+            current_index = next_index
+    finally:
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def scan_resources(
+    fetch_page: Callable[[int, Optional[int]], Any],
+    *,
+    page_size: Optional[int] = None,
+    concurrency: int = 4,
+    ordered: bool = True,
+    on_page: Optional[Callable[[PageEvent], None]] = None,
+) -> Iterator[Any]:
+    """Yields all the resources in search results, fetching the pages in parallel.
+
+    Once the first page tells totalResults, the startIndex values of all the remaining pages are known.
+    They are fetched and decoded by a thread pool, with at most `concurrency` pages in flight.
+    The pages are as large as the first one actually was, since the server may cap count,
+    and the missing tail of any shorter page is fetched sequentially.
+    If some resources are added or removed during a scan, the pages may overlap or miss some of them.
+
+    :param fetch_page: a function that receives startIndex and count, and returns a Users/Groups page
+    :param page_size: the count value for each page;
+        the number of resources in the first page is used if absent
+    :param concurrency: the maximum number of pages fetched at the same time
+    :param ordered: yields the resources in the server's order if True, otherwise page by page as they arrive
+    :param on_page: a function called with a PageEvent every time a page has been fetched
+    :return: resources
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive number")
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="slack_scim-scan")
+    in_flight: Deque[Tuple[int, Future]] = deque()
+
+    def submit(index: int):
+        in_flight.append((index, executor.submit(_timed, fetch_page, index, step)))
+
+    def page_done(index: int, result: Tuple[Any, float], waited: float, count: Optional[int]) -> list:
+        page, elapsed = result
+        if on_page:
+            on_page(PageEvent(
+                start_index=index,
+                count=count,
+                resource_count=len(page.resources or []) if page else 0,
+                total_results=page.total_results if page else None,
+                elapsed=elapsed,
+                waited=waited,
+            ))
+        return (page.resources if page else None) or []
+
+    def fill_tail(index: int, resources: list) -> list:
+        # Fetches the rest of a page the server returned fewer resources than requested for
+        expected = min(step, total - index + 1)
+        while len(resources) < expected:
+            tail_index = index + len(resources)
+            tail_count = expected - len(resources)
+            tail = page_done(tail_index, _timed(fetch_page, tail_index, tail_count), 0.0, tail_count)
+            if not tail:
+                break
+            resources = resources + tail
+        return resources
+
+    try:
+        first_future = executor.submit(_timed, fetch_page, 1, page_size)
+        waiting_started = time.monotonic()
+        first_result = first_future.result()
+        first_page = first_result[0]
+        first_resources = page_done(1, first_result, time.monotonic() - waiting_started, page_size)
+        # The server may return fewer resources than requested; striding by page_size would skip the rest
+        step = min(page_size, len(first_resources)) if page_size else len(first_resources)
+        total = first_page.total_results if first_page else None
+        first_page = first_result = None
+        remaining = iter(range(1 + step, (total or 0) + 1, step)) if step and total else iter(())
+
+        for index in itertools.islice(remaining, concurrency):
+            submit(index)
+        for resource in first_resources:
+            yield resource
+        first_resources = None
+
+        while in_flight:
+            waiting_started = time.monotonic()
+            if ordered:
+                index, future = in_flight.popleft()
+            else:
+                done: Set[Future] = wait([f for _, f in in_flight], return_when=FIRST_COMPLETED).done
+                index, future = next((i, f) for i, f in in_flight if f in done)
+                in_flight.remove((index, future))
+            result = future.result()
+            resources = fill_tail(index, page_done(index, result, time.monotonic() - waiting_started, step))
+            for next_index in itertools.islice(remaining, 1):
+                submit(next_index)
+            for resource in resources:
+                yield resource
+    finally:
+        for _, future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def async_iterate_resources(
+    fetch_page: Callable[[int, Optional[int]], Awaitable[Any]],
+    *,
+    page_size: Optional[int] = None,
+    start_index: int = 1,
+    on_page: Optional[Callable[[PageEvent], None]] = None,
+) -> AsyncIterator[Any]:
+    """The asyncio version of iterate_resources. The next page is fetched by a task."""
+
+    async def _async_timed(index: int) -> Tuple[Any, float]:
+        started = time.monotonic()
+        page = await fetch_page(index, page_size)
+        return page, time.monotonic() - started
+
+    current_index: Optional[int] = start_index
+    task = asyncio.ensure_future(_async_timed(current_index))
+    try:
+        while task is not None:
+            waiting_started = time.monotonic()
+            page, elapsed = await task
+            waited = time.monotonic() - waiting_started
+            next_index = _next_start_index(page, current_index)
+            task = asyncio.ensure_future(_async_timed(next_index)) if next_index else None
+            if on_page:
+                on_page(PageEvent(
+                    start_index=current_index,
+                    count=page_size,
+                    resource_count=len(page.resources or []) if page else 0,
+                    total_results=page.total_results if page else None,
+                    elapsed=elapsed,
+                    waited=waited,
+                ))
+            resources = page.resources if page else None
+            page = None
+            for resource in resources or []:
+                yield resource
+            current_index = next_index
+    finally:
+        if task is not None and not task.done():
+            task.cancel()
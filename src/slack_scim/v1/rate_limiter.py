@@ -0,0 +1,266 @@
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+USERS_READ = "users_read"
+USERS_WRITE = "users_write"
+GROUPS_READ = "groups_read"
+GROUPS_WRITE = "groups_write"
+SERVICE_PROVIDER_CONFIGS = "service_provider_configs"
+OTHERS = "others"
+
+
+def endpoint_family(http_method: str, url: str) -> str:
+    """Returns the name of the rate limit bucket a request belongs to
+
+    :param http_method: HTTP method
+    :param url: request URL
+    :return: one of users_read, users_write, groups_read, groups_write, service_provider_configs and others
+    """
+    path = urlsplit(url).path
+    read = http_method.upper() == "GET"
+    if "/Users" in path:
+        return USERS_READ if read else USERS_WRITE
+    if "/Groups" in path:
+        return GROUPS_READ if read else GROUPS_WRITE
+    if "/ServiceProviderConfigs" in path:
+        return SERVICE_PROVIDER_CONFIGS
+    return OTHERS
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header value, which is either a number of seconds or an HTTP-date"""
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class RateLimitBudget:
+    def __init__(
+        self,
+        *,
+        family: str,
+        requests_per_minute: Optional[float],
+        available: Optional[float],
+        paused_for: float,
+        throttled: int,
+    ):
+        """The current budget of an endpoint family
+
+        :param family: endpoint family name such as users_read
+        :param requests_per_minute: the pace the requests are sent at, None if not limited
+        :param available: the number of requests that can be sent right now without waiting, None if not limited
+        :param paused_for: the number of seconds until requests can be sent again after a 429 response
+        :param throttled: the number of 429 responses received so far
+        """
+        self.family = family
+        self.requests_per_minute = requests_per_minute
+        self.available = available
+        self.paused_for = paused_for
+        self.throttled = throttled
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["family"] = self.family
+        result["requests_per_minute"] = self.requests_per_minute
+        result["available"] = self.available
+        result["paused_for"] = self.paused_for
+        result["throttled"] = self.throttled
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class TokenBucket:
+    def __init__(self, *, requests_per_minute: Optional[float] = None, burst: Optional[float] = None):
+        """A thread-safe token bucket
+
+        :param requests_per_minute: the refill rate; the bucket never blocks if None
+        :param burst: the capacity of the bucket; the default is one second of requests, at least 1
+        """
+        self._lock = threading.Lock()
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self._tokens: float = self._capacity()
+        self._updated_at: float = time.monotonic()
+        self._paused_until: float = 0.0
+        self.throttled: int = 0
+
+    def _capacity(self) -> float:
+        if self.burst is not None:
+            return self.burst
+        if self.requests_per_minute is None:
+            return 0.0
+        return max(self.requests_per_minute / 60.0, 1.0)
+
+    def _refill(self, now: float):
+        if self.requests_per_minute is not None:
+            elapsed = now - self._updated_at
+            self._tokens = min(self._tokens + elapsed * self.requests_per_minute / 60.0, self._capacity())
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Takes a token, waiting until either the bucket or a pause allows it
+
+        :return: the number of seconds spent waiting
+        """
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                pause = self._paused_until - now
+                if pause <= 0:
+                    if self.requests_per_minute is None:
+                        return now - started
+                    # Reserve a token; a negative balance queues the callers in arrival order
+                    self._tokens -= 1
+                    wait = -self._tokens * 60.0 / self.requests_per_minute if self._tokens < 0 else 0.0
+            if pause > 0:
+                time.sleep(pause)
+                continue
+            if wait > 0:
+                time.sleep(wait)
+            return time.monotonic() - started
+
+    def pause(self, seconds: float):
+        """Stops handing out tokens for the given seconds"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def set_rate(self, requests_per_minute: Optional[float]):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.requests_per_minute = requests_per_minute
+            self._tokens = min(self._tokens, self._capacity())
+
+    def budget(self, family: str) -> RateLimitBudget:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return RateLimitBudget(
+                family=family,
+                requests_per_minute=self.requests_per_minute,
+                available=None if self.requests_per_minute is None else max(self._tokens, 0.0),
+                paused_for=max(self._paused_until - now, 0.0),
+                throttled=self.throttled,
+            )
+
+
+class RateLimiter:
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: Optional[Dict[str, float]] = None,
+        max_retries: int = 5,
+        default_retry_after: float = 1.0,
+        max_retry_after: float = 300.0,
+    ):
+        """Paces API calls per endpoint family and waits on 429 responses instead of failing
+
+        Each endpoint family (users_read, users_write, groups_read, groups_write,
+        service_provider_configs, others) has its own token bucket.
+        When Slack responds with 429 Too Many Requests, the family is paused for the Retry-After seconds
+        and the request is sent again. When a response has X-RateLimit-Remaining: 0,
+        the family is paused until X-RateLimit-Reset so that the next request doesn't hit the limit.
+
+        :param requests_per_minute: the pace for each endpoint family such as {"users_write": 180};
+            families not given here are sent without pacing until Slack asks to wait
+        :param max_retries: the maximum number of times a request is sent again after 429 responses
+        :param default_retry_after: the seconds to wait when a 429 response has no valid Retry-After header
+        :param max_retry_after: the upper limit of the seconds to wait for a 429 response
+        """
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+        self.max_retry_after = max_retry_after
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        for family, rpm in (requests_per_minute or {}).items():
+            self._buckets[family] = TokenBucket(requests_per_minute=rpm)
+
+    def __repr__(self):
+        d: dict = {
+            "requests_per_minute": {f: b.requests_per_minute for f, b in self._buckets.items()},
+            "max_retries": self.max_retries,
+        }
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    def bucket(self, family: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(family)
+            if bucket is None:
+                bucket = TokenBucket()
+                self._buckets[family] = bucket
+            return bucket
+
+    def set_requests_per_minute(self, family: str, requests_per_minute: Optional[float]):
+        """Changes the pace for an endpoint family; None removes the pacing"""
+        self.bucket(family).set_rate(requests_per_minute)
+
+    def acquire(self, family: str) -> float:
+        """Waits until a request for the endpoint family can be sent
+
+        :return: the number of seconds spent waiting
+        """
+        return self.bucket(family).acquire()
+
+    def on_response(self, family: str, status: int, headers) -> Optional[float]:
+        """Updates the state with a response
+
+        :param family: the endpoint family of the request
+        :param status: HTTP status code
+        :param headers: the response headers
+        :return: the seconds to wait before retrying if the request was rate limited, otherwise None
+        """
+        bucket = self.bucket(family)
+        if status == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After") if headers else None)
+            if retry_after is None:
+                retry_after = self.default_retry_after
+            retry_after = min(retry_after, self.max_retry_after)
+            with bucket._lock:
+                bucket.throttled += 1
+            bucket.pause(retry_after)
+            self._logger.info(f"Rate limited on {family}; pausing the requests for {retry_after} seconds")
+            return retry_after
+        if headers:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining is not None and reset is not None:
+                try:
+                    if int(remaining) <= 0:
+                        reset_value = float(reset)
+                        # Either an epoch time or the number of seconds until the reset
+                        wait = reset_value - time.time() if reset_value > 1_000_000_000 else reset_value
+                        if wait > 0:
+                            bucket.pause(min(wait, self.max_retry_after))
+                except ValueError:
+                    pass
+        return None
+
+    def budget(self, family: str) -> RateLimitBudget:
+        """Returns the current budget of an endpoint family"""
+        return self.bucket(family).budget(family)
+
+    def budgets(self) -> Dict[str, RateLimitBudget]:
+        """Returns the current budgets of all the endpoint families used so far"""
+        with self._lock:
+            families = list(self._buckets.keys())
+        return {family: self.budget(family) for family in families}
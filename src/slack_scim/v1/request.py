@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional
 
 
 class SCIMRequest():
@@ -12,6 +12,7 @@ class SCIMRequest():
         body_params: Dict[str, str] = dict(),
         json_body: Dict = dict(),
         headers: Dict[str, str] = dict(),
+        raw_body: Optional[bytes] = None,
     ):
         self.token = token
         self.http_method = http_method
@@ -20,6 +21,8 @@ class SCIMRequest():
         self.query_params = query_params
         self.body_params = body_params
         self.json_body = json_body
+        # A pre-encoded JSON body sent instead of json_body
+        self.raw_body = raw_body
 
     def to_dict(self) -> dict:
         return {
@@ -30,6 +33,7 @@ class SCIMRequest():
             "query_params": self.query_params,
             "body_params": self.body_params,
             "json_body": self.json_body,
+            "raw_body": self.raw_body,
         }
 
     def to_printable_dict(self) -> dict:
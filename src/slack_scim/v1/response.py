@@ -1,4 +1,8 @@
-from typing import Dict
+from typing import Any, Dict, Optional
+
+from .json_codec import JSONCodec, default_codec
+
+_UNPARSED = object()
 
 
 class SCIMResponse():
@@ -8,12 +12,71 @@ class SCIMResponse():
         status: int,
         reason: str,
         headers: Dict[str, str],
-        body: str,
+        body: Optional[str] = None,
+        stream: Optional[Any] = None,
+        raw_body: Optional[bytes] = None,
+        charset: str = "utf-8",
+        json_codec: Optional[JSONCodec] = None,
     ):
+        """An API response
+
+        The body is kept as received; body (text) and json are decoded only when they are accessed,
+        and then cached. Forwarding raw_body as-is costs neither decoding nor parsing.
+
+        :param status: HTTP status code
+        :param reason: HTTP reason phrase
+        :param headers: the response headers
+        :param body: the body as text, if it has already been decoded
+        :param stream: the unread response body to receive incrementally, such as a PooledResponse
+        :param raw_body: the body as received
+        :param charset: the charset of raw_body
+        :param json_codec: the codec parsing the body for json
+        """
         self.status = status
         self.reason = reason
         self.headers = headers
-        self.body = body
+        self.stream = stream
+        self.charset = charset
+        self.json_codec = json_codec
+        self._body = body
+        self._raw_body = raw_body
+        self._json = _UNPARSED
+
+    @property
+    def raw_body(self) -> Optional[bytes]:
+        """The body bytes as received"""
+        if self._raw_body is None and self._body is not None:
+            self._raw_body = self._body.encode(self.charset)
+        return self._raw_body
+
+    @property
+    def body(self) -> Optional[str]:
+        """The body decoded as text"""
+        if self._body is None and self._raw_body:
+            self._body = self._raw_body.decode(self.charset)
+        return self._body
+
+    @body.setter
+    def body(self, body: Optional[str]):
+        """Replaces the body; raw_body and json are derived from the new one"""
+        self._body = body
+        self._raw_body = None
+        self._json = _UNPARSED
+
+    @property
+    def json(self) -> Any:
+        """The body parsed as JSON, None if the body is empty"""
+        if self._json is _UNPARSED:
+            self._json = self._parse_json()
+        return self._json
+
+    def _parse_json(self) -> Any:
+        # Returns a new object every time; the client uses it not to share dicts
+        # among the callers receiving the same cached or coalesced response.
+        # UTF-8 bytes are parsed directly, skipping the decoding into text
+        utf8 = self.charset.lower().replace("-", "") == "utf8"
+        data = self._raw_body if utf8 and self._raw_body is not None else self.body
+        return (self.json_codec or default_codec()).loads(data) if data else None
 
     def is_success(self) -> bool:
         return self.status < 300
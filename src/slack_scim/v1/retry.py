@@ -0,0 +1,190 @@
+import random
+import socket
+import threading
+import time
+from http.client import HTTPException
+from typing import Callable, Iterable, Optional
+
+# Network level errors that are worth another try
+_TRANSIENT_ERRORS = (ConnectionError, socket.timeout, TimeoutError, HTTPException)
+
+
+class RetryStats:
+    def __init__(
+        self,
+        *,
+        requests: int = 0,
+        retries: int = 0,
+        retried_errors: int = 0,
+        retried_statuses: int = 0,
+        exhausted: int = 0,
+        denied_by_budget: int = 0,
+    ):
+        """Counters describing how a RetryPolicy has been used so far
+
+        :param requests: the number of requests (excluding retries)
+        :param retries: the number of retries
+        :param retried_errors: the number of retries for network errors such as connection resets
+        :param retried_statuses: the number of retries for retryable HTTP statuses such as 503
+        :param exhausted: the number of requests that failed after max_retries retries
+        :param denied_by_budget: the number of retries not performed because the retry budget ran out
+        """
+        self.requests = requests
+        self.retries = retries
+        self.retried_errors = retried_errors
+        self.retried_statuses = retried_statuses
+        self.exhausted = exhausted
+        self.denied_by_budget = denied_by_budget
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["requests"] = self.requests
+        result["retries"] = self.retries
+        result["retried_errors"] = self.retried_errors
+        result["retried_statuses"] = self.retried_statuses
+        result["exhausted"] = self.exhausted
+        result["denied_by_budget"] = self.denied_by_budget
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retryable_methods: Iterable[str] = ("GET", "PUT", "DELETE"),
+        retryable_statuses: Iterable[int] = (500, 502, 503, 504),
+        budget_ratio: float = 0.2,
+        budget_min_retries: float = 10.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Decides whether a failed API call is sent again and how long to wait before that
+
+        Only requests with retryable methods are retried. GET, PUT and DELETE are idempotent in the SCIM API,
+        while POST and PATCH requests may be applied twice when the first response has been lost.
+        Add them to retryable_methods only if your app can deal with that.
+
+        The wait time before the n-th retry is a random value between 0 and
+        min(backoff_max, backoff_base * 2 ** (n - 1)) seconds (exponential backoff with full jitter).
+
+        To avoid retry storms during outages, retries are limited by a budget:
+        every request adds budget_ratio to the budget, and every retry consumes 1 from it.
+        The budget starts with budget_min_retries and never exceeds it,
+        so in the long run the retries are capped at budget_ratio of the requests.
+
+        :param max_retries: the maximum number of retries for a request
+        :param backoff_base: the base of exponential backoff in seconds
+        :param backoff_max: the maximum wait time before a retry in seconds
+        :param retryable_methods: the HTTP methods that can be safely sent again
+        :param retryable_statuses: the HTTP statuses considered as transient failures
+        :param budget_ratio: the share of the requests that can be retried
+        :param budget_min_retries: the retries allowed before enough requests have been made to earn them,
+            which is also the capacity of the budget
+        :param sleep: the function to wait with; mainly for testing
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retryable_methods = {m.upper() for m in retryable_methods}
+        self.retryable_statuses = set(retryable_statuses)
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._budget: float = budget_min_retries
+        self._stats = RetryStats()
+
+    def __repr__(self):
+        d: dict = {
+            "max_retries": self.max_retries,
+            "backoff_base": self.backoff_base,
+            "backoff_max": self.backoff_max,
+            "retryable_methods": sorted(self.retryable_methods),
+            "retryable_statuses": sorted(self.retryable_statuses),
+            "budget_ratio": self.budget_ratio,
+        }
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    @property
+    def stats(self) -> RetryStats:
+        """Returns a snapshot of the counters"""
+        with self._lock:
+            return RetryStats(**self._stats.to_dict())
+
+    @property
+    def budget(self) -> float:
+        """The number of retries currently allowed by the retry budget"""
+        with self._lock:
+            return self._budget
+
+    def on_request(self):
+        """Records a new request (not a retry) and adds its share to the budget"""
+        with self._lock:
+            self._stats.requests += 1
+            self._budget = min(self._budget + self.budget_ratio, self.budget_min_retries)
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        return isinstance(error, _TRANSIENT_ERRORS)
+
+    def is_retryable_status(self, status: int) -> bool:
+        return status in self.retryable_statuses
+
+    def backoff(self, retry_count: int) -> float:
+        """Returns the seconds to wait before the given retry (1 for the first retry)"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (retry_count - 1)))
+        return random.uniform(0, ceiling)
+
+    def should_retry(
+        self,
+        *,
+        http_method: str,
+        retry_count: int,
+        error: Optional[Exception] = None,
+        status: Optional[int] = None,
+    ) -> bool:
+        """Decides whether a failed request should be sent again, and consumes the budget if so
+
+        :param http_method: the HTTP method of the request
+        :param retry_count: the number of retries already made for the request
+        :param error: the exception raised while sending the request
+        :param status: the HTTP status of the response
+        :return: True if the request should be retried
+        """
+        if error is not None:
+            if not self.is_retryable_error(error):
+                return False
+        elif status is None or not self.is_retryable_status(status):
+            return False
+        if http_method.upper() not in self.retryable_methods:
+            return False
+        with self._lock:
+            if retry_count >= self.max_retries:
+                self._stats.exhausted += 1
+                return False
+            if self._budget < 1:
+                self._stats.denied_by_budget += 1
+                return False
+            self._budget -= 1
+            self._stats.retries += 1
+            if error is not None:
+                self._stats.retried_errors += 1
+            else:
+                self._stats.retried_statuses += 1
+        return True
+
+    def wait(self, retry_count: int) -> float:
+        """Waits before the given retry (1 for the first retry)
+
+        :return: the number of seconds spent waiting
+        """
+        duration = self.backoff(retry_count)
+        self.sleep(duration)
+        return duration
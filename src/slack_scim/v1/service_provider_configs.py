@@ -1,3 +1,6 @@
+# This code is generated by generate_response_classes.py from json-schema/v1/ServiceProviderConfigs.json
+# Don't edit this file manually.
+#
 # To use this code, make sure you
 #
 #     import json
@@ -8,6 +11,8 @@
 
 from typing import Optional, Any, List, TypeVar, Callable, Type, cast
 
+from .lazy_list import LazyList
+
 
 T = TypeVar("T")
 
@@ -52,6 +57,14 @@ def to_class(c: Type[T], x: Any) -> dict:
 
 
 class AuthenticationScheme:
+    __slots__ = (
+        "description",
+        "name",
+        "primary",
+        "spec_url",
+        "type",
+    )
+
     description: Optional[str]
     name: Optional[str]
     primary: Optional[bool]
@@ -68,24 +81,45 @@ class AuthenticationScheme:
     @staticmethod
     def from_dict(obj: Any) -> 'AuthenticationScheme':
         assert isinstance(obj, dict)
-        description = from_union([from_str, from_none], obj.get("description"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        primary = from_union([from_bool, from_none], obj.get("primary"))
-        spec_url = from_union([from_str, from_none], obj.get("specUrl"))
-        type = from_union([from_str, from_none], obj.get("type"))
+        description = obj.get("description")
+        assert description is None or isinstance(description, str)
+        name = obj.get("name")
+        assert name is None or isinstance(name, str)
+        primary = obj.get("primary")
+        assert primary is None or isinstance(primary, bool)
+        spec_url = obj.get("specUrl")
+        assert spec_url is None or isinstance(spec_url, str)
+        type = obj.get("type")
+        assert type is None or isinstance(type, str)
         return AuthenticationScheme(description, name, primary, spec_url, type)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["description"] = from_union([from_str, from_none], self.description)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["primary"] = from_union([from_bool, from_none], self.primary)
-        result["specUrl"] = from_union([from_str, from_none], self.spec_url)
-        result["type"] = from_union([from_str, from_none], self.type)
-        return result
+        description = self.description
+        assert description is None or isinstance(description, str)
+        name = self.name
+        assert name is None or isinstance(name, str)
+        primary = self.primary
+        assert primary is None or isinstance(primary, bool)
+        spec_url = self.spec_url
+        assert spec_url is None or isinstance(spec_url, str)
+        type = self.type
+        assert type is None or isinstance(type, str)
+        return {
+            "description": description,
+            "name": name,
+            "primary": primary,
+            "specUrl": spec_url,
+            "type": type,
+        }
 
 
 class Bulk:
+    __slots__ = (
+        "max_operations",
+        "max_payload_size",
+        "supported",
+    )
+
     max_operations: Optional[int]
     max_payload_size: Optional[int]
     supported: Optional[bool]
@@ -98,20 +132,33 @@ class Bulk:
     @staticmethod
     def from_dict(obj: Any) -> 'Bulk':
         assert isinstance(obj, dict)
-        max_operations = from_union([from_int, from_none], obj.get("maxOperations"))
-        max_payload_size = from_union([from_int, from_none], obj.get("maxPayloadSize"))
-        supported = from_union([from_bool, from_none], obj.get("supported"))
+        max_operations = obj.get("maxOperations")
+        assert max_operations is None or isinstance(max_operations, int) and not isinstance(max_operations, bool)
+        max_payload_size = obj.get("maxPayloadSize")
+        assert max_payload_size is None or isinstance(max_payload_size, int) and not isinstance(max_payload_size, bool)
+        supported = obj.get("supported")
+        assert supported is None or isinstance(supported, bool)
         return Bulk(max_operations, max_payload_size, supported)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["maxOperations"] = from_union([from_int, from_none], self.max_operations)
-        result["maxPayloadSize"] = from_union([from_int, from_none], self.max_payload_size)
-        result["supported"] = from_union([from_bool, from_none], self.supported)
-        return result
+        max_operations = self.max_operations
+        assert max_operations is None or isinstance(max_operations, int) and not isinstance(max_operations, bool)
+        max_payload_size = self.max_payload_size
+        assert max_payload_size is None or isinstance(max_payload_size, int) and not isinstance(max_payload_size, bool)
+        supported = self.supported
+        assert supported is None or isinstance(supported, bool)
+        return {
+            "maxOperations": max_operations,
+            "maxPayloadSize": max_payload_size,
+            "supported": supported,
+        }
 
 
 class ChangePassword:
+    __slots__ = (
+        "supported",
+    )
+
     supported: Optional[bool]
 
     def __init__(self, supported: Optional[bool]) -> None:
@@ -120,16 +167,24 @@ class ChangePassword:
     @staticmethod
     def from_dict(obj: Any) -> 'ChangePassword':
         assert isinstance(obj, dict)
-        supported = from_union([from_bool, from_none], obj.get("supported"))
+        supported = obj.get("supported")
+        assert supported is None or isinstance(supported, bool)
         return ChangePassword(supported)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["supported"] = from_union([from_bool, from_none], self.supported)
-        return result
+        supported = self.supported
+        assert supported is None or isinstance(supported, bool)
+        return {
+            "supported": supported,
+        }
 
 
 class Filter:
+    __slots__ = (
+        "max_results",
+        "supported",
+    )
+
     max_results: Optional[int]
     supported: Optional[bool]
 
@@ -140,18 +195,35 @@ class Filter:
     @staticmethod
     def from_dict(obj: Any) -> 'Filter':
         assert isinstance(obj, dict)
-        max_results = from_union([from_int, from_none], obj.get("maxResults"))
-        supported = from_union([from_bool, from_none], obj.get("supported"))
+        max_results = obj.get("maxResults")
+        assert max_results is None or isinstance(max_results, int) and not isinstance(max_results, bool)
+        supported = obj.get("supported")
+        assert supported is None or isinstance(supported, bool)
         return Filter(max_results, supported)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["maxResults"] = from_union([from_int, from_none], self.max_results)
-        result["supported"] = from_union([from_bool, from_none], self.supported)
-        return result
+        max_results = self.max_results
+        assert max_results is None or isinstance(max_results, int) and not isinstance(max_results, bool)
+        supported = self.supported
+        assert supported is None or isinstance(supported, bool)
+        return {
+            "maxResults": max_results,
+            "supported": supported,
+        }
 
 
 class ServiceProviderConfigs:
+    __slots__ = (
+        "authentication_schemes",
+        "bulk",
+        "change_password",
+        "etag",
+        "filter",
+        "patch",
+        "sort",
+        "xml_data_format",
+    )
+
     authentication_schemes: Optional[List[AuthenticationScheme]]
     bulk: Optional[Bulk]
     change_password: Optional[ChangePassword]
@@ -172,29 +244,82 @@ class ServiceProviderConfigs:
         self.xml_data_format = xml_data_format
 
     @staticmethod
-    def from_dict(obj: Any) -> 'ServiceProviderConfigs':
+    def from_dict(obj: Any, lazy: bool = False) -> 'ServiceProviderConfigs':
         assert isinstance(obj, dict)
-        authentication_schemes = from_union([lambda x: from_list(AuthenticationScheme.from_dict, x), from_none], obj.get("authenticationSchemes"))
-        bulk = from_union([Bulk.from_dict, from_none], obj.get("bulk"))
-        change_password = from_union([ChangePassword.from_dict, from_none], obj.get("changePassword"))
-        etag = from_union([ChangePassword.from_dict, from_none], obj.get("etag"))
-        filter = from_union([Filter.from_dict, from_none], obj.get("filter"))
-        patch = from_union([ChangePassword.from_dict, from_none], obj.get("patch"))
-        sort = from_union([ChangePassword.from_dict, from_none], obj.get("sort"))
-        xml_data_format = from_union([ChangePassword.from_dict, from_none], obj.get("xmlDataFormat"))
+        authentication_schemes = obj.get("authenticationSchemes")
+        if authentication_schemes is not None:
+            assert isinstance(authentication_schemes, list)
+            if lazy:
+                authentication_schemes = LazyList(authentication_schemes, AuthenticationScheme.from_dict)
+            else:
+                authentication_schemes = [AuthenticationScheme.from_dict(x) for x in authentication_schemes]
+        bulk = obj.get("bulk")
+        if bulk is not None:
+            bulk = Bulk.from_dict(bulk)
+        change_password = obj.get("changePassword")
+        if change_password is not None:
+            change_password = ChangePassword.from_dict(change_password)
+        etag = obj.get("etag")
+        if etag is not None:
+            etag = ChangePassword.from_dict(etag)
+        filter = obj.get("filter")
+        if filter is not None:
+            filter = Filter.from_dict(filter)
+        patch = obj.get("patch")
+        if patch is not None:
+            patch = ChangePassword.from_dict(patch)
+        sort = obj.get("sort")
+        if sort is not None:
+            sort = ChangePassword.from_dict(sort)
+        xml_data_format = obj.get("xmlDataFormat")
+        if xml_data_format is not None:
+            xml_data_format = ChangePassword.from_dict(xml_data_format)
         return ServiceProviderConfigs(authentication_schemes, bulk, change_password, etag, filter, patch, sort, xml_data_format)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["authenticationSchemes"] = from_union([lambda x: from_list(lambda x: to_class(AuthenticationScheme, x), x), from_none], self.authentication_schemes)
-        result["bulk"] = from_union([lambda x: to_class(Bulk, x), from_none], self.bulk)
-        result["changePassword"] = from_union([lambda x: to_class(ChangePassword, x), from_none], self.change_password)
-        result["etag"] = from_union([lambda x: to_class(ChangePassword, x), from_none], self.etag)
-        result["filter"] = from_union([lambda x: to_class(Filter, x), from_none], self.filter)
-        result["patch"] = from_union([lambda x: to_class(ChangePassword, x), from_none], self.patch)
-        result["sort"] = from_union([lambda x: to_class(ChangePassword, x), from_none], self.sort)
-        result["xmlDataFormat"] = from_union([lambda x: to_class(ChangePassword, x), from_none], self.xml_data_format)
-        return result
+        authentication_schemes = self.authentication_schemes
+        if authentication_schemes is not None:
+            assert isinstance(authentication_schemes, (list, LazyList))
+            assert all(isinstance(x, AuthenticationScheme) for x in authentication_schemes)
+            authentication_schemes = [x.to_dict() for x in authentication_schemes]
+        bulk = self.bulk
+        if bulk is not None:
+            assert isinstance(bulk, Bulk)
+            bulk = bulk.to_dict()
+        change_password = self.change_password
+        if change_password is not None:
+            assert isinstance(change_password, ChangePassword)
+            change_password = change_password.to_dict()
+        etag = self.etag
+        if etag is not None:
+            assert isinstance(etag, ChangePassword)
+            etag = etag.to_dict()
+        filter = self.filter
+        if filter is not None:
+            assert isinstance(filter, Filter)
+            filter = filter.to_dict()
+        patch = self.patch
+        if patch is not None:
+            assert isinstance(patch, ChangePassword)
+            patch = patch.to_dict()
+        sort = self.sort
+        if sort is not None:
+            assert isinstance(sort, ChangePassword)
+            sort = sort.to_dict()
+        xml_data_format = self.xml_data_format
+        if xml_data_format is not None:
+            assert isinstance(xml_data_format, ChangePassword)
+            xml_data_format = xml_data_format.to_dict()
+        return {
+            "authenticationSchemes": authentication_schemes,
+            "bulk": bulk,
+            "changePassword": change_password,
+            "etag": etag,
+            "filter": filter,
+            "patch": patch,
+            "sort": sort,
+            "xmlDataFormat": xml_data_format,
+        }
 
 
 def service_provider_configs_from_dict(s: Any) -> ServiceProviderConfigs:
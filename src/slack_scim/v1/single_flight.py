@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self):
+        """Shares one execution among the concurrent calls with the same key
+
+        While a call is running, the other calls with the same key wait for it and receive its result
+        (or its exception) instead of running again. forget_all() makes the next calls start over,
+        which the clients do after every write so that a read never joins a request sent before the write.
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Runs fn, or waits for the running call with the same key
+
+        :param key: the identity of the call
+        :param fn: the function to run
+        :return: the result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def forget_all(self):
+        """Makes the next calls run again instead of joining the running ones"""
+        with self._lock:
+            self._calls.clear()
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["executed"] = self.executed
+        result["coalesced"] = self.coalesced
+        result["in_flight"] = len(self._calls)
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        """SingleFlight for coroutines running in an event loop"""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaits fn(), or the running call with the same key
+
+        :param key: the identity of the call
+        :param fn: the coroutine function to run
+        :return: the result of fn()
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield() keeps the shared call running when a waiting caller is cancelled
+            return await asyncio.shield(future)
+        self.executed += 1
+        future = asyncio.get_event_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Marks the exception as retrieved when nobody else is waiting for it
+            future.exception()
+            raise
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def forget_all(self):
+        """Makes the next calls run again instead of joining the running ones"""
+        self._calls.clear()
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["executed"] = self.executed
+        result["coalesced"] = self.coalesced
+        result["in_flight"] = len(self._calls)
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
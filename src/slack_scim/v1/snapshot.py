@@ -0,0 +1,192 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .groups import Resource as GroupsResource
+from .users import Resource as UsersResource
+
+
+def _normalize_email(email: str) -> str:
+    return email.strip().casefold()
+
+
+class DirectoryIndexes:
+    def __init__(self):
+        """Hash indexes over users and groups
+
+        The indexes are updated under the lock of their DirectorySnapshot.
+        Reading them doesn't require the lock, as every lookup is a single dict access,
+        and an updated user replaces the previous version before the stale keys are dropped,
+        so a lookup finds either version while it is being updated, never none.
+        """
+        self.users_by_id: Dict[str, UsersResource] = {}
+        self.users_by_user_name: Dict[str, UsersResource] = {}
+        self.users_by_email: Dict[str, UsersResource] = {}
+        self.users_by_external_id: Dict[str, UsersResource] = {}
+        self.groups_by_id: Dict[str, GroupsResource] = {}
+        # The emails indexed as the primary email of someone, which take precedence over secondary ones
+        self._primary_emails: set = set()
+
+    def add_user(self, user: UsersResource):
+        if not user.id:
+            return
+        previous = self.users_by_id.get(user.id)
+        if previous is user:
+            previous = None
+        self.users_by_id[user.id] = user
+        if user.user_name:
+            self.users_by_user_name[user.user_name] = user
+        if user.external_id:
+            self.users_by_external_id[user.external_id] = user
+        for email in user.emails or []:
+            if not email.value:
+                continue
+            key = _normalize_email(email.value)
+            if email.primary:
+                self.users_by_email[key] = user
+                self._primary_emails.add(key)
+            elif previous is not None and self.users_by_email.get(key) is previous:
+                self.users_by_email[key] = user
+                self._primary_emails.discard(key)
+            elif key not in self._primary_emails:
+                self.users_by_email.setdefault(key, user)
+        if previous is not None:
+            # Only the keys the new version doesn't have still refer to the previous one
+            self._remove_keys(previous)
+
+    def remove_user(self, user: UsersResource):
+        if self.users_by_id.get(user.id) is not user:
+            return
+        del self.users_by_id[user.id]
+        self._remove_keys(user)
+
+    def _remove_keys(self, user: UsersResource):
+        for index, key in [
+            (self.users_by_user_name, user.user_name),
+            (self.users_by_external_id, user.external_id),
+        ]:
+            if key and index.get(key) is user:
+                del index[key]
+        for email in user.emails or []:
+            if not email.value:
+                continue
+            key = _normalize_email(email.value)
+            if self.users_by_email.get(key) is user:
+                del self.users_by_email[key]
+                self._primary_emails.discard(key)
+
+    def add_group(self, group: GroupsResource):
+        if group.id:
+            self.groups_by_id[group.id] = group
+
+    def remove_group(self, group: GroupsResource):
+        if self.groups_by_id.get(group.id) is group:
+            del self.groups_by_id[group.id]
+
+
+class DirectorySnapshot:
+    def __init__(
+        self,
+        client: "SCIMClient",  # noqa: F821
+        *,
+        page_size: Optional[int] = None,
+        concurrency: int = 4,
+        load: bool = True,
+    ):
+        """All the users and groups in the organization, held in memory for fast lookups
+
+        The users are indexed by id, userName, externalId and emails (both primary and secondary ones,
+        case-insensitively), and the groups by id. All the lookups are O(1) dict accesses and safe to call
+        from multiple threads, even while the snapshot is being refreshed:
+        refresh() builds new indexes in background and swaps them in at once.
+
+        :param client: the client to fetch the users and groups with
+        :param page_size: the number of resources to fetch in a request
+        :param concurrency: the number of pages fetched in parallel
+        :param load: loads the whole directory immediately if True
+        """
+        self.client = client
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self._lock = threading.RLock()
+        self._indexes = DirectoryIndexes()
+        self.loaded_at: Optional[float] = None
+        if load:
+            self.refresh()
+
+    def __repr__(self):
+        d: dict = {"users": self.user_count, "groups": self.group_count, "loaded_at": self.loaded_at}
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    def refresh(self) -> "DirectorySnapshot":
+        """Loads all the users and groups again and replaces the current indexes
+
+        :return: this snapshot
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack;
+            the current indexes are kept in this case
+        """
+        with self._lock:
+            indexes = DirectoryIndexes()
+            for user in self.client.scan_users(page_size=self.page_size, concurrency=self.concurrency):
+                indexes.add_user(user)
+            for group in self.client.scan_groups(page_size=self.page_size, concurrency=self.concurrency):
+                indexes.add_group(group)
+            self._indexes = indexes
+            self.loaded_at = time.time()
+        return self
+
+    def replace(self, users: Iterable[UsersResource], groups: Iterable[GroupsResource]):
+        """Replaces the whole contents with the given users and groups"""
+        indexes = DirectoryIndexes()
+        for user in users:
+            indexes.add_user(user)
+        for group in groups:
+            indexes.add_group(group)
+        with self._lock:
+            self._indexes = indexes
+            self.loaded_at = time.time()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """The lock serializing the updates; hold it to apply several changes at once"""
+        return self._lock
+
+    @property
+    def indexes(self) -> DirectoryIndexes:
+        return self._indexes
+
+    # ----------------------------------------------
+    # Lookups
+    # ----------------------------------------------
+
+    def user(self, id: str) -> Optional[UsersResource]:
+        return self._indexes.users_by_id.get(id)
+
+    def user_by_user_name(self, user_name: str) -> Optional[UsersResource]:
+        return self._indexes.users_by_user_name.get(user_name)
+
+    def user_by_email(self, email: str) -> Optional[UsersResource]:
+        """Finds a user by their primary or secondary email, ignoring case"""
+        return self._indexes.users_by_email.get(_normalize_email(email))
+
+    def user_by_external_id(self, external_id: str) -> Optional[UsersResource]:
+        return self._indexes.users_by_external_id.get(external_id)
+
+    def group(self, id: str) -> Optional[GroupsResource]:
+        return self._indexes.groups_by_id.get(id)
+
+    @property
+    def users(self) -> List[UsersResource]:
+        return list(self._indexes.users_by_id.values())
+
+    @property
+    def groups(self) -> List[GroupsResource]:
+        return list(self._indexes.groups_by_id.values())
+
+    @property
+    def user_count(self) -> int:
+        return len(self._indexes.users_by_id)
+
+    @property
+    def group_count(self) -> int:
+        return len(self._indexes.groups_by_id)
@@ -0,0 +1,201 @@
+import json
+import re
+from typing import Any, Callable, Generic, Iterator, List, Optional, TypeVar
+
+from .errors import SCIMApiError
+from .json_codec import JSONCodec, default_codec
+from .response import SCIMResponse
+
+T = TypeVar("T")
+
+# The characters changing the structure of a JSON document; everything else is skipped at C speed
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+# The rest of a string literal including its closing quote
+_STRING_END = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+class ResourcesParser:
+    def __init__(self, array_key: str = "Resources", *, loads: Callable[[bytes], Any] = json.loads):
+        """An incremental parser extracting the elements of an array in a JSON object as bytes arrive
+
+        Feed the response body chunk by chunk; every element of the array is returned
+        as a dict as soon as its closing bracket has been received.
+        The other top-level properties are available as header.
+        Only the element being received is buffered, regardless of the size of the array.
+
+        :param array_key: the top-level property holding the array
+        :param loads: the function parsing the JSON of an element
+        """
+        self.array_key = array_key.encode("utf-8")
+        self.loads = loads
+        self.header: Optional[dict] = None
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: Optional[bytes] = None
+        self._in_array = False
+        self._element_start: Optional[int] = None
+        self._done = False
+        # The document without the array elements, parsed as header
+        self._rest = bytearray()
+        self._rest_from = 0
+
+    def feed(self, data: bytes) -> List[dict]:
+        """Parses more bytes of the document
+
+        :param data: the next chunk of the body
+        :return: the elements completed in the chunk
+        """
+        self._buffer += data
+        elements: List[dict] = []
+        buffer = self._buffer
+        while True:
+            if self._in_string:
+                m = _STRING_END.match(buffer, self._pos)
+                if m is None:
+                    # The closing quote, or the character after a backslash, has not arrived yet
+                    break
+                self._in_string = False
+                self._pos = m.end()
+                if self._depth == 1:
+                    self._last_string = bytes(buffer[self._string_start:self._pos - 1])
+                continue
+            m = _STRUCTURE.search(buffer, self._pos)
+            if m is None:
+                self._pos = len(buffer)
+                break
+            c = buffer[m.start()]
+            self._pos = m.end()
+            if c == 0x22:  # "
+                self._in_string = True
+                self._string_start = self._pos
+            elif c == 0x7B or c == 0x5B:  # { [
+                self._depth += 1
+                if self._in_array and self._depth == 3 and c == 0x7B:
+                    self._element_start = m.start()
+                elif self._depth == 2 and c == 0x5B and self._last_string == self.array_key:
+                    self._in_array = True
+                    self._rest += buffer[self._rest_from:self._pos]
+                    # Everything before the array is known; let the caller see totalResults and so on
+                    self.header = self.loads(bytes(self._rest) + b"]}")
+            else:  # } ]
+                self._depth -= 1
+                if self._in_array and self._depth == 2 and c == 0x7D and self._element_start is not None:
+                    elements.append(self.loads(bytes(buffer[self._element_start:self._pos])))
+                    self._element_start = None
+                elif self._in_array and self._depth == 1:
+                    self._in_array = False
+                    self._rest_from = m.start()
+                elif self._depth == 0:
+                    self._done = True
+        self._compact()
+        return elements
+
+    def _compact(self):
+        # Drops the bytes no longer needed so that the buffer holds at most one element
+        keep_from = self._element_start if self._element_start is not None else self._pos
+        if not self._in_array:
+            self._rest += self._buffer[self._rest_from:keep_from]
+            self._rest_from = 0
+        if keep_from > 0:
+            del self._buffer[:keep_from]
+            self._pos -= keep_from
+            self._string_start -= keep_from
+            if self._element_start is not None:
+                self._element_start -= keep_from
+
+    def close(self) -> dict:
+        """Finishes parsing
+
+        :return: the top-level properties with an empty array
+        :raise ValueError: if the document is incomplete
+        """
+        if not self._done:
+            raise ValueError("The JSON document ended unexpectedly")
+        self.header = self.loads(bytes(self._rest))
+        return self.header
+
+
+class ResourceStream(Generic[T]):
+    def __init__(
+        self,
+        response: SCIMResponse,
+        decode: Callable[[dict], T],
+        *,
+        chunk_size: int = 16384,
+        json_codec: Optional[JSONCodec] = None,
+    ):
+        """Resources yielded one by one while a search response is being received
+
+        Iterate over this object to receive the resources. total_results, items_per_page and start_index
+        are available once the beginning of the Resources array has arrived, that is, after the first item.
+        Close the stream (or use it in a with statement) if you stop iterating before the end.
+
+        :param response: the successful API response whose body has not been read yet
+        :param decode: the function converting a resource dict into a model object
+        :param chunk_size: the maximum number of bytes read from the socket at once
+        :param json_codec: the codec parsing the resources
+        """
+        self.response = response
+        self.decode = decode
+        self.chunk_size = chunk_size
+        self.parser = ResourcesParser(loads=(json_codec or default_codec()).loads)
+        self._consumed = False
+
+    @property
+    def header(self) -> Optional[dict]:
+        return self.parser.header
+
+    @property
+    def total_results(self) -> Optional[int]:
+        return self.header.get("totalResults") if self.header else None
+
+    @property
+    def items_per_page(self) -> Optional[int]:
+        return self.header.get("itemsPerPage") if self.header else None
+
+    @property
+    def start_index(self) -> Optional[int]:
+        return self.header.get("startIndex") if self.header else None
+
+    def __iter__(self) -> Iterator[T]:
+        if self._consumed:
+            raise RuntimeError("A ResourceStream can be iterated only once")
+        self._consumed = True
+        body = self.response.stream
+        try:
+            while True:
+                data = body.read(self.chunk_size)
+                if not data:
+                    break
+                for element in self.parser.feed(data):
+                    yield self.decode(element)
+            self.parser.close()
+        finally:
+            body.close()
+
+    def close(self):
+        """Stops receiving the response. The connection is discarded if the body has not been fully read."""
+        self.response.stream.close()
+
+    def __enter__(self) -> "ResourceStream[T]":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        d: dict = {"total_results": self.total_results, "start_index": self.start_index}
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+
+def _to_resource_stream(
+    resp: SCIMResponse,
+    decode: Callable[[Any], T],
+    json_codec: Optional[JSONCodec] = None,
+) -> ResourceStream[T]:
+    if not resp.is_success():
+        raise SCIMApiError.from_response(resp, json_codec)
+    return ResourceStream(resp, decode, json_codec=json_codec)
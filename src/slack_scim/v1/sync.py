@@ -0,0 +1,278 @@
+import logging
+import re
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .errors import SCIMApiError
+from .groups import Resource as GroupsResource
+from .snapshot import DirectoryIndexes, DirectorySnapshot
+from .users import Resource as UsersResource
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parses a timestamp in meta such as 2019-12-14T01:26:43-08:00"""
+    if not value:
+        return None
+    # %z doesn't accept a colon in the offset in Python 3.6
+    normalized = re.sub(r"([+-]\d\d):(\d\d)$", r"\1\2", value.strip().replace("Z", "+0000"))
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z"):
+        try:
+            return datetime.strptime(normalized, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+def _last_changed(resource) -> Tuple[Optional[datetime], Optional[str]]:
+    meta = resource.meta
+    if meta is None:
+        return None, None
+    for value in (meta.last_modified, meta.created):
+        parsed = parse_timestamp(value)
+        if parsed is not None:
+            return parsed, value
+    return None, None
+
+
+class ChangeSet:
+    def __init__(
+        self,
+        *,
+        added_users: List[UsersResource],
+        updated_users: List[UsersResource],
+        removed_users: List[UsersResource],
+        added_groups: List[GroupsResource],
+        updated_groups: List[GroupsResource],
+        removed_groups: List[GroupsResource],
+        reconciled: bool,
+        elapsed: float,
+        updates_covered: bool = True,
+    ):
+        """The changes found by a sync cycle
+
+        :param added_users: the users not seen before
+        :param updated_users: the users whose data changed, in their new state
+        :param removed_users: the users no longer returned by the API, in their last known state
+        :param added_groups: the groups not seen before
+        :param updated_groups: the groups whose data changed, in their new state
+        :param removed_groups: the groups no longer returned by the API, in their last known state
+        :param reconciled: True if the cycle fetched the whole directory, which is required to detect removals
+        :param elapsed: the number of seconds the cycle took
+        :param updates_covered: False if the cycle searched only for new resources, as the API rejected
+            the filters finding the modified ones; updated_users and updated_groups may then miss some
+        """
+        self.added_users = added_users
+        self.updated_users = updated_users
+        self.removed_users = removed_users
+        self.added_groups = added_groups
+        self.updated_groups = updated_groups
+        self.removed_groups = removed_groups
+        self.reconciled = reconciled
+        self.elapsed = elapsed
+        self.updates_covered = updates_covered
+
+    def is_empty(self) -> bool:
+        return not (
+            self.added_users or self.updated_users or self.removed_users
+            or self.added_groups or self.updated_groups or self.removed_groups
+        )
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["added_users"] = [u.id for u in self.added_users]
+        result["updated_users"] = [u.id for u in self.updated_users]
+        result["removed_users"] = [u.id for u in self.removed_users]
+        result["added_groups"] = [g.id for g in self.added_groups]
+        result["updated_groups"] = [g.id for g in self.updated_groups]
+        result["removed_groups"] = [g.id for g in self.removed_groups]
+        result["reconciled"] = self.reconciled
+        result["elapsed"] = self.elapsed
+        result["updates_covered"] = self.updates_covered
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+def _diff(
+    resources: Iterable,
+    existing: Dict[str, object],
+    complete: bool,
+) -> Tuple[list, list, list]:
+    added, updated = [], []
+    seen = set()
+    for resource in resources:
+        if not resource.id or resource.id in seen:
+            # pages fetched in parallel may overlap
+            continue
+        seen.add(resource.id)
+        previous = existing.get(resource.id)
+        if previous is None:
+            added.append(resource)
+        elif previous.to_dict() != resource.to_dict():
+            updated.append(resource)
+    removed = [r for id, r in existing.items() if id not in seen] if complete else []
+    return added, updated, removed
+
+
+class DirectorySync:
+    _logger = logging.getLogger(__name__)
+
+    default_change_filters = (
+        'meta.lastModified ge "{since}"',
+        'meta.created ge "{since}"',
+    )
+
+    def __init__(
+        self,
+        client: "SCIMClient",  # noqa: F821
+        snapshot: Optional[DirectorySnapshot] = None,
+        *,
+        page_size: Optional[int] = None,
+        concurrency: int = 4,
+        reconcile_every: int = 6,
+        change_filters: Sequence[str] = default_change_filters,
+    ):
+        """Keeps a DirectorySnapshot up to date by fetching only what changed since the last cycle
+
+        The first cycle loads the whole directory. The following ones search for the users and groups
+        created or modified since the latest meta.lastModified (or meta.created) seen so far,
+        so that the cost of a cycle depends on the number of changes, not on the size of the directory.
+        Removals can only be detected by fetching everything, which is done every reconcile_every cycles.
+
+        The change filters are tried in order; when the API rejects one with 400 Bad Request,
+        the next one is used from then on. When none of them works, every cycle fetches the whole directory.
+        When only meta.created works, the cycles find the new resources but not the modified ones,
+        which are then found only by reconciliation; updates_covered tells it, and a warning is logged.
+        As the filters use "ge" to never miss a change made in the same second as the checkpoint,
+        the resources returned again without any changes are ignored.
+
+        :param client: the client to fetch the users and groups with
+        :param snapshot: the snapshot to keep up to date; a new empty one is created if absent
+        :param page_size: the number of resources to fetch in a request
+        :param concurrency: the number of pages fetched in parallel
+        :param reconcile_every: the number of cycles between full fetches; 0 disables them after the first cycle
+        :param change_filters: the filter templates selecting the resources changed since {since}
+        """
+        self.client = client
+        self.snapshot = snapshot or DirectorySnapshot(client, page_size=page_size, concurrency=concurrency, load=False)
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.reconcile_every = reconcile_every
+        self.change_filters = list(change_filters)
+        self.cycles = 0
+        self._filter_index: Dict[str, int] = {"users": 0, "groups": 0}
+        self._checkpoints: Dict[str, Tuple[Optional[datetime], Optional[str]]] = {}
+        self._cycles_since_reconciliation = 0
+
+    def __repr__(self):
+        d: dict = {"cycles": self.cycles, "checkpoints": self.checkpoints}
+        return f"<slack_scim.{self.__class__.__name__}: {d}>"
+
+    @property
+    def checkpoints(self) -> Dict[str, Optional[str]]:
+        """The latest change time seen for users and groups"""
+        return {kind: value for kind, (_, value) in self._checkpoints.items()}
+
+    @property
+    def updates_covered(self) -> bool:
+        """False if the incremental cycles find only the new users or groups, not the modified ones"""
+        return self._covers_updates("users") and self._covers_updates("groups")
+
+    def sync(self, *, reconcile: bool = False) -> ChangeSet:
+        """Runs a sync cycle and applies the changes to the snapshot
+
+        :param reconcile: fetches the whole directory in this cycle to detect removals
+        :return: the changes found in this cycle
+        :raise SCIMApiError: When getting an error code with unsuccessful HTTP status from Slack;
+            the snapshot is not changed in this case
+        """
+        started = time.monotonic()
+        with self.snapshot.lock:
+            full = (
+                reconcile
+                or self.cycles == 0
+                or (self.reconcile_every > 0 and self._cycles_since_reconciliation + 1 >= self.reconcile_every)
+            )
+            users, users_complete = self._fetch("users", self.client.scan_users, full)
+            groups, groups_complete = self._fetch("groups", self.client.scan_groups, full)
+
+            # Applied in place, so that a cycle costs as much as its changes; the lookups stay consistent,
+            # as every user is replaced atomically (see DirectoryIndexes)
+            indexes: DirectoryIndexes = self.snapshot.indexes
+            added_users, updated_users, removed_users = _diff(users, indexes.users_by_id, users_complete)
+            added_groups, updated_groups, removed_groups = _diff(groups, indexes.groups_by_id, groups_complete)
+            for user in removed_users:
+                indexes.remove_user(user)
+            for user in added_users + updated_users:
+                indexes.add_user(user)
+            for group in removed_groups:
+                indexes.remove_group(group)
+            for group in added_groups + updated_groups:
+                indexes.add_group(group)
+            self.snapshot.loaded_at = time.time()
+
+            self._advance_checkpoint("users", users)
+            self._advance_checkpoint("groups", groups)
+            self.cycles += 1
+            self._cycles_since_reconciliation = 0 if full else self._cycles_since_reconciliation + 1
+
+        changes = ChangeSet(
+            added_users=added_users,
+            updated_users=updated_users,
+            removed_users=removed_users,
+            added_groups=added_groups,
+            updated_groups=updated_groups,
+            removed_groups=removed_groups,
+            reconciled=users_complete and groups_complete,
+            elapsed=time.monotonic() - started,
+            updates_covered=(
+                (users_complete or self._covers_updates("users"))
+                and (groups_complete or self._covers_updates("groups"))
+            ),
+        )
+        self._logger.debug(f"Directory sync cycle {self.cycles}: {changes}")
+        return changes
+
+    def _scan(self, scan: Callable, filter: Optional[str]) -> list:
+        return list(scan(filter=filter, page_size=self.page_size, concurrency=self.concurrency))
+
+    def _fetch(self, kind: str, scan: Callable, full: bool) -> Tuple[list, bool]:
+        # Returns the resources and whether they are all the existing ones
+        _, since = self._checkpoints.get(kind, (None, None))
+        if full or since is None:
+            return self._scan(scan, None), True
+        while self._filter_index[kind] < len(self.change_filters):
+            template = self.change_filters[self._filter_index[kind]]
+            try:
+                return self._scan(scan, template.format(since=since)), False
+            except SCIMApiError as e:
+                if e.status != 400:
+                    raise
+                self._logger.info(f"The filter {template} is not supported for {kind}: {e.errors}")
+                self._filter_index[kind] += 1
+                if not self._covers_updates(kind):
+                    reconciliation = (
+                        f"every {self.reconcile_every} cycles" if self.reconcile_every > 0 else "sync(reconcile=True)"
+                    )
+                    self._logger.warning(
+                        f"The modified {kind} cannot be searched for; their updates are found only by {reconciliation}"
+                    )
+        return self._scan(scan, None), True
+
+    def _covers_updates(self, kind: str) -> bool:
+        # The filters without meta.lastModified find only the created resources; full scans find everything
+        index = self._filter_index[kind]
+        return index >= len(self.change_filters) or "lastModified" in self.change_filters[index]
+
+    def _advance_checkpoint(self, kind: str, resources: Iterable):
+        latest = self._checkpoints.get(kind, (None, None))
+        for resource in resources:
+            changed = _last_changed(resource)
+            if changed[0] is not None and (latest[0] is None or changed[0] > latest[0]):
+                latest = changed
+        self._checkpoints[kind] = latest
@@ -0,0 +1,81 @@
+from typing import Optional
+
+from .service_provider_configs import ServiceProviderConfigs
+
+
+def _positive(value: Optional[int]) -> Optional[int]:
+    # The server reports 0 for the limits it doesn't announce
+    return value if value is not None and value > 0 else None
+
+
+class ClientTuning:
+    def __init__(
+        self,
+        *,
+        page_size: Optional[int] = None,
+        max_page_size: Optional[int] = None,
+        batch_chunk_size: Optional[int] = None,
+        configs: Optional[ServiceProviderConfigs] = None,
+    ):
+        """The default sizes the client uses when the caller doesn't give them
+
+        All the attributes can be changed at any time to override the tuned values.
+
+        :param page_size: the count value of pagination requests when page_size is not given;
+            None lets the server decide
+        :param max_page_size: the largest count value the server accepts; larger page sizes are reduced to it
+        :param batch_chunk_size: the number of items a batch operation takes from its input ahead of their execution;
+            None means twice the concurrency
+        :param configs: the ServiceProviderConfigs these values were derived from
+        """
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.batch_chunk_size = batch_chunk_size
+        self.configs = configs
+
+    @staticmethod
+    def from_service_provider_configs(
+        configs: Optional[ServiceProviderConfigs],
+        *,
+        page_size: Optional[int] = None,
+        batch_chunk_size: Optional[int] = None,
+    ) -> "ClientTuning":
+        """Derives the sizes from the limits announced by the server
+
+        - filter.maxResults is used as both the default and the largest page size
+        - bulk.maxOperations is used as the batch chunk size if bulk operations are supported
+
+        :param configs: the ServiceProviderConfigs of the server
+        :param page_size: the page size to use when the server doesn't announce filter.maxResults
+        :param batch_chunk_size: the chunk size to use when the server doesn't announce bulk.maxOperations
+        :return: the tuned values
+        """
+        max_results = _positive(configs.filter.max_results) if configs and configs.filter else None
+        bulk = configs.bulk if configs else None
+        max_operations = _positive(bulk.max_operations) if bulk and bulk.supported else None
+        return ClientTuning(
+            page_size=max_results or page_size,
+            max_page_size=max_results,
+            batch_chunk_size=max_operations or batch_chunk_size,
+            configs=configs,
+        )
+
+    def page_size_for(self, page_size: Optional[int]) -> Optional[int]:
+        """Returns the page size to request for the one given by a caller"""
+        page_size = page_size or self.page_size
+        if page_size is not None and self.max_page_size is not None:
+            return min(page_size, self.max_page_size)
+        return page_size
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["page_size"] = self.page_size
+        result["max_page_size"] = self.max_page_size
+        result["batch_chunk_size"] = self.batch_chunk_size
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
@@ -1,3 +1,6 @@
+# This code is generated by generate_response_classes.py from json-schema/v1/User.json
+# Don't edit this file manually.
+#
 # To use this code, make sure you
 #
 #     import json
@@ -6,7 +9,10 @@
 #
 #     result = user_from_dict(json.loads(json_string))
 
-from typing import Optional, Any, List, TypeVar, Type, cast, Callable
+from typing import Optional, Any, List, TypeVar, Callable, Type, cast
+
+from .changes import changed_attributes
+from .lazy_list import LazyList
 
 
 T = TypeVar("T")
@@ -41,17 +47,26 @@ def from_int(x: Any) -> int:
     return x
 
 
-def to_class(c: Type[T], x: Any) -> dict:
-    assert isinstance(x, c)
-    return cast(Any, x).to_dict()
-
-
 def from_list(f: Callable[[Any], T], x: Any) -> List[T]:
     assert isinstance(x, list)
     return [f(y) for y in x]
 
 
+def to_class(c: Type[T], x: Any) -> dict:
+    assert isinstance(x, c)
+    return cast(Any, x).to_dict()
+
+
 class Address:
+    __slots__ = (
+        "country",
+        "locality",
+        "postal_code",
+        "primary",
+        "region",
+        "street_address",
+    )
+
     country: Optional[str]
     locality: Optional[str]
     postal_code: Optional[str]
@@ -70,26 +85,50 @@ class Address:
     @staticmethod
     def from_dict(obj: Any) -> 'Address':
         assert isinstance(obj, dict)
-        country = from_union([from_str, from_none], obj.get("country"))
-        locality = from_union([from_str, from_none], obj.get("locality"))
-        postal_code = from_union([from_str, from_none], obj.get("postalCode"))
-        primary = from_union([from_bool, from_none], obj.get("primary"))
-        region = from_union([from_str, from_none], obj.get("region"))
-        street_address = from_union([from_str, from_none], obj.get("streetAddress"))
+        country = obj.get("country")
+        assert country is None or isinstance(country, str)
+        locality = obj.get("locality")
+        assert locality is None or isinstance(locality, str)
+        postal_code = obj.get("postalCode")
+        assert postal_code is None or isinstance(postal_code, str)
+        primary = obj.get("primary")
+        assert primary is None or isinstance(primary, bool)
+        region = obj.get("region")
+        assert region is None or isinstance(region, str)
+        street_address = obj.get("streetAddress")
+        assert street_address is None or isinstance(street_address, str)
         return Address(country, locality, postal_code, primary, region, street_address)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["country"] = from_union([from_str, from_none], self.country)
-        result["locality"] = from_union([from_str, from_none], self.locality)
-        result["postalCode"] = from_union([from_str, from_none], self.postal_code)
-        result["primary"] = from_union([from_bool, from_none], self.primary)
-        result["region"] = from_union([from_str, from_none], self.region)
-        result["streetAddress"] = from_union([from_str, from_none], self.street_address)
-        return result
+        country = self.country
+        assert country is None or isinstance(country, str)
+        locality = self.locality
+        assert locality is None or isinstance(locality, str)
+        postal_code = self.postal_code
+        assert postal_code is None or isinstance(postal_code, str)
+        primary = self.primary
+        assert primary is None or isinstance(primary, bool)
+        region = self.region
+        assert region is None or isinstance(region, str)
+        street_address = self.street_address
+        assert street_address is None or isinstance(street_address, str)
+        return {
+            "country": country,
+            "locality": locality,
+            "postalCode": postal_code,
+            "primary": primary,
+            "region": region,
+            "streetAddress": street_address,
+        }
 
 
 class Email:
+    __slots__ = (
+        "primary",
+        "type",
+        "value",
+    )
+
     primary: Optional[bool]
     type: Optional[str]
     value: Optional[str]
@@ -102,20 +141,34 @@ class Email:
     @staticmethod
     def from_dict(obj: Any) -> 'Email':
         assert isinstance(obj, dict)
-        primary = from_union([from_bool, from_none], obj.get("primary"))
-        type = from_union([from_str, from_none], obj.get("type"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        primary = obj.get("primary")
+        assert primary is None or isinstance(primary, bool)
+        type = obj.get("type")
+        assert type is None or isinstance(type, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Email(primary, type, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["primary"] = from_union([from_bool, from_none], self.primary)
-        result["type"] = from_union([from_str, from_none], self.type)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
+        primary = self.primary
+        assert primary is None or isinstance(primary, bool)
+        type = self.type
+        assert type is None or isinstance(type, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "primary": primary,
+            "type": type,
+            "value": value,
+        }
 
 
 class Errors:
+    __slots__ = (
+        "code",
+        "description",
+    )
+
     code: Optional[int]
     description: Optional[str]
 
@@ -126,18 +179,29 @@ class Errors:
     @staticmethod
     def from_dict(obj: Any) -> 'Errors':
         assert isinstance(obj, dict)
-        code = from_union([from_int, from_none], obj.get("code"))
-        description = from_union([from_str, from_none], obj.get("description"))
+        code = obj.get("code")
+        assert code is None or isinstance(code, int) and not isinstance(code, bool)
+        description = obj.get("description")
+        assert description is None or isinstance(description, str)
         return Errors(code, description)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["code"] = from_union([from_int, from_none], self.code)
-        result["description"] = from_union([from_str, from_none], self.description)
-        return result
+        code = self.code
+        assert code is None or isinstance(code, int) and not isinstance(code, bool)
+        description = self.description
+        assert description is None or isinstance(description, str)
+        return {
+            "code": code,
+            "description": description,
+        }
 
 
 class Group:
+    __slots__ = (
+        "display",
+        "value",
+    )
+
     display: Optional[str]
     value: Optional[str]
 
@@ -148,40 +212,85 @@ class Group:
     @staticmethod
     def from_dict(obj: Any) -> 'Group':
         assert isinstance(obj, dict)
-        display = from_union([from_str, from_none], obj.get("display"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        display = obj.get("display")
+        assert display is None or isinstance(display, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Group(display, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["display"] = from_union([from_str, from_none], self.display)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
+        display = self.display
+        assert display is None or isinstance(display, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "display": display,
+            "value": value,
+        }
+
+
+class Manager:
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'Manager':
+        assert isinstance(obj, dict)
+        return Manager()
+
+    def to_dict(self) -> dict:
+        return {}
 
 
 class Meta:
+    __slots__ = (
+        "created",
+        "location",
+        "last_modified",
+    )
+
     created: Optional[str]
     location: Optional[str]
+    last_modified: Optional[str]
 
-    def __init__(self, created: Optional[str], location: Optional[str]) -> None:
+    def __init__(self, created: Optional[str], location: Optional[str], last_modified: Optional[str] = None) -> None:
         self.created = created
         self.location = location
+        self.last_modified = last_modified
 
     @staticmethod
     def from_dict(obj: Any) -> 'Meta':
         assert isinstance(obj, dict)
-        created = from_union([from_str, from_none], obj.get("created"))
-        location = from_union([from_str, from_none], obj.get("location"))
-        return Meta(created, location)
+        created = obj.get("created")
+        assert created is None or isinstance(created, str)
+        location = obj.get("location")
+        assert location is None or isinstance(location, str)
+        last_modified = obj.get("lastModified")
+        assert last_modified is None or isinstance(last_modified, str)
+        return Meta(created, location, last_modified)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["created"] = from_union([from_str, from_none], self.created)
-        result["location"] = from_union([from_str, from_none], self.location)
-        return result
+        created = self.created
+        assert created is None or isinstance(created, str)
+        location = self.location
+        assert location is None or isinstance(location, str)
+        last_modified = self.last_modified
+        assert last_modified is None or isinstance(last_modified, str)
+        return {
+            "created": created,
+            "location": location,
+            "lastModified": last_modified,
+        }
 
 
 class Name:
+    __slots__ = (
+        "family_name",
+        "given_name",
+    )
+
     family_name: Optional[str]
     given_name: Optional[str]
 
@@ -192,18 +301,29 @@ class Name:
     @staticmethod
     def from_dict(obj: Any) -> 'Name':
         assert isinstance(obj, dict)
-        family_name = from_union([from_str, from_none], obj.get("familyName"))
-        given_name = from_union([from_str, from_none], obj.get("givenName"))
+        family_name = obj.get("familyName")
+        assert family_name is None or isinstance(family_name, str)
+        given_name = obj.get("givenName")
+        assert given_name is None or isinstance(given_name, str)
         return Name(family_name, given_name)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["familyName"] = from_union([from_str, from_none], self.family_name)
-        result["givenName"] = from_union([from_str, from_none], self.given_name)
-        return result
+        family_name = self.family_name
+        assert family_name is None or isinstance(family_name, str)
+        given_name = self.given_name
+        assert given_name is None or isinstance(given_name, str)
+        return {
+            "familyName": family_name,
+            "givenName": given_name,
+        }
 
 
 class Photo:
+    __slots__ = (
+        "type",
+        "value",
+    )
+
     type: Optional[str]
     value: Optional[str]
 
@@ -214,34 +334,28 @@ class Photo:
     @staticmethod
     def from_dict(obj: Any) -> 'Photo':
         assert isinstance(obj, dict)
-        type = from_union([from_str, from_none], obj.get("type"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        type = obj.get("type")
+        assert type is None or isinstance(type, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Photo(type, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["type"] = from_union([from_str, from_none], self.type)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
-
-
-class Manager:
-    pass
-
-    def __init__(self, ) -> None:
-        pass
-
-    @staticmethod
-    def from_dict(obj: Any) -> 'Manager':
-        assert isinstance(obj, dict)
-        return Manager()
-
-    def to_dict(self) -> dict:
-        result: dict = {}
-        return result
+        type = self.type
+        assert type is None or isinstance(type, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "type": type,
+            "value": value,
+        }
 
 
 class UrnScimSchemasExtensionEnterprise10:
+    __slots__ = (
+        "manager",
+    )
+
     manager: Optional[Manager]
 
     def __init__(self, manager: Optional[Manager]) -> None:
@@ -250,16 +364,46 @@ class UrnScimSchemasExtensionEnterprise10:
     @staticmethod
     def from_dict(obj: Any) -> 'UrnScimSchemasExtensionEnterprise10':
         assert isinstance(obj, dict)
-        manager = from_union([Manager.from_dict, from_none], obj.get("manager"))
+        manager = obj.get("manager")
+        if manager is not None:
+            manager = Manager.from_dict(manager)
         return UrnScimSchemasExtensionEnterprise10(manager)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["manager"] = from_union([lambda x: to_class(Manager, x), from_none], self.manager)
-        return result
+        manager = self.manager
+        if manager is not None:
+            assert isinstance(manager, Manager)
+            manager = manager.to_dict()
+        return {
+            "manager": manager,
+        }
 
 
 class User:
+    __slots__ = (
+        "active",
+        "addresses",
+        "display_name",
+        "emails",
+        "errors",
+        "external_id",
+        "groups",
+        "id",
+        "meta",
+        "name",
+        "nick_name",
+        "phone_numbers",
+        "photos",
+        "profile_url",
+        "roles",
+        "schemas",
+        "timezone",
+        "title",
+        "urn_scim_schemas_extension_enterprise_10",
+        "user_name",
+        "_original",
+    )
+
     active: Optional[bool]
     addresses: Optional[List[Address]]
     display_name: Optional[str]
@@ -302,55 +446,191 @@ class User:
         self.title = title
         self.urn_scim_schemas_extension_enterprise_10 = urn_scim_schemas_extension_enterprise_10
         self.user_name = user_name
+        self._original: Optional[dict] = None
 
     @staticmethod
-    def from_dict(obj: Any) -> 'User':
+    def from_dict(obj: Any, lazy: bool = False) -> 'User':
         assert isinstance(obj, dict)
-        active = from_union([from_bool, from_none], obj.get("active"))
-        addresses = from_union([lambda x: from_list(Address.from_dict, x), from_none], obj.get("addresses"))
-        display_name = from_union([from_str, from_none], obj.get("displayName"))
-        emails = from_union([lambda x: from_list(Email.from_dict, x), from_none], obj.get("emails"))
-        errors = from_union([Errors.from_dict, from_none], obj.get("Errors"))
-        external_id = from_union([from_str, from_none], obj.get("externalId"))
-        groups = from_union([lambda x: from_list(Group.from_dict, x), from_none], obj.get("groups"))
-        id = from_union([from_str, from_none], obj.get("id"))
-        meta = from_union([Meta.from_dict, from_none], obj.get("meta"))
-        name = from_union([Name.from_dict, from_none], obj.get("name"))
-        nick_name = from_union([from_str, from_none], obj.get("nickName"))
-        phone_numbers = from_union([lambda x: from_list(Email.from_dict, x), from_none], obj.get("phoneNumbers"))
-        photos = from_union([lambda x: from_list(Photo.from_dict, x), from_none], obj.get("photos"))
-        profile_url = from_union([from_str, from_none], obj.get("profileUrl"))
-        roles = from_union([lambda x: from_list(Email.from_dict, x), from_none], obj.get("roles"))
-        schemas = from_union([lambda x: from_list(from_str, x), from_none], obj.get("schemas"))
-        timezone = from_union([from_str, from_none], obj.get("timezone"))
-        title = from_union([from_str, from_none], obj.get("title"))
-        urn_scim_schemas_extension_enterprise_10 = from_union([UrnScimSchemasExtensionEnterprise10.from_dict, from_none], obj.get("urn:scim:schemas:extension:enterprise:1.0"))
-        user_name = from_union([from_str, from_none], obj.get("userName"))
+        active = obj.get("active")
+        assert active is None or isinstance(active, bool)
+        addresses = obj.get("addresses")
+        if addresses is not None:
+            assert isinstance(addresses, list)
+            if lazy:
+                addresses = LazyList(addresses, Address.from_dict)
+            else:
+                addresses = [Address.from_dict(x) for x in addresses]
+        display_name = obj.get("displayName")
+        assert display_name is None or isinstance(display_name, str)
+        emails = obj.get("emails")
+        if emails is not None:
+            assert isinstance(emails, list)
+            if lazy:
+                emails = LazyList(emails, Email.from_dict)
+            else:
+                emails = [Email.from_dict(x) for x in emails]
+        errors = obj.get("Errors")
+        if errors is not None:
+            errors = Errors.from_dict(errors)
+        external_id = obj.get("externalId")
+        assert external_id is None or isinstance(external_id, str)
+        groups = obj.get("groups")
+        if groups is not None:
+            assert isinstance(groups, list)
+            if lazy:
+                groups = LazyList(groups, Group.from_dict)
+            else:
+                groups = [Group.from_dict(x) for x in groups]
+        id = obj.get("id")
+        assert id is None or isinstance(id, str)
+        meta = obj.get("meta")
+        if meta is not None:
+            meta = Meta.from_dict(meta)
+        name = obj.get("name")
+        if name is not None:
+            name = Name.from_dict(name)
+        nick_name = obj.get("nickName")
+        assert nick_name is None or isinstance(nick_name, str)
+        phone_numbers = obj.get("phoneNumbers")
+        if phone_numbers is not None:
+            assert isinstance(phone_numbers, list)
+            if lazy:
+                phone_numbers = LazyList(phone_numbers, Email.from_dict)
+            else:
+                phone_numbers = [Email.from_dict(x) for x in phone_numbers]
+        photos = obj.get("photos")
+        if photos is not None:
+            assert isinstance(photos, list)
+            if lazy:
+                photos = LazyList(photos, Photo.from_dict)
+            else:
+                photos = [Photo.from_dict(x) for x in photos]
+        profile_url = obj.get("profileUrl")
+        assert profile_url is None or isinstance(profile_url, str)
+        roles = obj.get("roles")
+        if roles is not None:
+            assert isinstance(roles, list)
+            if lazy:
+                roles = LazyList(roles, Email.from_dict)
+            else:
+                roles = [Email.from_dict(x) for x in roles]
+        schemas = obj.get("schemas")
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        timezone = obj.get("timezone")
+        assert timezone is None or isinstance(timezone, str)
+        title = obj.get("title")
+        assert title is None or isinstance(title, str)
+        urn_scim_schemas_extension_enterprise_10 = obj.get("urn:scim:schemas:extension:enterprise:1.0")
+        if urn_scim_schemas_extension_enterprise_10 is not None:
+            urn_scim_schemas_extension_enterprise_10 = UrnScimSchemasExtensionEnterprise10.from_dict(urn_scim_schemas_extension_enterprise_10)
+        user_name = obj.get("userName")
+        assert user_name is None or isinstance(user_name, str)
         return User(active, addresses, display_name, emails, errors, external_id, groups, id, meta, name, nick_name, phone_numbers, photos, profile_url, roles, schemas, timezone, title, urn_scim_schemas_extension_enterprise_10, user_name)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["active"] = from_union([from_bool, from_none], self.active)
-        result["addresses"] = from_union([lambda x: from_list(lambda x: to_class(Address, x), x), from_none], self.addresses)
-        result["displayName"] = from_union([from_str, from_none], self.display_name)
-        result["emails"] = from_union([lambda x: from_list(lambda x: to_class(Email, x), x), from_none], self.emails)
-        result["Errors"] = from_union([lambda x: to_class(Errors, x), from_none], self.errors)
-        result["externalId"] = from_union([from_str, from_none], self.external_id)
-        result["groups"] = from_union([lambda x: from_list(lambda x: to_class(Group, x), x), from_none], self.groups)
-        result["id"] = from_union([from_str, from_none], self.id)
-        result["meta"] = from_union([lambda x: to_class(Meta, x), from_none], self.meta)
-        result["name"] = from_union([lambda x: to_class(Name, x), from_none], self.name)
-        result["nickName"] = from_union([from_str, from_none], self.nick_name)
-        result["phoneNumbers"] = from_union([lambda x: from_list(lambda x: to_class(Email, x), x), from_none], self.phone_numbers)
-        result["photos"] = from_union([lambda x: from_list(lambda x: to_class(Photo, x), x), from_none], self.photos)
-        result["profileUrl"] = from_union([from_str, from_none], self.profile_url)
-        result["roles"] = from_union([lambda x: from_list(lambda x: to_class(Email, x), x), from_none], self.roles)
-        result["schemas"] = from_union([lambda x: from_list(from_str, x), from_none], self.schemas)
-        result["timezone"] = from_union([from_str, from_none], self.timezone)
-        result["title"] = from_union([from_str, from_none], self.title)
-        result["urn:scim:schemas:extension:enterprise:1.0"] = from_union([lambda x: to_class(UrnScimSchemasExtensionEnterprise10, x), from_none], self.urn_scim_schemas_extension_enterprise_10)
-        result["userName"] = from_union([from_str, from_none], self.user_name)
-        return result
+        active = self.active
+        assert active is None or isinstance(active, bool)
+        addresses = self.addresses
+        if addresses is not None:
+            assert isinstance(addresses, (list, LazyList))
+            assert all(isinstance(x, Address) for x in addresses)
+            addresses = [x.to_dict() for x in addresses]
+        display_name = self.display_name
+        assert display_name is None or isinstance(display_name, str)
+        emails = self.emails
+        if emails is not None:
+            assert isinstance(emails, (list, LazyList))
+            assert all(isinstance(x, Email) for x in emails)
+            emails = [x.to_dict() for x in emails]
+        errors = self.errors
+        if errors is not None:
+            assert isinstance(errors, Errors)
+            errors = errors.to_dict()
+        external_id = self.external_id
+        assert external_id is None or isinstance(external_id, str)
+        groups = self.groups
+        if groups is not None:
+            assert isinstance(groups, (list, LazyList))
+            assert all(isinstance(x, Group) for x in groups)
+            groups = [x.to_dict() for x in groups]
+        id = self.id
+        assert id is None or isinstance(id, str)
+        meta = self.meta
+        if meta is not None:
+            assert isinstance(meta, Meta)
+            meta = meta.to_dict()
+        name = self.name
+        if name is not None:
+            assert isinstance(name, Name)
+            name = name.to_dict()
+        nick_name = self.nick_name
+        assert nick_name is None or isinstance(nick_name, str)
+        phone_numbers = self.phone_numbers
+        if phone_numbers is not None:
+            assert isinstance(phone_numbers, (list, LazyList))
+            assert all(isinstance(x, Email) for x in phone_numbers)
+            phone_numbers = [x.to_dict() for x in phone_numbers]
+        photos = self.photos
+        if photos is not None:
+            assert isinstance(photos, (list, LazyList))
+            assert all(isinstance(x, Photo) for x in photos)
+            photos = [x.to_dict() for x in photos]
+        profile_url = self.profile_url
+        assert profile_url is None or isinstance(profile_url, str)
+        roles = self.roles
+        if roles is not None:
+            assert isinstance(roles, (list, LazyList))
+            assert all(isinstance(x, Email) for x in roles)
+            roles = [x.to_dict() for x in roles]
+        schemas = self.schemas
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        timezone = self.timezone
+        assert timezone is None or isinstance(timezone, str)
+        title = self.title
+        assert title is None or isinstance(title, str)
+        urn_scim_schemas_extension_enterprise_10 = self.urn_scim_schemas_extension_enterprise_10
+        if urn_scim_schemas_extension_enterprise_10 is not None:
+            assert isinstance(urn_scim_schemas_extension_enterprise_10, UrnScimSchemasExtensionEnterprise10)
+            urn_scim_schemas_extension_enterprise_10 = urn_scim_schemas_extension_enterprise_10.to_dict()
+        user_name = self.user_name
+        assert user_name is None or isinstance(user_name, str)
+        return {
+            "active": active,
+            "addresses": addresses,
+            "displayName": display_name,
+            "emails": emails,
+            "Errors": errors,
+            "externalId": external_id,
+            "groups": groups,
+            "id": id,
+            "meta": meta,
+            "name": name,
+            "nickName": nick_name,
+            "phoneNumbers": phone_numbers,
+            "photos": photos,
+            "profileUrl": profile_url,
+            "roles": roles,
+            "schemas": schemas,
+            "timezone": timezone,
+            "title": title,
+            "urn:scim:schemas:extension:enterprise:1.0": urn_scim_schemas_extension_enterprise_10,
+            "userName": user_name,
+        }
+
+    def changed_attributes(self) -> Optional[List[str]]:
+        """Returns the JSON names of the attributes changed since this object was returned by the client
+
+        None is returned for the objects not returned by the client, such as the ones built with from_dict.
+        """
+        if self._original is None:
+            return None
+        return changed_attributes(self._original, self.to_dict())
 
 
 def user_from_dict(s: Any) -> User:
@@ -1,3 +1,6 @@
+# This code is generated by generate_response_classes.py from json-schema/v1/Users.json
+# Don't edit this file manually.
+#
 # To use this code, make sure you
 #
 #     import json
@@ -8,12 +11,14 @@
 
 from typing import Optional, Any, List, TypeVar, Callable, Type, cast
 
+from .lazy_list import LazyList
+
 
 T = TypeVar("T")
 
 
-def from_int(x: Any) -> int:
-    assert isinstance(x, int) and not isinstance(x, bool)
+def from_str(x: Any) -> str:
+    assert isinstance(x, str)
     return x
 
 
@@ -31,13 +36,13 @@ def from_union(fs, x):
     assert False
 
 
-def from_str(x: Any) -> str:
-    assert isinstance(x, str)
+def from_bool(x: Any) -> bool:
+    assert isinstance(x, bool)
     return x
 
 
-def from_bool(x: Any) -> bool:
-    assert isinstance(x, bool)
+def from_int(x: Any) -> int:
+    assert isinstance(x, int) and not isinstance(x, bool)
     return x
 
 
@@ -51,29 +56,16 @@ def to_class(c: Type[T], x: Any) -> dict:
     return cast(Any, x).to_dict()
 
 
-class Errors:
-    code: Optional[int]
-    description: Optional[str]
-
-    def __init__(self, code: Optional[int], description: Optional[str]) -> None:
-        self.code = code
-        self.description = description
-
-    @staticmethod
-    def from_dict(obj: Any) -> 'Errors':
-        assert isinstance(obj, dict)
-        code = from_union([from_int, from_none], obj.get("code"))
-        description = from_union([from_str, from_none], obj.get("description"))
-        return Errors(code, description)
-
-    def to_dict(self) -> dict:
-        result: dict = {}
-        result["code"] = from_union([from_int, from_none], self.code)
-        result["description"] = from_union([from_str, from_none], self.description)
-        return result
-
-
 class Address:
+    __slots__ = (
+        "country",
+        "locality",
+        "postal_code",
+        "primary",
+        "region",
+        "street_address",
+    )
+
     country: Optional[str]
     locality: Optional[str]
     postal_code: Optional[str]
@@ -92,26 +84,50 @@ class Address:
     @staticmethod
     def from_dict(obj: Any) -> 'Address':
         assert isinstance(obj, dict)
-        country = from_union([from_str, from_none], obj.get("country"))
-        locality = from_union([from_str, from_none], obj.get("locality"))
-        postal_code = from_union([from_str, from_none], obj.get("postalCode"))
-        primary = from_union([from_bool, from_none], obj.get("primary"))
-        region = from_union([from_str, from_none], obj.get("region"))
-        street_address = from_union([from_str, from_none], obj.get("streetAddress"))
+        country = obj.get("country")
+        assert country is None or isinstance(country, str)
+        locality = obj.get("locality")
+        assert locality is None or isinstance(locality, str)
+        postal_code = obj.get("postalCode")
+        assert postal_code is None or isinstance(postal_code, str)
+        primary = obj.get("primary")
+        assert primary is None or isinstance(primary, bool)
+        region = obj.get("region")
+        assert region is None or isinstance(region, str)
+        street_address = obj.get("streetAddress")
+        assert street_address is None or isinstance(street_address, str)
         return Address(country, locality, postal_code, primary, region, street_address)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["country"] = from_union([from_str, from_none], self.country)
-        result["locality"] = from_union([from_str, from_none], self.locality)
-        result["postalCode"] = from_union([from_str, from_none], self.postal_code)
-        result["primary"] = from_union([from_bool, from_none], self.primary)
-        result["region"] = from_union([from_str, from_none], self.region)
-        result["streetAddress"] = from_union([from_str, from_none], self.street_address)
-        return result
+        country = self.country
+        assert country is None or isinstance(country, str)
+        locality = self.locality
+        assert locality is None or isinstance(locality, str)
+        postal_code = self.postal_code
+        assert postal_code is None or isinstance(postal_code, str)
+        primary = self.primary
+        assert primary is None or isinstance(primary, bool)
+        region = self.region
+        assert region is None or isinstance(region, str)
+        street_address = self.street_address
+        assert street_address is None or isinstance(street_address, str)
+        return {
+            "country": country,
+            "locality": locality,
+            "postalCode": postal_code,
+            "primary": primary,
+            "region": region,
+            "streetAddress": street_address,
+        }
 
 
 class Email:
+    __slots__ = (
+        "primary",
+        "type",
+        "value",
+    )
+
     primary: Optional[bool]
     type: Optional[str]
     value: Optional[str]
@@ -124,20 +140,67 @@ class Email:
     @staticmethod
     def from_dict(obj: Any) -> 'Email':
         assert isinstance(obj, dict)
-        primary = from_union([from_bool, from_none], obj.get("primary"))
-        type = from_union([from_str, from_none], obj.get("type"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        primary = obj.get("primary")
+        assert primary is None or isinstance(primary, bool)
+        type = obj.get("type")
+        assert type is None or isinstance(type, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Email(primary, type, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["primary"] = from_union([from_bool, from_none], self.primary)
-        result["type"] = from_union([from_str, from_none], self.type)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
+        primary = self.primary
+        assert primary is None or isinstance(primary, bool)
+        type = self.type
+        assert type is None or isinstance(type, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "primary": primary,
+            "type": type,
+            "value": value,
+        }
+
+
+class Errors:
+    __slots__ = (
+        "code",
+        "description",
+    )
+
+    code: Optional[int]
+    description: Optional[str]
+
+    def __init__(self, code: Optional[int], description: Optional[str]) -> None:
+        self.code = code
+        self.description = description
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'Errors':
+        assert isinstance(obj, dict)
+        code = obj.get("code")
+        assert code is None or isinstance(code, int) and not isinstance(code, bool)
+        description = obj.get("description")
+        assert description is None or isinstance(description, str)
+        return Errors(code, description)
+
+    def to_dict(self) -> dict:
+        code = self.code
+        assert code is None or isinstance(code, int) and not isinstance(code, bool)
+        description = self.description
+        assert description is None or isinstance(description, str)
+        return {
+            "code": code,
+            "description": description,
+        }
 
 
 class Group:
+    __slots__ = (
+        "display",
+        "value",
+    )
+
     display: Optional[str]
     value: Optional[str]
 
@@ -148,40 +211,70 @@ class Group:
     @staticmethod
     def from_dict(obj: Any) -> 'Group':
         assert isinstance(obj, dict)
-        display = from_union([from_str, from_none], obj.get("display"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        display = obj.get("display")
+        assert display is None or isinstance(display, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Group(display, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["display"] = from_union([from_str, from_none], self.display)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
+        display = self.display
+        assert display is None or isinstance(display, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "display": display,
+            "value": value,
+        }
 
 
 class Meta:
+    __slots__ = (
+        "created",
+        "location",
+        "last_modified",
+    )
+
     created: Optional[str]
     location: Optional[str]
+    last_modified: Optional[str]
 
-    def __init__(self, created: Optional[str], location: Optional[str]) -> None:
+    def __init__(self, created: Optional[str], location: Optional[str], last_modified: Optional[str] = None) -> None:
         self.created = created
         self.location = location
+        self.last_modified = last_modified
 
     @staticmethod
     def from_dict(obj: Any) -> 'Meta':
         assert isinstance(obj, dict)
-        created = from_union([from_str, from_none], obj.get("created"))
-        location = from_union([from_str, from_none], obj.get("location"))
-        return Meta(created, location)
+        created = obj.get("created")
+        assert created is None or isinstance(created, str)
+        location = obj.get("location")
+        assert location is None or isinstance(location, str)
+        last_modified = obj.get("lastModified")
+        assert last_modified is None or isinstance(last_modified, str)
+        return Meta(created, location, last_modified)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["created"] = from_union([from_str, from_none], self.created)
-        result["location"] = from_union([from_str, from_none], self.location)
-        return result
+        created = self.created
+        assert created is None or isinstance(created, str)
+        location = self.location
+        assert location is None or isinstance(location, str)
+        last_modified = self.last_modified
+        assert last_modified is None or isinstance(last_modified, str)
+        return {
+            "created": created,
+            "location": location,
+            "lastModified": last_modified,
+        }
 
 
 class Name:
+    __slots__ = (
+        "family_name",
+        "given_name",
+    )
+
     family_name: Optional[str]
     given_name: Optional[str]
 
@@ -192,18 +285,29 @@ class Name:
     @staticmethod
     def from_dict(obj: Any) -> 'Name':
         assert isinstance(obj, dict)
-        family_name = from_union([from_str, from_none], obj.get("familyName"))
-        given_name = from_union([from_str, from_none], obj.get("givenName"))
+        family_name = obj.get("familyName")
+        assert family_name is None or isinstance(family_name, str)
+        given_name = obj.get("givenName")
+        assert given_name is None or isinstance(given_name, str)
         return Name(family_name, given_name)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["familyName"] = from_union([from_str, from_none], self.family_name)
-        result["givenName"] = from_union([from_str, from_none], self.given_name)
-        return result
+        family_name = self.family_name
+        assert family_name is None or isinstance(family_name, str)
+        given_name = self.given_name
+        assert given_name is None or isinstance(given_name, str)
+        return {
+            "familyName": family_name,
+            "givenName": given_name,
+        }
 
 
 class Photo:
+    __slots__ = (
+        "type",
+        "value",
+    )
+
     type: Optional[str]
     value: Optional[str]
 
@@ -214,18 +318,45 @@ class Photo:
     @staticmethod
     def from_dict(obj: Any) -> 'Photo':
         assert isinstance(obj, dict)
-        type = from_union([from_str, from_none], obj.get("type"))
-        value = from_union([from_str, from_none], obj.get("value"))
+        type = obj.get("type")
+        assert type is None or isinstance(type, str)
+        value = obj.get("value")
+        assert value is None or isinstance(value, str)
         return Photo(type, value)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["type"] = from_union([from_str, from_none], self.type)
-        result["value"] = from_union([from_str, from_none], self.value)
-        return result
+        type = self.type
+        assert type is None or isinstance(type, str)
+        value = self.value
+        assert value is None or isinstance(value, str)
+        return {
+            "type": type,
+            "value": value,
+        }
 
 
 class Resource:
+    __slots__ = (
+        "active",
+        "addresses",
+        "display_name",
+        "emails",
+        "external_id",
+        "groups",
+        "id",
+        "meta",
+        "name",
+        "nick_name",
+        "phone_numbers",
+        "photos",
+        "profile_url",
+        "roles",
+        "schemas",
+        "timezone",
+        "title",
+        "user_name",
+    )
+
     active: Optional[bool]
     addresses: Optional[List[Address]]
     display_name: Optional[str]
@@ -266,52 +397,175 @@ class Resource:
         self.user_name = user_name
 
     @staticmethod
-    def from_dict(obj: Any) -> 'Resource':
+    def from_dict(obj: Any, lazy: bool = False) -> 'Resource':
         assert isinstance(obj, dict)
-        active = from_union([from_bool, from_none], obj.get("active"))
-        addresses = from_union([lambda x: from_list(Address.from_dict, x), from_none], obj.get("addresses"))
-        display_name = from_union([from_str, from_none], obj.get("displayName"))
-        emails = from_union([lambda x: from_list(Email.from_dict, x), from_none], obj.get("emails"))
-        external_id = from_union([from_str, from_none], obj.get("externalId"))
-        groups = from_union([lambda x: from_list(Group.from_dict, x), from_none], obj.get("groups"))
-        id = from_union([from_str, from_none], obj.get("id"))
-        meta = from_union([Meta.from_dict, from_none], obj.get("meta"))
-        name = from_union([Name.from_dict, from_none], obj.get("name"))
-        nick_name = from_union([from_str, from_none], obj.get("nickName"))
-        phone_numbers = from_union([lambda x: from_list(Email.from_dict, x), from_none], obj.get("phoneNumbers"))
-        photos = from_union([lambda x: from_list(Photo.from_dict, x), from_none], obj.get("photos"))
-        profile_url = from_union([from_str, from_none], obj.get("profileUrl"))
-        roles = from_union([lambda x: from_list(Email.from_dict, x), from_none], obj.get("roles"))
-        schemas = from_union([lambda x: from_list(from_str, x), from_none], obj.get("schemas"))
-        timezone = from_union([from_str, from_none], obj.get("timezone"))
-        title = from_union([from_str, from_none], obj.get("title"))
-        user_name = from_union([from_str, from_none], obj.get("userName"))
+        active = obj.get("active")
+        assert active is None or isinstance(active, bool)
+        addresses = obj.get("addresses")
+        if addresses is not None:
+            assert isinstance(addresses, list)
+            if lazy:
+                addresses = LazyList(addresses, Address.from_dict)
+            else:
+                addresses = [Address.from_dict(x) for x in addresses]
+        display_name = obj.get("displayName")
+        assert display_name is None or isinstance(display_name, str)
+        emails = obj.get("emails")
+        if emails is not None:
+            assert isinstance(emails, list)
+            if lazy:
+                emails = LazyList(emails, Email.from_dict)
+            else:
+                emails = [Email.from_dict(x) for x in emails]
+        external_id = obj.get("externalId")
+        assert external_id is None or isinstance(external_id, str)
+        groups = obj.get("groups")
+        if groups is not None:
+            assert isinstance(groups, list)
+            if lazy:
+                groups = LazyList(groups, Group.from_dict)
+            else:
+                groups = [Group.from_dict(x) for x in groups]
+        id = obj.get("id")
+        assert id is None or isinstance(id, str)
+        meta = obj.get("meta")
+        if meta is not None:
+            meta = Meta.from_dict(meta)
+        name = obj.get("name")
+        if name is not None:
+            name = Name.from_dict(name)
+        nick_name = obj.get("nickName")
+        assert nick_name is None or isinstance(nick_name, str)
+        phone_numbers = obj.get("phoneNumbers")
+        if phone_numbers is not None:
+            assert isinstance(phone_numbers, list)
+            if lazy:
+                phone_numbers = LazyList(phone_numbers, Email.from_dict)
+            else:
+                phone_numbers = [Email.from_dict(x) for x in phone_numbers]
+        photos = obj.get("photos")
+        if photos is not None:
+            assert isinstance(photos, list)
+            if lazy:
+                photos = LazyList(photos, Photo.from_dict)
+            else:
+                photos = [Photo.from_dict(x) for x in photos]
+        profile_url = obj.get("profileUrl")
+        assert profile_url is None or isinstance(profile_url, str)
+        roles = obj.get("roles")
+        if roles is not None:
+            assert isinstance(roles, list)
+            if lazy:
+                roles = LazyList(roles, Email.from_dict)
+            else:
+                roles = [Email.from_dict(x) for x in roles]
+        schemas = obj.get("schemas")
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        timezone = obj.get("timezone")
+        assert timezone is None or isinstance(timezone, str)
+        title = obj.get("title")
+        assert title is None or isinstance(title, str)
+        user_name = obj.get("userName")
+        assert user_name is None or isinstance(user_name, str)
         return Resource(active, addresses, display_name, emails, external_id, groups, id, meta, name, nick_name, phone_numbers, photos, profile_url, roles, schemas, timezone, title, user_name)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["active"] = from_union([from_bool, from_none], self.active)
-        result["addresses"] = from_union([lambda x: from_list(lambda x: to_class(Address, x), x), from_none], self.addresses)
-        result["displayName"] = from_union([from_str, from_none], self.display_name)
-        result["emails"] = from_union([lambda x: from_list(lambda x: to_class(Email, x), x), from_none], self.emails)
-        result["externalId"] = from_union([from_str, from_none], self.external_id)
-        result["groups"] = from_union([lambda x: from_list(lambda x: to_class(Group, x), x), from_none], self.groups)
-        result["id"] = from_union([from_str, from_none], self.id)
-        result["meta"] = from_union([lambda x: to_class(Meta, x), from_none], self.meta)
-        result["name"] = from_union([lambda x: to_class(Name, x), from_none], self.name)
-        result["nickName"] = from_union([from_str, from_none], self.nick_name)
-        result["phoneNumbers"] = from_union([lambda x: from_list(lambda x: to_class(Email, x), x), from_none], self.phone_numbers)
-        result["photos"] = from_union([lambda x: from_list(lambda x: to_class(Photo, x), x), from_none], self.photos)
-        result["profileUrl"] = from_union([from_str, from_none], self.profile_url)
-        result["roles"] = from_union([lambda x: from_list(lambda x: to_class(Email, x), x), from_none], self.roles)
-        result["schemas"] = from_union([lambda x: from_list(from_str, x), from_none], self.schemas)
-        result["timezone"] = from_union([from_str, from_none], self.timezone)
-        result["title"] = from_union([from_str, from_none], self.title)
-        result["userName"] = from_union([from_str, from_none], self.user_name)
-        return result
+        active = self.active
+        assert active is None or isinstance(active, bool)
+        addresses = self.addresses
+        if addresses is not None:
+            assert isinstance(addresses, (list, LazyList))
+            assert all(isinstance(x, Address) for x in addresses)
+            addresses = [x.to_dict() for x in addresses]
+        display_name = self.display_name
+        assert display_name is None or isinstance(display_name, str)
+        emails = self.emails
+        if emails is not None:
+            assert isinstance(emails, (list, LazyList))
+            assert all(isinstance(x, Email) for x in emails)
+            emails = [x.to_dict() for x in emails]
+        external_id = self.external_id
+        assert external_id is None or isinstance(external_id, str)
+        groups = self.groups
+        if groups is not None:
+            assert isinstance(groups, (list, LazyList))
+            assert all(isinstance(x, Group) for x in groups)
+            groups = [x.to_dict() for x in groups]
+        id = self.id
+        assert id is None or isinstance(id, str)
+        meta = self.meta
+        if meta is not None:
+            assert isinstance(meta, Meta)
+            meta = meta.to_dict()
+        name = self.name
+        if name is not None:
+            assert isinstance(name, Name)
+            name = name.to_dict()
+        nick_name = self.nick_name
+        assert nick_name is None or isinstance(nick_name, str)
+        phone_numbers = self.phone_numbers
+        if phone_numbers is not None:
+            assert isinstance(phone_numbers, (list, LazyList))
+            assert all(isinstance(x, Email) for x in phone_numbers)
+            phone_numbers = [x.to_dict() for x in phone_numbers]
+        photos = self.photos
+        if photos is not None:
+            assert isinstance(photos, (list, LazyList))
+            assert all(isinstance(x, Photo) for x in photos)
+            photos = [x.to_dict() for x in photos]
+        profile_url = self.profile_url
+        assert profile_url is None or isinstance(profile_url, str)
+        roles = self.roles
+        if roles is not None:
+            assert isinstance(roles, (list, LazyList))
+            assert all(isinstance(x, Email) for x in roles)
+            roles = [x.to_dict() for x in roles]
+        schemas = self.schemas
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        timezone = self.timezone
+        assert timezone is None or isinstance(timezone, str)
+        title = self.title
+        assert title is None or isinstance(title, str)
+        user_name = self.user_name
+        assert user_name is None or isinstance(user_name, str)
+        return {
+            "active": active,
+            "addresses": addresses,
+            "displayName": display_name,
+            "emails": emails,
+            "externalId": external_id,
+            "groups": groups,
+            "id": id,
+            "meta": meta,
+            "name": name,
+            "nickName": nick_name,
+            "phoneNumbers": phone_numbers,
+            "photos": photos,
+            "profileUrl": profile_url,
+            "roles": roles,
+            "schemas": schemas,
+            "timezone": timezone,
+            "title": title,
+            "userName": user_name,
+        }
 
 
 class Users:
+    __slots__ = (
+        "errors",
+        "items_per_page",
+        "resources",
+        "schemas",
+        "start_index",
+        "total_results",
+    )
+
     errors: Optional[Errors]
     items_per_page: Optional[int]
     resources: Optional[List[Resource]]
@@ -328,25 +582,60 @@ class Users:
         self.total_results = total_results
 
     @staticmethod
-    def from_dict(obj: Any) -> 'Users':
+    def from_dict(obj: Any, lazy: bool = False) -> 'Users':
         assert isinstance(obj, dict)
-        errors = from_union([Errors.from_dict, from_none], obj.get("Errors"))
-        items_per_page = from_union([from_int, from_none], obj.get("itemsPerPage"))
-        resources = from_union([lambda x: from_list(Resource.from_dict, x), from_none], obj.get("Resources"))
-        schemas = from_union([lambda x: from_list(from_str, x), from_none], obj.get("schemas"))
-        start_index = from_union([from_int, from_none], obj.get("startIndex"))
-        total_results = from_union([from_int, from_none], obj.get("totalResults"))
+        errors = obj.get("Errors")
+        if errors is not None:
+            errors = Errors.from_dict(errors)
+        items_per_page = obj.get("itemsPerPage")
+        assert items_per_page is None or isinstance(items_per_page, int) and not isinstance(items_per_page, bool)
+        resources = obj.get("Resources")
+        if resources is not None:
+            assert isinstance(resources, list)
+            if lazy:
+                resources = LazyList(resources, lambda x: Resource.from_dict(x, True))
+            else:
+                resources = [Resource.from_dict(x) for x in resources]
+        schemas = obj.get("schemas")
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        start_index = obj.get("startIndex")
+        assert start_index is None or isinstance(start_index, int) and not isinstance(start_index, bool)
+        total_results = obj.get("totalResults")
+        assert total_results is None or isinstance(total_results, int) and not isinstance(total_results, bool)
         return Users(errors, items_per_page, resources, schemas, start_index, total_results)
 
     def to_dict(self) -> dict:
-        result: dict = {}
-        result["Errors"] = from_union([lambda x: to_class(Errors, x), from_none], self.errors)
-        result["itemsPerPage"] = from_union([from_int, from_none], self.items_per_page)
-        result["Resources"] = from_union([lambda x: from_list(lambda x: to_class(Resource, x), x), from_none], self.resources)
-        result["schemas"] = from_union([lambda x: from_list(from_str, x), from_none], self.schemas)
-        result["startIndex"] = from_union([from_int, from_none], self.start_index)
-        result["totalResults"] = from_union([from_int, from_none], self.total_results)
-        return result
+        errors = self.errors
+        if errors is not None:
+            assert isinstance(errors, Errors)
+            errors = errors.to_dict()
+        items_per_page = self.items_per_page
+        assert items_per_page is None or isinstance(items_per_page, int) and not isinstance(items_per_page, bool)
+        resources = self.resources
+        if resources is not None:
+            assert isinstance(resources, (list, LazyList))
+            assert all(isinstance(x, Resource) for x in resources)
+            resources = [x.to_dict() for x in resources]
+        schemas = self.schemas
+        if schemas is not None:
+            assert isinstance(schemas, list)
+            assert all(isinstance(x, str) for x in schemas)
+            schemas = list(schemas)
+        start_index = self.start_index
+        assert start_index is None or isinstance(start_index, int) and not isinstance(start_index, bool)
+        total_results = self.total_results
+        assert total_results is None or isinstance(total_results, int) and not isinstance(total_results, bool)
+        return {
+            "Errors": errors,
+            "itemsPerPage": items_per_page,
+            "Resources": resources,
+            "schemas": schemas,
+            "startIndex": start_index,
+            "totalResults": total_results,
+        }
 
 
 def users_from_dict(s: Any) -> Users:
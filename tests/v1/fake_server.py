@@ -0,0 +1,784 @@
+"""A stateful fake of the Slack SCIM API for offline load and resilience testing
+
+Unlike mock_server, which replays fixture files, FakeSCIMServer keeps users and groups in memory,
+so that they can be created, searched, paginated, patched and deleted like on the real server:
+
+    with FakeSCIMServer(latency=lognormal(0.05, 0.5), rate_limit=20) as server:
+        server.directory.add_users(10000)
+        client = SCIMClient(token="xoxp-fake", base_url=server.url)
+        print(len(list(client.scan_users(page_size=1000))))
+        print(server.stats)
+"""
+import gzip
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlparse
+
+from slack_scim.v1.instrumentation import endpoint_template
+
+SCHEMAS = ["urn:scim:schemas:core:1.0", "urn:scim:schemas:extension:enterprise:1.0"]
+
+# A latency distribution returns the seconds to wait for a request, drawing from the given random generator
+Latency = Callable[[random.Random], float]
+
+
+def constant(seconds: float) -> Latency:
+    return lambda r: seconds
+
+
+def uniform(low: float, high: float) -> Latency:
+    return lambda r: r.uniform(low, high)
+
+
+def exponential(mean: float) -> Latency:
+    return lambda r: r.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+
+def lognormal(median: float, sigma: float) -> Latency:
+    """A long-tailed distribution typical of API latencies; about 1% of the values exceed median * e^(2.33 sigma)"""
+    return lambda r: r.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+
+
+class FakeSCIMError(Exception):
+    def __init__(self, status: int, description: str):
+        super().__init__(description)
+        self.status = status
+        self.description = description
+
+
+# ----------------------------------------------
+# Filters
+# ----------------------------------------------
+
+_TOKEN = re.compile(r'\s*(\(|\)|"(?:[^"\\]|\\.)*"|[^\s()]+)')
+_OPERATORS = {"eq", "ne", "co", "sw", "ew", "pr", "gt", "ge", "lt", "le"}
+
+
+def _tokenize(filter: str) -> List[str]:
+    tokens, position = [], 0
+    filter = filter.strip()
+    while position < len(filter):
+        match = _TOKEN.match(filter, position)
+        if match is None:
+            raise FakeSCIMError(400, f"Invalid filter: {filter}")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+def _literal(token: str) -> Any:
+    if token.startswith('"'):
+        return json.loads(token)
+    lowered = token.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if lowered == "null":
+        return None
+    try:
+        return float(token) if "." in token else int(token)
+    except ValueError:
+        raise FakeSCIMError(400, f"Invalid filter value: {token}")
+
+
+def _attribute_values(resource: Any, path: List[str]) -> List[Any]:
+    # Resolves a dotted attribute path case-insensitively; multi-valued attributes match any of their items
+    if not path:
+        return resource if isinstance(resource, list) else [resource]
+    if isinstance(resource, list):
+        return [v for item in resource for v in _attribute_values(item, path)]
+    if not isinstance(resource, dict):
+        return []
+    name = path[0].lower()
+    for key, value in resource.items():
+        if key.lower() == name:
+            return _attribute_values(value, path[1:])
+    return []
+
+
+def _compare(operator: str, actual: Any, expected: Any) -> bool:
+    if isinstance(actual, str) and isinstance(expected, str):
+        actual, expected = actual.lower(), expected.lower()
+    if operator == "eq":
+        return actual == expected
+    if operator == "ne":
+        return actual != expected
+    if operator in ("co", "sw", "ew"):
+        if not isinstance(actual, str) or not isinstance(expected, str):
+            return False
+        if operator == "co":
+            return expected in actual
+        return actual.startswith(expected) if operator == "sw" else actual.endswith(expected)
+    try:
+        if operator == "gt":
+            return actual > expected
+        if operator == "ge":
+            return actual >= expected
+        if operator == "lt":
+            return actual < expected
+        return actual <= expected
+    except TypeError:
+        return False
+
+
+def parse_filter(filter: str) -> Callable[[dict], bool]:
+    """Parses a SCIM filter such as userName eq "alice" and (title co "Engineer" or active eq false)
+
+    :return: a predicate telling whether a resource matches the filter
+    """
+    tokens = _tokenize(filter)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        if position >= len(tokens):
+            raise FakeSCIMError(400, f"Invalid filter: {filter}")
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or() -> Callable[[dict], bool]:
+        terms = [parse_and()]
+        while (peek() or "").lower() == "or":
+            take()
+            terms.append(parse_and())
+        return terms[0] if len(terms) == 1 else lambda r: any(t(r) for t in terms)
+
+    def parse_and() -> Callable[[dict], bool]:
+        factors = [parse_factor()]
+        while (peek() or "").lower() == "and":
+            take()
+            factors.append(parse_factor())
+        return factors[0] if len(factors) == 1 else lambda r: all(f(r) for f in factors)
+
+    def parse_factor() -> Callable[[dict], bool]:
+        token = take()
+        if token == "(":
+            inner = parse_or()
+            if take() != ")":
+                raise FakeSCIMError(400, f"Invalid filter: {filter}")
+            return inner
+        path = token.split(".")
+        operator = take().lower()
+        if operator not in _OPERATORS:
+            raise FakeSCIMError(400, f"Unsupported filter operator: {operator}")
+        if operator == "pr":
+            return lambda r: any(v not in (None, "", [], {}) for v in _attribute_values(r, path))
+        expected = _literal(take())
+        return lambda r: any(_compare(operator, v, expected) for v in _attribute_values(r, path))
+
+    predicate = parse_or()
+    if position != len(tokens):
+        raise FakeSCIMError(400, f"Invalid filter: {filter}")
+    return predicate
+
+
+# ----------------------------------------------
+# Directory
+# ----------------------------------------------
+
+def _apply_patch(resource: dict, patch: dict):
+    # SCIM 1.1 PATCH: the attributes in meta.attributes are removed first, then complex attributes are merged,
+    # multi-valued ones add or replace the items by value and drop those with "operation": "delete"
+    for name in (patch.get("meta") or {}).get("attributes") or []:
+        resource.pop(name, None)
+    for name, value in patch.items():
+        if name in ("schemas", "id", "meta"):
+            continue
+        current = resource.get(name)
+        if isinstance(value, dict) and isinstance(current, dict):
+            current.update(value)
+        elif isinstance(value, list) and all(isinstance(i, dict) and "value" in i for i in value):
+            items = {i["value"]: i for i in current or [] if isinstance(i, dict) and "value" in i}
+            for item in value:
+                if item.get("operation") == "delete":
+                    items.pop(item["value"], None)
+                else:
+                    items[item["value"]] = item
+            resource[name] = list(items.values())
+        else:
+            resource[name] = value
+
+
+class FakeDirectory:
+    def __init__(self, *, base_url: str = "https://api.slack.com/scim/v1"):
+        """The thread-safe in-memory users and groups of a FakeSCIMServer
+
+        Users are never removed; deleting a user deactivates it and removes it from all the groups
+        as the real server does. The groups attribute of users reflects the group memberships.
+
+        :param base_url: the URL used for meta.location
+        """
+        self.base_url = base_url
+        self._lock = threading.Lock()
+        self._users: Dict[str, dict] = {}
+        self._groups: Dict[str, dict] = {}
+        self._user_names: Dict[str, str] = {}
+        self._groups_of_user: Dict[str, Set[str]] = {}
+        self._ids = itertools.count(1)
+        self._names = itertools.count(1)
+
+    @property
+    def user_count(self) -> int:
+        return len(self._users)
+
+    @property
+    def group_count(self) -> int:
+        return len(self._groups)
+
+    def add_users(self, count: int, *, prefix: str = "user") -> List[str]:
+        """Creates users with generated attributes, returning their IDs"""
+        ids = []
+        for _ in range(count):
+            n = next(self._names)
+            ids.append(self.create_user({
+                "userName": f"{prefix}{n}",
+                "displayName": f"User {n}",
+                "name": {"givenName": "Test", "familyName": f"User{n}"},
+                "title": "Engineer",
+                "emails": [{"value": f"{prefix}{n}@example.com", "primary": True}],
+                "active": True,
+            })["id"])
+        return ids
+
+    def add_groups(self, count: int, *, members_per_group: int = 0, prefix: str = "group") -> List[str]:
+        """Creates groups with members chosen from the existing users in order, returning their IDs"""
+        user_ids = list(self._users.keys())
+        ids = []
+        for i in range(count):
+            n = next(self._names)
+            start = (i * members_per_group) % len(user_ids) if user_ids else 0
+            members = [user_ids[(start + j) % len(user_ids)] for j in range(min(members_per_group, len(user_ids)))]
+            ids.append(self.create_group({
+                "displayName": f"{prefix}{n}",
+                "members": [{"value": m} for m in members],
+            })["id"])
+        return ids
+
+    # ----------------------------------------------
+
+    def create_user(self, data: dict) -> dict:
+        user_name = data.get("userName")
+        if not user_name:
+            raise FakeSCIMError(400, "userName is required")
+        with self._lock:
+            if user_name.lower() in self._user_names:
+                raise FakeSCIMError(409, f"userName {user_name} is already taken")
+            id = f"W{next(self._ids):08d}"
+            user = self._new_resource(data, id, "Users")
+            user.setdefault("active", True)
+            self._users[id] = user
+            self._user_names[user_name.lower()] = id
+            return self._render_user(user)
+
+    def read_user(self, id: str) -> dict:
+        with self._lock:
+            return self._render_user(self._user(id))
+
+    def replace_user(self, id: str, data: dict) -> dict:
+        with self._lock:
+            user = self._user(id)
+            replaced = self._new_resource(data, id, "Users", created=user["meta"]["created"])
+            self._rename(user, replaced)
+            self._users[id] = replaced
+            return self._render_user(replaced)
+
+    def patch_user(self, id: str, patch: dict) -> dict:
+        with self._lock:
+            user = self._user(id)
+            patched = json.loads(json.dumps(user))
+            _apply_patch(patched, patch)
+            patched.pop("groups", None)
+            self._rename(user, patched)
+            self._users[id] = patched
+            return self._render_user(patched)
+
+    def delete_user(self, id: str):
+        with self._lock:
+            user = self._user(id)
+            user["active"] = False
+            for group_id in self._groups_of_user.pop(id, set()):
+                group = self._groups[group_id]
+                group["members"] = [m for m in group.get("members") or [] if m.get("value") != id]
+
+    def search_users(self, filter: Optional[str]) -> List[dict]:
+        predicate = parse_filter(filter) if filter else None
+        with self._lock:
+            users = [self._render_user(u) for u in self._users.values()]
+        return [u for u in users if predicate(u)] if predicate else users
+
+    def create_group(self, data: dict) -> dict:
+        if not data.get("displayName"):
+            raise FakeSCIMError(400, "displayName is required")
+        with self._lock:
+            id = f"S{next(self._ids):08d}"
+            group = self._new_resource(data, id, "Groups")
+            group["members"] = self._valid_members(group.get("members"))
+            self._groups[id] = group
+            self._index_members(id, (), group["members"])
+            return json.loads(json.dumps(group))
+
+    def read_group(self, id: str) -> dict:
+        with self._lock:
+            return json.loads(json.dumps(self._group(id)))
+
+    def replace_group(self, id: str, data: dict) -> dict:
+        with self._lock:
+            group = self._group(id)
+            replaced = self._new_resource(data, id, "Groups", created=group["meta"]["created"])
+            replaced["members"] = self._valid_members(replaced.get("members"))
+            self._index_members(id, group.get("members") or [], replaced["members"])
+            self._groups[id] = replaced
+            return json.loads(json.dumps(replaced))
+
+    def patch_group(self, id: str, patch: dict) -> dict:
+        with self._lock:
+            group = self._group(id)
+            patched = json.loads(json.dumps(group))
+            _apply_patch(patched, patch)
+            patched["members"] = self._valid_members(patched.get("members"))
+            self._index_members(id, group.get("members") or [], patched["members"])
+            self._groups[id] = patched
+            return json.loads(json.dumps(patched))
+
+    def delete_group(self, id: str):
+        with self._lock:
+            group = self._group(id)
+            self._index_members(id, group.get("members") or [], ())
+            del self._groups[id]
+
+    def search_groups(self, filter: Optional[str]) -> List[dict]:
+        predicate = parse_filter(filter) if filter else None
+        with self._lock:
+            groups = json.loads(json.dumps(list(self._groups.values())))
+        return [g for g in groups if predicate(g)] if predicate else groups
+
+    # ----------------------------------------------
+
+    def _new_resource(self, data: dict, id: str, kind: str, created: Optional[str] = None) -> dict:
+        resource = json.loads(json.dumps(data))
+        resource["schemas"] = SCHEMAS
+        resource["id"] = id
+        resource["meta"] = {
+            "created": created or datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "location": f"{self.base_url}/{kind}/{id}",
+        }
+        resource.pop("groups", None)
+        return resource
+
+    def _user(self, id: str) -> dict:
+        user = self._users.get(id)
+        if user is None:
+            raise FakeSCIMError(404, "Resource not found")
+        return user
+
+    def _group(self, id: str) -> dict:
+        group = self._groups.get(id)
+        if group is None:
+            raise FakeSCIMError(404, "Resource not found")
+        return group
+
+    def _rename(self, old: dict, new: dict):
+        old_name, new_name = old.get("userName", "").lower(), (new.get("userName") or "").lower()
+        if not new_name:
+            raise FakeSCIMError(400, "userName is required")
+        if new_name != old_name:
+            if new_name in self._user_names:
+                raise FakeSCIMError(409, f"userName {new.get('userName')} is already taken")
+            del self._user_names[old_name]
+            self._user_names[new_name] = new["id"]
+
+    def _valid_members(self, members: Optional[list]) -> list:
+        result, seen = [], set()
+        for member in members or []:
+            value = member.get("value") if isinstance(member, dict) else None
+            if value not in self._users:
+                raise FakeSCIMError(400, f"No such user: {value}")
+            if value not in seen:
+                seen.add(value)
+                result.append({"value": value, "display": self._users[value].get("displayName")})
+        return result
+
+    def _index_members(self, group_id: str, old: Any, new: Any):
+        for member in old:
+            self._groups_of_user.get(member["value"], set()).discard(group_id)
+        for member in new:
+            self._groups_of_user.setdefault(member["value"], set()).add(group_id)
+
+    def _render_user(self, user: dict) -> dict:
+        rendered = json.loads(json.dumps(user))
+        rendered["groups"] = [
+            {"value": group_id, "display": self._groups[group_id].get("displayName")}
+            for group_id in sorted(self._groups_of_user.get(user["id"], ()))
+        ]
+        return rendered
+
+
+# ----------------------------------------------
+# Server
+# ----------------------------------------------
+
+class FakeServerStats:
+    def __init__(
+        self,
+        *,
+        requests: int = 0,
+        connections: int = 0,
+        statuses: Optional[Dict[int, int]] = None,
+        rate_limited: int = 0,
+        injected_errors: int = 0,
+    ):
+        """The numbers of requests handled by a FakeSCIMServer
+
+        :param requests: the number of requests received
+        :param connections: the number of TCP connections accepted; much fewer than requests with keep-alive
+        :param statuses: the number of responses by HTTP status
+        :param rate_limited: the number of 429 responses
+        :param injected_errors: the number of 5xx responses injected
+        """
+        self.requests = requests
+        self.connections = connections
+        self.statuses = statuses or {}
+        self.rate_limited = rate_limited
+        self.injected_errors = injected_errors
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["requests"] = self.requests
+        result["connections"] = self.connections
+        result["statuses"] = dict(self.statuses)
+        result["rate_limited"] = self.rate_limited
+        result["injected_errors"] = self.injected_errors
+        return result
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return f"<slack_scim.{self.__class__.__name__}: {self.to_dict()}>"
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer is not available in Python 3.6
+    daemon_threads = True
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately; avoid delayed ACK stalls on keep-alive connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.fake._count_connection()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.fake._handle(self, "GET")
+
+    def do_POST(self):
+        self.server.fake._handle(self, "POST")
+
+    def do_PUT(self):
+        self.server.fake._handle(self, "PUT")
+
+    def do_PATCH(self):
+        self.server.fake._handle(self, "PATCH")
+
+    def do_DELETE(self):
+        self.server.fake._handle(self, "DELETE")
+
+
+class FakeSCIMServer:
+    def __init__(
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 0,
+        token: Optional[str] = None,
+        latency: Union[None, Latency, Dict[str, Latency]] = None,
+        rate_limit: Optional[float] = None,
+        rate_limited_ratio: float = 0.0,
+        retry_after: int = 1,
+        error_ratio: float = 0.0,
+        error_status: int = 503,
+        default_count: int = 100,
+        max_count: int = 1000,
+        compress: bool = False,
+        seed: Optional[int] = None,
+    ):
+        """A threaded HTTP/1.1 server with keep-alive, serving a FakeDirectory as the Slack SCIM API does
+
+        All the settings can be changed while the server is running.
+
+        :param host: the host to listen on
+        :param port: the port to listen on; 0 picks a free one, which url tells
+        :param token: the only accepted token; any Bearer token is accepted if absent
+        :param latency: the distribution of the delay added to every request, such as lognormal(0.05, 0.5),
+            or a dict of them keyed by method and endpoint such as "GET /Users/{id}", with "*" as the default
+        :param rate_limit: the number of requests per second accepted before responding 429 with Retry-After
+        :param rate_limited_ratio: the probability of responding 429 to any request
+        :param retry_after: the Retry-After seconds of 429 responses
+        :param error_ratio: the probability of responding error_status to any request
+        :param error_status: the status of the injected errors
+        :param default_count: the page size when count is absent
+        :param max_count: the maximum page size
+        :param compress: compresses the response bodies with gzip if the client accepts it
+        :param seed: the seed of the latency and fault injection, for reproducible runs
+        """
+        self.host = host
+        self.port = port
+        self.token = token
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limited_ratio = rate_limited_ratio
+        self.retry_after = retry_after
+        self.error_ratio = error_ratio
+        self.error_status = error_status
+        self.default_count = default_count
+        self.max_count = max_count
+        self.compress = compress
+        self.directory = FakeDirectory()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = FakeServerStats()
+        self._rate_limited_requests = 0
+        self._failing_requests: List[int] = []
+        self._window: Tuple[float, int] = (0.0, 0)
+        self._server: Optional[_ThreadingServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stats(self) -> FakeServerStats:
+        with self._lock:
+            return FakeServerStats(**self._stats.to_dict())
+
+    def inject_rate_limits(self, count: int):
+        """Responds 429 to the next count requests"""
+        with self._lock:
+            self._rate_limited_requests += count
+
+    def inject_errors(self, count: int, status: int = 503):
+        """Responds the given status to the next count requests"""
+        with self._lock:
+            self._failing_requests.extend([status] * count)
+
+    def start(self) -> "FakeSCIMServer":
+        self._server = _ThreadingServer((self.host, self.port), _FakeHandler)
+        self._server.fake = self
+        self.port = self._server.server_address[1]
+        self.directory.base_url = self.url
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    # ----------------------------------------------
+
+    def _count_connection(self):
+        with self._lock:
+            self._stats.connections += 1
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str):
+        parsed = urlparse(handler.path)
+        # The request body is always consumed to keep the connection usable
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length > 0 else b""
+        with self._lock:
+            self._stats.requests += 1
+        delay = self._delay(method, parsed.path)
+        if delay > 0:
+            time.sleep(delay)
+
+        status, headers, payload = self._respond(handler, method, parsed.path, parsed.query, body)
+        data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        if data and self.compress and "gzip" in (handler.headers.get("Accept-Encoding") or ""):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+        with self._lock:
+            self._stats.statuses[status] = self._stats.statuses.get(status, 0) + 1
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Type", "application/json;charset=utf-8")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _delay(self, method: str, path: str) -> float:
+        latency = self.latency
+        if isinstance(latency, dict):
+            latency = latency.get(f"{method} {endpoint_template(path)}") or latency.get("*")
+        if latency is None:
+            return 0.0
+        with self._lock:
+            return max(0.0, latency(self._random))
+
+    def _inject_fault(self) -> Optional[Tuple[int, dict, Optional[dict]]]:
+        with self._lock:
+            error_status = None
+            if self._rate_limited_requests > 0:
+                self._rate_limited_requests -= 1
+                rate_limited = True
+            elif self._failing_requests:
+                error_status = self._failing_requests.pop(0)
+                rate_limited = False
+            else:
+                rate_limited = self._over_rate_limit() or self._random.random() < self.rate_limited_ratio
+                if not rate_limited and self._random.random() < self.error_ratio:
+                    error_status = self.error_status
+            if rate_limited:
+                self._stats.rate_limited += 1
+                return 429, {"Retry-After": str(self.retry_after)}, _error(429, "ratelimited")
+            if error_status is not None:
+                self._stats.injected_errors += 1
+                return error_status, {}, _error(error_status, "Service unavailable")
+        return None
+
+    def _over_rate_limit(self) -> bool:
+        # A fixed one-second window, as Slack counts the requests per minute per workspace
+        if self.rate_limit is None:
+            return False
+        now = time.monotonic()
+        started, count = self._window
+        if now - started >= 1.0:
+            started, count = now, 0
+        count += 1
+        self._window = (started, count)
+        return count > self.rate_limit
+
+    def _respond(
+        self,
+        handler: BaseHTTPRequestHandler,
+        method: str,
+        path: str,
+        query: str,
+        body: bytes,
+    ) -> Tuple[int, dict, Optional[dict]]:
+        authorization = handler.headers.get("Authorization") or ""
+        if not authorization.startswith("Bearer ") or (self.token and authorization != f"Bearer {self.token}"):
+            return 401, {}, _error(401, "invalid_authentication")
+        fault = self._inject_fault()
+        if fault is not None:
+            return fault
+        try:
+            data = json.loads(body) if body else {}
+            return self._route(method, path, parse_qs(query), data)
+        except FakeSCIMError as e:
+            return e.status, {}, _error(e.status, e.description)
+        except ValueError as e:
+            return 400, {}, _error(400, f"Invalid request: {e}")
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, List[str]],
+        data: dict,
+    ) -> Tuple[int, dict, Optional[dict]]:
+        parts = [unquote(p) for p in path.strip("/").split("/")]
+        directory = self.directory
+        if parts == ["ServiceProviderConfigs"] and method == "GET":
+            return 200, {}, self._service_provider_configs()
+        if parts[0] == "Users" and len(parts) == 1:
+            if method == "GET":
+                return 200, {}, self._page(directory.search_users(_first(query, "filter")), query)
+            if method == "POST":
+                return 201, {}, directory.create_user(data)
+        elif parts[0] == "Users" and len(parts) == 2:
+            id = parts[1]
+            if method == "GET":
+                return 200, {}, directory.read_user(id)
+            if method == "PUT":
+                return 200, {}, directory.replace_user(id, data)
+            if method == "PATCH":
+                return 200, {}, directory.patch_user(id, data)
+            if method == "DELETE":
+                directory.delete_user(id)
+                return 204, {}, None
+        elif parts[0] == "Groups" and len(parts) == 1:
+            if method == "GET":
+                return 200, {}, self._page(directory.search_groups(_first(query, "filter")), query)
+            if method == "POST":
+                return 201, {}, directory.create_group(data)
+        elif parts[0] == "Groups" and len(parts) == 2:
+            id = parts[1]
+            if method == "GET":
+                return 200, {}, directory.read_group(id)
+            if method == "PUT":
+                return 200, {}, directory.replace_group(id, data)
+            if method == "PATCH":
+                return 200, {}, directory.patch_group(id, data)
+            if method == "DELETE":
+                directory.delete_group(id)
+                return 204, {}, None
+        else:
+            return 404, {}, _error(404, "Resource not found")
+        return 405, {}, _error(405, "Method not allowed")
+
+    def _page(self, resources: List[dict], query: Dict[str, List[str]]) -> dict:
+        try:
+            start_index = max(1, int(_first(query, "startIndex") or 1))
+            count = int(_first(query, "count") or self.default_count)
+        except ValueError:
+            raise FakeSCIMError(400, "startIndex and count must be numbers")
+        count = min(max(count, 0), self.max_count)
+        page = resources[start_index - 1:start_index - 1 + count]
+        return {
+            "totalResults": len(resources),
+            "itemsPerPage": len(page),
+            "startIndex": start_index,
+            "schemas": ["urn:scim:schemas:core:1.0"],
+            "Resources": page,
+        }
+
+    def _service_provider_configs(self) -> dict:
+        return {
+            "schemas": ["urn:scim:schemas:core:1.0"],
+            "authenticationSchemes": [{"type": "oauthbearertoken", "primary": True}],
+            "patch": {"supported": True},
+            "bulk": {"supported": False, "maxOperations": 0, "maxPayloadSize": 0},
+            "filter": {"supported": True, "maxResults": self.max_count},
+            "changePassword": {"supported": False},
+            "sort": {"supported": False},
+            "etag": {"supported": False},
+            "xmlDataFormat": {"supported": False},
+        }
+
+
+def _first(query: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = query.get(name)
+    return values[0] if values else None
+
+
+def _error(status: int, description: str) -> dict:
+    return {"Errors": {"description": description, "code": status}}
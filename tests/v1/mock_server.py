@@ -1,8 +1,12 @@
+import gzip
 import json
 import logging
 import threading
+import time
+import zlib
 from http import HTTPStatus
 from http.server import HTTPServer, SimpleHTTPRequestHandler
+from socketserver import ThreadingMixIn
 from typing import Type
 from unittest import TestCase
 from urllib.parse import urlparse
@@ -13,18 +17,71 @@ from tests.v1 import is_prod_test_mode
 class MockHandler(SimpleHTTPRequestHandler):
     protocol_version = "HTTP/1.1"
     default_request_version = "HTTP/1.1"
+    # headers and body are written separately; avoid delayed ACK stalls on keep-alive connections
+    disable_nagle_algorithm = True
     logger = logging.getLogger(__name__)
 
     def is_valid_token(self):
         return "authorization" in self.headers \
                and str(self.headers["authorization"]).startswith("Bearer xoxp-")
 
-    def set_common_headers(self):
+    def setup(self):
+        super().setup()
+        # one handler instance is created per TCP connection
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def respond_injected_error(self) -> bool:
+        # tests can set the number of requests to fail in several ways
+        with self.server.lock:
+            if self.server.dropped_requests > 0:
+                self.server.dropped_requests -= 1
+                error = "drop"
+            elif self.server.rate_limited_requests > 0:
+                self.server.rate_limited_requests -= 1
+                error = "rate_limited"
+            elif self.server.failing_requests > 0:
+                self.server.failing_requests -= 1
+                error = "unavailable"
+            else:
+                return False
+        # consume the request body to keep the connection usable
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if error == "drop":
+            self.close_connection = True
+            return True
+        if error == "rate_limited":
+            self.send_response(HTTPStatus.TOO_MANY_REQUESTS)
+            self.send_header("retry-after", str(self.server.retry_after))
+        else:
+            self.send_response(HTTPStatus.SERVICE_UNAVAILABLE)
+        self.set_common_headers()
+        return True
+
+    def set_common_headers(self, body: str = ""):
         self.send_header("content-type", "application/json;charset=utf-8")
-        self.send_header("connection", "close")
+        self.send_header("content-length", str(len(body.encode("utf-8"))))
         self.end_headers()
 
+    def send_encoded_body(self, body: str):
+        # compresses the body when the test enables it and the client accepts it
+        data = body.encode("utf-8")
+        encoding = self.server.content_encoding
+        if encoding and encoding in (self.headers.get("Accept-Encoding") or ""):
+            data = gzip.compress(data) if encoding == "gzip" else zlib.compress(data)
+            self.send_header("content-encoding", encoding)
+        self.send_header("content-type", "application/json;charset=utf-8")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
     def do_GET(self):
+        with self.server.lock:
+            self.server.get_count += 1
+        if self.server.get_delay > 0:
+            time.sleep(self.server.get_delay)
+        if self.respond_injected_error():
+            return
         if self.is_valid_token():
             parsed_path = urlparse(self.path)
             if parsed_path.path == "/ServiceProviderConfigs":
@@ -59,18 +116,23 @@ class MockHandler(SimpleHTTPRequestHandler):
             elif parsed_path.path == "/Groups/S333":
                 with open("tests/fixture/v1_group_3.json") as f:
                     body = f.read()
+            elif parsed_path.path.startswith("/Users/") or parsed_path.path.startswith("/Groups/"):
+                body = json.dumps({"Errors": {"description": "Resource not found", "code": 404}})
+                self.send_response(HTTPStatus.NOT_FOUND)
+                self.set_common_headers(body)
+                self.wfile.write(body.encode("utf-8"))
+                return
             else:
                 body = "{}"
             self.send_response(HTTPStatus.OK)
-            self.set_common_headers()
-            self.wfile.write(body.encode("utf-8"))
-            self.wfile.close()
+            self.send_encoded_body(body)
         else:
             self.send_response(HTTPStatus.UNAUTHORIZED)
             self.set_common_headers()
 
-
     def do_POST(self):
+        if self.respond_injected_error():
+            return
         if self.is_valid_token():
             content_len = int(self.headers.get('Content-Length'))
             post_body = self.rfile.read(content_len)
@@ -99,18 +161,20 @@ class MockHandler(SimpleHTTPRequestHandler):
             else:
                 body = "{}"
             self.send_response(HTTPStatus.OK)
-            self.set_common_headers()
+            self.set_common_headers(body)
             self.wfile.write(body.encode("utf-8"))
-            self.wfile.close()
         else:
             self.send_response(HTTPStatus.UNAUTHORIZED)
             self.set_common_headers()
 
     def do_PATCH(self):
+        if self.respond_injected_error():
+            return
         if self.is_valid_token():
             content_len = int(self.headers.get('Content-Length'))
             post_body = self.rfile.read(content_len)
             input = json.loads(post_body)
+            self.server.patch_bodies.append(input)
 
             parsed_path = urlparse(self.path)
             if parsed_path.path == "/Users/W111":
@@ -139,14 +203,15 @@ class MockHandler(SimpleHTTPRequestHandler):
                 body = "{}"
             print(body)
             self.send_response(HTTPStatus.OK)
-            self.set_common_headers()
+            self.set_common_headers(body)
             self.wfile.write(body.encode("utf-8"))
-            self.wfile.close()
         else:
             self.send_response(HTTPStatus.UNAUTHORIZED)
             self.set_common_headers()
 
     def do_PUT(self):
+        if self.respond_injected_error():
+            return
         if self.is_valid_token():
             parsed_path = urlparse(self.path)
             content_len = int(self.headers.get('Content-Length'))
@@ -178,14 +243,15 @@ class MockHandler(SimpleHTTPRequestHandler):
             else:
                 body = "{}"
             self.send_response(HTTPStatus.OK)
-            self.set_common_headers()
+            self.set_common_headers(body)
             self.wfile.write(body.encode("utf-8"))
-            self.wfile.close()
         else:
             self.send_response(HTTPStatus.UNAUTHORIZED)
             self.set_common_headers()
 
     def do_DELETE(self):
+        if self.respond_injected_error():
+            return
         if self.is_valid_token():
             self.send_response(HTTPStatus.OK)
             self.set_common_headers()
@@ -194,6 +260,11 @@ class MockHandler(SimpleHTTPRequestHandler):
             self.set_common_headers()
 
 
+class ThreadingMockServer(ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer is not available in Python 3.6
+    daemon_threads = True
+
+
 class MockServerThread(threading.Thread):
 
     def __init__(self, test: TestCase, handler: Type[SimpleHTTPRequestHandler] = MockHandler):
@@ -202,7 +273,17 @@ class MockServerThread(threading.Thread):
         self.test = test
 
     def run(self):
-        self.server = HTTPServer(('localhost', 8888), self.handler)
+        self.server = ThreadingMockServer(('localhost', 8888), self.handler)
+        self.server.lock = threading.Lock()
+        self.server.connection_count = 0
+        self.server.rate_limited_requests = 0
+        self.server.failing_requests = 0
+        self.server.dropped_requests = 0
+        self.server.retry_after = "0"
+        self.server.patch_bodies = []
+        self.server.get_count = 0
+        self.server.get_delay = 0.0
+        self.server.content_encoding = None
         self.test.server_url = "http://localhost:8888"
         self.test.host, self.test.port = self.server.socket.getsockname()
         self.test.server_started.set()  # threading.Event()
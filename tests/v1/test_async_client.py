@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+
+from slack_scim import AsyncSCIMClient, Group, Groups, SCIMClient, User, Users
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestAsyncClient(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = AsyncSCIMClient(token=self.token, base_url=base_url, max_concurrency=20)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.client.connection_pool.close()
+        self.loop.close()
+        cleanup_mock_server(self)
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_search_and_read_users(self):
+        search_result: Users = self.run_async(self.client.search_users(count=3))
+        assert search_result.start_index == 1
+        assert len(search_result.resources) == 3
+
+        user = search_result.resources[1]
+        read_result: User = self.run_async(self.client.read_user(user.id))
+        assert user.id == read_result.id
+
+    def test_user_crud(self):
+        new_user: User = User.from_dict({
+            "name": {"givenName": "Kazuhiro", "familyName": "Sera"},
+            "emails": [{"value": "test-async@example.com"}],
+            "userName": "slack_scim-async",
+        })
+        creation_result: User = self.run_async(self.client.create_user(new_user))
+        user_id = creation_result.id
+
+        patch_result: User = self.run_async(self.client.patch_user(user_id, {"name": {"givenName": "Kaz"}}))
+        assert patch_result.name.given_name == "Kaz"
+
+        patch_result.name.given_name = "K"
+        update_result = self.run_async(self.client.update_user(user_id, patch_result))
+        assert update_result.name.given_name == "K"
+
+        self.run_async(self.client.delete_user(user_id))
+
+    def test_header_injection(self):
+        client = AsyncSCIMClient(token="xoxp-1\r\nX-Injected: 1", base_url=self.client.base_url)
+        with self.assertRaises(ValueError):
+            self.run_async(client.read_user("W111"))
+        client.connection_pool.close()
+        build_request = self.client.connection_pool._build_request
+        with self.assertRaises(ValueError):
+            build_request("GET", ("http", "localhost", 80), "/Users HTTP/1.1\r\nX-Injected: 1", None, {})
+        with self.assertRaises(ValueError):
+            build_request("GET", ("http", "localhost", 80), "/Users", None, {"X-Injected:": "1"})
+
+    def test_groups(self):
+        search_result: Groups = self.run_async(self.client.search_groups(count=3))
+        assert len(search_result.resources) == 3
+
+        group: Group = self.run_async(self.client.read_group("S333"))
+        assert group.members[0].value == "M333"
+
+    def test_service_provider_configs(self):
+        result = self.run_async(self.client.get_service_provider_configs())
+        assert len(result.authentication_schemes) > 0
+
+    def test_many_concurrent_reads(self):
+        async def read_all():
+            return await asyncio.gather(*[self.client.read_user("W111") for _ in range(500)])
+
+        users = self.run_async(read_all())
+        assert len(users) == 500
+        assert all(u.id == "W111" for u in users)
+
+        stats = self.client.connection_pool.stats
+        assert stats.requests == 500
+        assert stats.connections_created <= 20
+        assert stats.connections_reused >= 480
@@ -0,0 +1,59 @@
+import unittest
+
+from slack_scim import SCIMClient, SCIMApiError, User
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_create_users(self):
+        progress = []
+
+        def new_users():
+            for i in range(20):
+                yield User.from_dict({
+                    "name": {"givenName": f"user{i}", "familyName": "test"},
+                    "emails": [{"value": f"user{i}@example.com"}],
+                    "userName": f"user{i}",
+                })
+
+        results = self.client.batch(on_progress=progress.append).create_users(new_users(), concurrency=5)
+        assert len(results) == 20
+        assert [r.index for r in results] == list(range(20))
+        assert all(r.ok and r.value.user_name == f"user{r.index}" for r in results)
+        assert results.summary.succeeded == 20
+        assert results.summary.throughput > 0
+        assert sorted(p.completed for p in progress) == list(range(1, 21))
+
+    def test_failures_do_not_stop_the_batch(self):
+        invalid_client = SCIMClient(token="invalid", base_url=self.client.base_url)
+        results = invalid_client.batch().delete_users(["W111", "W222", "W333"])
+        assert len(results.failed) == 3
+        assert all(isinstance(r.error, SCIMApiError) for r in results)
+        assert results.summary.failed == 3
+
+    def test_progress_errors(self):
+        def on_progress(progress):
+            raise ValueError("broken")
+
+        batch = self.client.batch(concurrency=2, on_progress=on_progress)
+        with self.assertRaises(ValueError):
+            batch.run(lambda item: item, range(3))
+
+    def test_group_operations(self):
+        batch = self.client.batch(concurrency=2)
+        results = batch.patch_groups([("S111", {"displayName": f"group-{i}"}) for i in range(4)])
+        assert [r.value.display_name for r in results] == [f"group-{i}" for i in range(4)]
+
+        results = batch.delete_groups(["S111", "S222"])
+        assert len(results.succeeded) == 2
@@ -0,0 +1,136 @@
+import unittest
+
+from slack_scim import ResponseCache, SCIMApiError, SCIMClient
+from slack_scim.v1.response import SCIMResponse
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_response(status: int = 200) -> SCIMResponse:
+    return SCIMResponse(status=status, reason="", headers={}, body="{}")
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.cache = ResponseCache(max_size=100, ttl=60)
+        self.client = SCIMClient(token=self.token, base_url=base_url, response_cache=self.cache)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_is_cacheable(self):
+        assert ResponseCache.is_cacheable("https://api.slack.com/scim/v1/Users/W123")
+        assert ResponseCache.is_cacheable("https://api.slack.com/scim/v1/Groups/S123")
+        assert not ResponseCache.is_cacheable("https://api.slack.com/scim/v1/Users")
+        assert not ResponseCache.is_cacheable("https://api.slack.com/scim/v1/Users?count=1")
+        assert not ResponseCache.is_cacheable("https://api.slack.com/scim/v1/ServiceProviderConfigs")
+
+    def test_ttl_and_lru(self):
+        clock = FakeClock()
+        cache = ResponseCache(max_size=2, ttl=10, negative_ttl=1, clock=clock)
+        cache.put("/Users/W1", build_response(), cache.generation)
+        cache.put("/Users/W2", build_response(404), cache.generation)
+        cache.put("/Users/W3", build_response(500), cache.generation)
+        assert cache.get("/Users/W1") is not None
+        assert cache.get("/Users/W2").status == 404
+        assert cache.get("/Users/W3") is None
+
+        clock.now = 2.0
+        # the negative entry has expired
+        assert cache.get("/Users/W2") is None
+        cache.put("/Users/W2", build_response(), cache.generation)
+        cache.get("/Users/W1")
+        cache.put("/Users/W4", build_response(), cache.generation)
+        # W2 is the least recently used one
+        assert cache.get("/Users/W2") is None
+        assert cache.get("/Users/W1") is not None
+
+        clock.now = 20.0
+        assert cache.get("/Users/W1") is None
+        stats = cache.stats
+        assert stats.hits == 4
+        assert stats.misses == 4
+        assert stats.evictions == 1
+        assert stats.to_dict()["hit_rate"] == 0.5
+
+    def test_writes_during_reads(self):
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate("/Users/W1")
+        # the response may have been read before the write
+        cache.put("/Users/W1", build_response(), generation)
+        assert cache.get("/Users/W1") is None
+
+        cache.put("/Users/W1", build_response(), cache.generation)
+        cache.put("/Groups/S1", build_response(), cache.generation)
+        cache.invalidate("/Groups/S2")
+        # the groups attribute of users may have changed
+        assert cache.get("/Users/W1") is None
+        assert cache.get("/Groups/S1") is not None
+
+    def test_tokens(self):
+        cache = ResponseCache()
+        cache.put("/Users/W1", build_response(), cache.generation, "Bearer xoxp-1")
+        assert cache.get("/Users/W1", "Bearer xoxp-1") is not None
+        # another token may not be allowed to read the user
+        assert cache.get("/Users/W1", "Bearer xoxp-2") is None
+        assert cache.get("/Users/W1") is None
+
+        cache.put("/Users/W1", build_response(), cache.generation, "Bearer xoxp-2")
+        cache.invalidate("/Users/W1")
+        assert cache.get("/Users/W1", "Bearer xoxp-1") is None
+        assert cache.get("/Users/W1", "Bearer xoxp-2") is None
+
+        # the tokens are forgotten with their entries
+        small = ResponseCache(max_size=2)
+        for i in range(10):
+            small.put(f"/Users/W{i}", build_response(), small.generation, f"Bearer xoxp-{i}")
+        assert len(small._authorizations) == 2
+        small.invalidate("/Users/W9")
+        assert small.get("/Users/W8", "Bearer xoxp-8") is not None
+        assert list(small._authorizations) == ["Bearer xoxp-8"]
+
+    def test_read_user(self):
+        if self.server_url is None:
+            return
+        for _ in range(5):
+            assert self.client.read_user("W111").id == "W111"
+        assert self.thread.server.get_count == 1
+        assert self.cache.stats.hits == 4
+
+        for _ in range(3):
+            with self.assertRaises(SCIMApiError) as context:
+                self.client.read_user("W404")
+            assert context.exception.status == 404
+        assert self.thread.server.get_count == 2
+
+        self.client.patch_user("W111", {"title": "Engineer"})
+        self.client.read_user("W111")
+        assert self.thread.server.get_count == 3
+
+        self.client.read_group("S111")
+        self.client.patch_group("S111", {"members": [{"value": "W111"}]})
+        self.client.read_group("S111")
+        self.client.read_user("W111")
+        assert self.thread.server.get_count == 6
+
+        self.client.delete_user("W111")
+        self.client.read_user("W111")
+        assert self.thread.server.get_count == 7
+
+        # a client with another token sharing the cache doesn't get the responses to this one
+        other = SCIMClient(token="invalid", base_url=self.client.base_url, response_cache=self.cache)
+        with self.assertRaises(SCIMApiError):
+            other.read_user("W111")
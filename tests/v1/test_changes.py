@@ -0,0 +1,107 @@
+import json
+import unittest
+
+from slack_scim import Group, SCIMClient, User
+from slack_scim.v1.changes import build_patch
+from slack_scim.v1.internal_utils import _decode_group, _decode_user
+from tests.v1 import load_token, is_prod_test_mode
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestChanges(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_build_patch(self):
+        original = {
+            "id": "W1",
+            "userName": "alice",
+            "title": "Engineer",
+            "nickName": "al",
+            "name": {"givenName": "Alice", "familyName": "Smith"},
+            "emails": [
+                {"value": "alice@example.com", "primary": True},
+                {"value": "old@example.com", "primary": False},
+            ],
+            "addresses": [{"locality": "Tokyo"}],
+        }
+        current = json.loads(json.dumps(original))
+        current["title"] = "Manager"
+        current["nickName"] = None
+        current["name"]["givenName"] = "Ally"
+        current["emails"][0]["primary"] = False
+        current["emails"][1] = {"value": "new@example.com", "primary": True}
+        current["addresses"] = [{"locality": "Osaka"}]
+        current["meta"] = {"created": "2020-01-01T00:00:00-08:00"}
+
+        patch, changed = build_patch(original, current)
+        assert changed == ["title", "name", "emails", "addresses", "nickName"]
+        assert patch == {
+            "title": "Manager",
+            "name": {"givenName": "Ally"},
+            "emails": [
+                {"value": "old@example.com", "operation": "delete"},
+                {"value": "alice@example.com", "primary": False},
+                {"value": "new@example.com", "primary": True},
+            ],
+            "addresses": [{"locality": "Osaka"}],
+            "meta": {"attributes": ["addresses", "nickName"]},
+        }
+        assert build_patch(original, original) == ({}, [])
+
+    def test_changed_attributes(self):
+        with open("tests/fixture/v1_user_1.json") as f:
+            user = _decode_user(json.load(f))
+        assert user.changed_attributes() == []
+        user.title = "Changed"
+        user.name.given_name = "Changed"
+        assert user.changed_attributes() == ["name", "title"]
+        assert _decode_user(user.to_dict()).changed_attributes() == []
+        assert User.from_dict(user.to_dict()).changed_attributes() is None
+        assert User(*[None] * 20).changed_attributes() is None
+
+    def test_group_members(self):
+        group = _decode_group({
+            "id": "S1",
+            "displayName": "g",
+            "members": [{"value": "W1", "display": "a"}, {"value": "W2", "display": "b"}],
+        })
+        group.members = [m for m in group.members if m.value != "W1"]
+        patch, _ = build_patch(group._original, group.to_dict())
+        assert patch == {"members": [{"value": "W1", "operation": "delete"}]}
+
+    def test_patch_user_sends_changes_only(self):
+        if is_prod_test_mode():
+            return
+        user = self.client.read_user("W111")
+        user.user_name = "renamed"
+        self.client.patch_user(user.id, user)
+        assert self.thread.server.patch_bodies[-1] == {
+            "userName": "renamed",
+            "schemas": SCIMClient.schema_values,
+        }
+        # dicts are sent as they are
+        self.client.patch_user("W111", {"title": "foo"})
+        assert self.thread.server.patch_bodies[-1] == {"title": "foo", "schemas": SCIMClient.schema_values}
+
+    def test_patch_with_models_built_by_hand(self):
+        if is_prod_test_mode():
+            return
+        self.client.patch_user("W111", User.from_dict({"title": "X"}))
+        assert self.thread.server.patch_bodies[-1] == {"title": "X", "schemas": SCIMClient.schema_values}
+        self.client.patch_group("S111", Group.from_dict({"displayName": "renamed"}))
+        assert self.thread.server.patch_bodies[-1] == {
+            "displayName": "renamed",
+            "schemas": SCIMClient.schema_values,
+        }
+        # unchanged objects returned by the client are sent as a whole rather than as an empty PATCH
+        user = self.client.read_user("W111")
+        self.client.patch_user(user.id, user)
+        assert self.thread.server.patch_bodies[-1]["userName"] == user.user_name
@@ -0,0 +1,101 @@
+import asyncio
+import gzip
+import io
+import unittest
+import zlib
+
+from slack_scim import AsyncSCIMClient, SCIMClient
+from slack_scim.v1.errors import SCIMError
+from slack_scim.v1.compression import DecodingReader, decode_body
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class FakeResponse(io.BytesIO):
+    status = 200
+    reason = "OK"
+    headers = {}
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        self.base_url = self.server_url or SCIMClient.production_base_url
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_decoding_reader(self):
+        body = b'{"Resources": [' + b",".join([b'{"id": "W%d"}' % i for i in range(1000)]) + b"]}"
+        for encoding, compressed in [
+            ("gzip", gzip.compress(body)),
+            ("deflate", zlib.compress(body)),
+            # raw deflate data without the zlib header
+            ("deflate", zlib.compress(body)[2:-4]),
+            (None, body),
+        ]:
+            finished = []
+            reader = DecodingReader(FakeResponse(compressed), encoding, lambda *args: finished.append(args))
+            chunks = []
+            while True:
+                data = reader.read(64)
+                if not data:
+                    break
+                chunks.append(data)
+            assert b"".join(chunks) == body
+            assert len(chunks) > 1
+            assert finished == [(encoding, len(compressed), len(body))]
+            assert decode_body(compressed, encoding) == body
+
+    def test_max_size(self):
+        body = b" " * 100000
+        for encoding, compressed in [("gzip", gzip.compress(body)), ("deflate", zlib.compress(body)[2:-4])]:
+            assert decode_body(compressed, encoding, max_size=len(body)) == body
+            with self.assertRaises(SCIMError):
+                decode_body(compressed, encoding, max_size=len(body) - 1)
+            reader = DecodingReader(FakeResponse(compressed), encoding, max_size=1000)
+            with self.assertRaises(SCIMError):
+                while reader.read(64):
+                    pass
+
+    def test_client(self):
+        if self.server_url is None:
+            return
+        for encoding in ("gzip", "deflate"):
+            self.thread.server.content_encoding = encoding
+            client = SCIMClient(token=self.token, base_url=self.base_url)
+            page = client.search_users(count=3)
+            assert len(page.resources) == 3
+            with client.stream_users(count=3) as stream:
+                assert len(list(stream)) == 3
+            stats = client.compression_stats
+            assert stats.responses == 2
+            assert stats.compressed_responses == 2
+            assert stats.received_bytes < stats.decoded_bytes
+            assert stats.ratio > 1
+
+        client = SCIMClient(token=self.token, base_url=self.base_url, max_decoded_size=10)
+        with self.assertRaises(SCIMError):
+            client.search_users(count=3)
+
+        client = SCIMClient(token=self.token, base_url=self.base_url, compress=False)
+        client.search_users(count=3)
+        stats = client.compression_stats
+        assert stats.compressed_responses == 0
+        assert stats.received_bytes == stats.decoded_bytes
+
+    def test_async_client(self):
+        if self.server_url is None:
+            return
+        self.thread.server.content_encoding = "gzip"
+        client = AsyncSCIMClient(token=self.token, base_url=self.base_url)
+        loop = asyncio.new_event_loop()
+        try:
+            page = loop.run_until_complete(client.search_users(count=3))
+        finally:
+            client.connection_pool.close()
+            loop.close()
+        assert len(page.resources) == 3
+        assert client.compression_stats.compressed_responses == 1
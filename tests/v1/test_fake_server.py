@@ -0,0 +1,146 @@
+import time
+import unittest
+
+import pytest
+
+from slack_scim import SCIMClient, SCIMApiError, RetryPolicy, RateLimiter, ClientTuning
+from slack_scim.v1.user import Email
+from tests.v1.fake_server import FakeSCIMServer, constant, parse_filter
+
+
+class TestFakeServer(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSCIMServer(seed=0).start()
+        self.client = SCIMClient(
+            token="xoxp-fake",
+            base_url=self.server.url,
+            retry_policy=RetryPolicy(sleep=lambda seconds: None),
+        )
+
+    def tearDown(self):
+        self.client.connection_pool.close()
+        self.server.stop()
+
+    def test_filter(self):
+        user = {"userName": "Alice", "title": "Engineer", "active": True, "emails": [{"value": "alice@example.com"}]}
+        assert parse_filter('userName eq "alice"')(user)
+        assert parse_filter('emails.value sw "alice@"')(user)
+        assert parse_filter('title co "gin" and (active eq false or userName ew "ce")')(user)
+        assert not parse_filter('title eq "Manager" or active eq false')(user)
+        assert parse_filter("nickName pr")(user) is False
+
+    def test_crud(self):
+        created = self.client.create_user({
+            "userName": "alice",
+            "name": {"givenName": "Alice", "familyName": "Smith"},
+            "emails": [{"value": "alice@example.com", "primary": True}],
+        })
+        assert created.id.startswith("W")
+        assert created.active is True
+
+        user = self.client.read_user(created.id)
+        user.title = "Engineer"
+        user.emails.append(Email.from_dict({"value": "alice@example.org", "primary": False}))
+        patched = self.client.patch_user(user.id, user)
+        assert patched.title == "Engineer"
+        assert sorted(e.value for e in patched.emails) == ["alice@example.com", "alice@example.org"]
+        assert patched.name.given_name == "Alice"
+
+        with pytest.raises(SCIMApiError) as e:
+            self.client.create_user({"userName": "ALICE"})
+        assert e.value.status == 409
+
+        group = self.client.create_group({"displayName": "engineers", "members": [{"value": created.id}]})
+        assert [m.value for m in group.members] == [created.id]
+        assert [g.value for g in self.client.read_user(created.id).groups] == [group.id]
+
+        self.client.patch_group(group.id, {"members": [{"value": created.id, "operation": "delete"}]})
+        assert self.client.read_group(group.id).members == []
+
+        self.client.delete_user(created.id)
+        assert self.client.read_user(created.id).active is False
+        self.client.delete_group(group.id)
+        with pytest.raises(SCIMApiError) as e:
+            self.client.read_group(group.id)
+        assert e.value.status == 404
+
+    def test_search_and_pagination(self):
+        self.server.directory.add_users(250)
+        page = self.client.search_users(count=100, start_index=201)
+        assert page.total_results == 250
+        assert page.items_per_page == 50
+        assert page.start_index == 201
+
+        users = list(self.client.iter_users(page_size=100))
+        assert len(users) == 250
+        assert len({u.id for u in users}) == 250
+
+        page = self.client.search_users(filter='userName eq "user7"')
+        assert page.total_results == 1
+        assert page.resources[0].user_name == "user7"
+
+        with pytest.raises(SCIMApiError) as e:
+            self.client.search_users(filter="userName unknown 1")
+        assert e.value.status == 400
+
+    def test_scan_with_count_cap(self):
+        server = FakeSCIMServer(max_count=50, seed=0).start()
+        client = SCIMClient(token="xoxp-fake", base_url=server.url, tuning=ClientTuning())
+        try:
+            server.directory.add_users(230)
+            users = list(client.scan_users(page_size=100))
+            assert len(users) == 230
+            assert len({u.id for u in users}) == 230
+        finally:
+            client.connection_pool.close()
+            server.stop()
+
+    def test_keep_alive(self):
+        self.server.directory.add_users(3)
+        for _ in range(10):
+            self.client.search_users(count=1)
+        stats = self.server.stats
+        assert stats.requests == 10
+        assert stats.connections == 1
+
+    def test_injected_faults(self):
+        self.server.directory.add_users(1)
+        self.server.retry_after = 0
+        self.server.inject_rate_limits(2)
+        self.server.inject_errors(1, status=502)
+        assert self.client.search_users(count=1).total_results == 1
+        stats = self.server.stats
+        assert stats.rate_limited == 2
+        assert stats.injected_errors == 1
+        assert stats.statuses == {429: 2, 502: 1, 200: 1}
+
+        self.server.error_ratio = 1.0
+        with pytest.raises(SCIMApiError) as e:
+            self.client.create_user({"userName": "bob"})
+        assert e.value.status == 503
+
+    def test_rate_limit_and_latency(self):
+        self.server.rate_limit = 2
+        self.server.retry_after = 0
+        self.server.latency = {"GET /Users/{id}": constant(0.05)}
+        client = SCIMClient(
+            token="xoxp-fake",
+            base_url=self.server.url,
+            rate_limiter=RateLimiter(max_retries=0),
+        )
+        statuses = []
+        for _ in range(4):
+            try:
+                client.search_users(count=1)
+                statuses.append(200)
+            except SCIMApiError as e:
+                statuses.append(e.status)
+        assert statuses[:2] == [200, 200]
+        assert 429 in statuses[2:]
+        client.connection_pool.close()
+
+        self.server.rate_limit = None
+        user_id = self.server.directory.add_users(1)[0]
+        started = time.perf_counter()
+        self.client.read_user(user_id)
+        assert time.perf_counter() - started >= 0.05
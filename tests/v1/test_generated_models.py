@@ -0,0 +1,88 @@
+import copy
+import json
+import unittest
+
+import pytest
+
+import generate_response_classes
+from slack_scim import LazyList
+from slack_scim.v1 import group, groups, service_provider_configs, user, users
+
+
+class TestGeneratedModels(unittest.TestCase):
+    def test_up_to_date(self):
+        for module_name, schema_name in generate_response_classes.targets:
+            with open(f"src/slack_scim/v1/{module_name}.py") as f:
+                assert f.read() == generate_response_classes.generate_module(schema_name), module_name
+
+    def test_round_trip(self):
+        fixtures = [
+            (user.User, "v1_user_1.json"),
+            (users.Users, "v1_users_1.json"),
+            (group.Group, "v1_group_1.json"),
+            (groups.Groups, "v1_groups_1.json"),
+            (service_provider_configs.ServiceProviderConfigs, "v1_service_provider_configs.json"),
+        ]
+        for cls, name in fixtures:
+            with open(f"tests/fixture/{name}") as f:
+                data = json.load(f)
+            encoded = cls.from_dict(data).to_dict()
+            assert cls.from_dict(encoded).to_dict() == encoded
+            assert all(encoded[k] is not None for k in data.keys() if data[k] is not None)
+
+    def test_invalid_values(self):
+        with pytest.raises(AssertionError):
+            user.User.from_dict({"userName": 123})
+        with pytest.raises(AssertionError):
+            user.User.from_dict({"active": "true"})
+        with pytest.raises(AssertionError):
+            users.Users.from_dict({"totalResults": True})
+        with pytest.raises(AssertionError):
+            users.Users.from_dict({"Resources": {}})
+        u = user.User.from_dict({"emails": [{"value": "foo@example.com"}]})
+        u.emails = [{"value": "bar@example.com"}]
+        with pytest.raises(AssertionError):
+            u.to_dict()
+
+    def test_slots(self):
+        with open("tests/fixture/v1_users_1.json") as f:
+            page = users.Users.from_dict(json.load(f))
+        with open("tests/fixture/v1_group_3.json") as f:
+            g = group.Group.from_dict(json.load(f))
+        resource = page.resources[1]
+        for obj in [page, resource, resource.emails[0], resource.photos[0], resource.meta, resource.name, g.members[0]]:
+            assert not hasattr(obj, "__dict__"), obj.__class__.__name__
+        with pytest.raises(AttributeError):
+            resource.unknown_attribute = "foo"
+
+    def test_lazy(self):
+        with open("tests/fixture/v1_users_1.json") as f:
+            data = json.load(f)
+        page = users.Users.from_dict(data, lazy=True)
+        assert isinstance(page.resources, LazyList)
+        assert page.resources.decoded_count == 0
+        assert page.resources.raw[1]["userName"] == data["Resources"][1]["userName"]
+
+        resource = page.resources[1]
+        assert page.resources.decoded_count == 1
+        assert resource is page.resources[1]
+        assert isinstance(resource.emails, LazyList)
+        assert resource.emails[0].value == data["Resources"][1]["emails"][0]["value"]
+        assert page.resources[-1] is page.resources[2]
+        with pytest.raises(IndexError):
+            page.resources[3]
+
+        # Changes to the decoded objects are kept
+        resource.user_name = "changed"
+        assert page.to_dict()["Resources"][1]["userName"] == "changed"
+        resource.user_name = data["Resources"][1]["userName"]
+        assert page.to_dict() == users.Users.from_dict(data).to_dict()
+        assert [r.id for r in copy.deepcopy(page).resources] == [r["id"] for r in data["Resources"]]
+
+    def test_lazy_group_members(self):
+        with open("tests/fixture/v1_group_3.json") as f:
+            data = json.load(f)
+        g = group.Group.from_dict(data, lazy=True)
+        assert g.members.decoded_count == 0
+        assert [m.value for m in g.members] == [m["value"] for m in data["members"]]
+        assert g.to_dict() == group.Group.from_dict(data).to_dict()
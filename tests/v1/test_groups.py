@@ -87,6 +87,6 @@ class TestGroups(unittest.TestCase):
         group = self.client.read_group("S333")
         assert len(group.members) == 1
         member = group.members[0]
-        print(member.__dict__)
+        print(member.to_dict())
         assert member.value == "M333"
         assert member.display == "Michael Jackson"
@@ -0,0 +1,140 @@
+import unittest
+
+import pytest
+
+from slack_scim import SCIMClient, SCIMApiError, RetryPolicy, ResponseCache
+from slack_scim import InstrumentationHook, MetricsAggregator, RequestEvent
+from slack_scim.v1.instrumentation import endpoint_template
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class Recorder(InstrumentationHook):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_request_start(self, event: RequestEvent):
+        self.started.append(event.to_dict())
+
+    def on_request_end(self, event: RequestEvent):
+        self.ended.append(event)
+
+
+class BrokenHook(InstrumentationHook):
+    def on_request_end(self, event: RequestEvent):
+        raise ValueError("broken")
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        self.base_url = self.server_url or SCIMClient.production_base_url
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_endpoint_template(self):
+        assert endpoint_template("https://api.slack.com/scim/v1/Users/W111") == "/Users/{id}"
+        assert endpoint_template("https://api.slack.com/scim/v1/Users?count=1") == "/Users"
+        assert endpoint_template("http://localhost:8888/Groups/S111/") == "/Groups/{id}"
+        assert endpoint_template("http://localhost:8888/Groups") == "/Groups"
+        assert endpoint_template("http://localhost:8888/ServiceProviderConfigs") == "/ServiceProviderConfigs"
+        assert endpoint_template("http://localhost:8888/other/path") == "/other/path"
+
+    def test_aggregator(self):
+        metrics = MetricsAggregator(max_samples=10, seed=0)
+        for i in range(100):
+            event = RequestEvent(method="GET", endpoint="/Users/{id}", url="", request_bytes=0)
+            event.status = 404 if i % 10 == 0 else 200
+            event.total_time = i / 100
+            event.response_bytes = 10
+            metrics.on_request_end(event)
+        m = metrics.snapshot()["GET /Users/{id}"]
+        assert m.count == 100
+        assert m.errors == 10
+        assert m.statuses == {200: 90, 404: 10}
+        assert m.response_bytes == 1000
+        assert len(m.samples["total"]) == 10
+        assert m.percentile(0.5) <= m.percentile(0.99) <= 0.99
+        assert m.to_dict()["total"]["max"] == m.percentile(1.0)
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_events(self):
+        recorder = Recorder()
+        metrics = MetricsAggregator()
+        client = SCIMClient(token=self.token, base_url=self.base_url, hooks=[recorder, metrics, BrokenHook()])
+
+        user = client.read_user("W111")
+        assert user.id == "W111"
+        assert recorder.started[0]["endpoint"] == "/Users/{id}"
+        assert recorder.started[0]["status"] is None
+        event = recorder.ended[0]
+        assert event.method == "GET"
+        assert event.endpoint == "/Users/{id}"
+        assert event.status == 200
+        assert event.error is None
+        assert event.response_bytes > 0
+        assert event.total_time >= event.ttfb + event.read_time + event.decode_time
+        assert event.decode_time > 0
+
+        client.search_users(count=1)
+        assert recorder.ended[1].endpoint == "/Users"
+
+        with pytest.raises(SCIMApiError):
+            client.read_user("not-found")
+        event = recorder.ended[2]
+        assert event.status == 404
+        assert isinstance(event.error, SCIMApiError)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["GET /Users/{id}"].count == 2
+        assert snapshot["GET /Users/{id}"].errors == 1
+        assert snapshot["GET /Users"].count == 1
+
+    def test_request_bytes_and_cache(self):
+        if self.server_url is None:
+            return
+        recorder = Recorder()
+        client = SCIMClient(
+            token=self.token,
+            base_url=self.base_url,
+            response_cache=ResponseCache(),
+            hooks=[recorder],
+        )
+        client.patch_user("W111", {"title": "Engineer"})
+        assert recorder.ended[0].method == "PATCH"
+        assert recorder.ended[0].request_bytes > 0
+
+        client.read_user("W111")
+        client.read_user("W111")
+        assert [e.cached for e in recorder.ended[1:]] == [False, True]
+
+    def test_retry_and_rate_limit_waits(self):
+        if self.server_url is None:
+            return
+        recorder = Recorder()
+        client = SCIMClient(
+            token=self.token,
+            base_url=self.base_url,
+            retry_policy=RetryPolicy(sleep=lambda seconds: None),
+            hooks=[recorder],
+        )
+        self.thread.server.failing_requests = 2
+        client.read_user("W111")
+        event = recorder.ended[0]
+        assert event.status == 200
+        assert event.retries == 2
+        assert event.retry_wait > 0
+
+        self.thread.server.retry_after = 0
+        self.thread.server.rate_limited_requests = 1
+        client.read_user("W111")
+        event = recorder.ended[1]
+        assert event.status == 200
+        assert event.retries == 1
+        assert event.rate_limit_wait >= 0
@@ -0,0 +1,77 @@
+import json
+import unittest
+
+from slack_scim import JSONCodec, SCIMApiError, SCIMClient
+from slack_scim.v1.json_codec import default_codec, get_codec
+from slack_scim.v1.response import SCIMResponse
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.loaded = 0
+        self.dumped = 0
+
+        def loads(data):
+            self.loaded += 1
+            return json.loads(data)
+
+        def dumps(obj):
+            self.dumped += 1
+            return json.dumps(obj)
+
+        super().__init__(name="recording", loads=loads, dumps=dumps)
+
+
+class TestJSONCodec(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        self.base_url = self.server_url or SCIMClient.production_base_url
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_codecs(self):
+        assert default_codec().name in ("orjson", "ujson", "json")
+        assert default_codec() is default_codec()
+        with self.assertRaises(ValueError):
+            get_codec("simplejson")
+
+        data = {"userName": "seratch", "name": {"givenName": "Kazuhiro"}, "emails": [{"value": "日本語"}]}
+        for name in ("json", "ujson", "orjson"):
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                continue
+            body = codec.dumps(data)
+            assert isinstance(body, str)
+            assert codec.loads(body) == data
+            assert codec.loads(body.encode("utf-8")) == data
+            body = codec.dumps_bytes(data)
+            assert isinstance(body, bytes)
+            assert codec.loads(body) == data
+
+    def test_client(self):
+        codec = RecordingCodec()
+        client = SCIMClient(token=self.token, base_url=self.base_url, json_codec=codec)
+        assert client.read_user("W111").id == "W111"
+        assert codec.loaded == 1
+
+        client.patch_user("W111", {"title": "Engineer"})
+        assert codec.dumped == 1
+        assert codec.loaded == 2
+
+        with client.stream_groups() as stream:
+            assert len(list(stream)) == 3
+        assert codec.loaded > 3
+
+    def test_errors(self):
+        codec = RecordingCodec()
+        resp = SCIMResponse(status=404, reason="Not Found", headers={}, body='{"Errors": {"code": 404}}')
+        error = SCIMApiError.from_response(resp, codec)
+        assert error.errors == {"code": 404}
+        assert codec.loaded == 1
+        assert SCIMApiError.from_response(resp).errors == {"code": 404}
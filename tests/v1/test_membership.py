@@ -0,0 +1,87 @@
+import unittest
+
+from slack_scim import MembershipIndex, SCIMClient
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestMembershipIndex(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_build(self):
+        index = MembershipIndex.build(self.client, page_size=2)
+        assert {"S111", "S222", "S333"} <= index.group_ids
+        assert index.members_of("S999") == frozenset()
+        assert index.groups_of("W999") == frozenset()
+
+    def test_updates(self):
+        index = MembershipIndex()
+        index.set_members("S1", ["W1", "W2"])
+        index.set_members("S2", ["W2"])
+        assert index.members_of("S1") == {"W1", "W2"}
+        assert index.groups_of("W2") == {"S1", "S2"}
+        assert index.is_member("W1", "S1")
+        assert not index.is_member("W1", "S2")
+
+        index.set_members("S1", ["W2", "W3"])
+        assert index.groups_of("W1") == frozenset()
+        assert index.groups_of("W3") == {"S1"}
+
+        index.remove_user("W2")
+        assert index.members_of("S1") == {"W3"}
+        assert index.members_of("S2") == frozenset()
+
+        index.remove_group("S1")
+        assert index.groups_of("W3") == frozenset()
+        assert index.group_ids == {"S2"}
+
+    def test_apply_group_patch(self):
+        index = MembershipIndex()
+        index.set_members("S1", ["W1", "W2"])
+        index.apply_group_patch("S1", {
+            "members": [
+                {"value": "W1", "operation": "delete"},
+                {"value": "W3"},
+            ],
+        })
+        assert index.members_of("S1") == {"W2", "W3"}
+        assert index.groups_of("W1") == frozenset()
+
+        # replacing all the members
+        index.apply_group_patch("S1", {"members": [{"value": "W4"}], "meta": {"attributes": ["members"]}})
+        assert index.members_of("S1") == {"W4"}
+        assert index.groups_of("W2") == frozenset()
+
+        # the other attributes don't change the membership
+        index.apply_group_patch("S1", {"displayName": "renamed"})
+        assert index.members_of("S1") == {"W4"}
+
+    def test_client_updates(self):
+        if self.server_url is None:
+            # this test changes real groups
+            return
+        index = MembershipIndex()
+        index.set_members("S111", ["W111"])
+        client = SCIMClient(token=self.token, base_url=self.server_url, membership_index=index)
+
+        client.patch_group("S111", {"members": [{"value": "W222"}, {"value": "W111", "operation": "delete"}]})
+        assert index.members_of("S111") == {"W222"}
+        assert index.groups_of("W111") == frozenset()
+
+        client.update_group("S111", {"displayName": "test-group", "members": [{"value": "W333"}]})
+        assert index.members_of("S111") == {"W333"}
+
+        client.delete_group("S111")
+        assert index.members_of("S111") == frozenset()
+        assert index.groups_of("W333") == frozenset()
+
+        client.create_group({"displayName": "test-group", "members": [{"value": "W111"}]})
+        assert index.groups_of("W111") == {"S111"}
@@ -0,0 +1,147 @@
+import asyncio
+import itertools
+import random
+import threading
+import time
+import unittest
+
+import pytest
+
+from slack_scim import AsyncSCIMClient, SCIMClient, SCIMApiError, Users
+from slack_scim.v1.pagination import iterate_resources, scan_resources
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+def build_users_page(start_index: int, count: int, total: int) -> Users:
+    end = min(start_index + count, total + 1)
+    return Users.from_dict({
+        "totalResults": total,
+        "itemsPerPage": end - start_index,
+        "startIndex": start_index,
+        "Resources": [{"id": f"W{i}", "userName": f"user{i}"} for i in range(start_index, end)],
+    })
+
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_iterate_all_pages(self):
+        requested = []
+
+        def fetch_page(start_index, count):
+            requested.append((start_index, count))
+            return build_users_page(start_index, count, 10)
+
+        events = []
+        ids = [u.id for u in iterate_resources(fetch_page, page_size=4, on_page=events.append)]
+        assert ids == [f"W{i}" for i in range(1, 11)]
+        assert requested == [(1, 4), (5, 4), (9, 4)]
+        assert [e.resource_count for e in events] == [4, 4, 2]
+        assert all(e.total_results == 10 and e.elapsed >= 0 for e in events)
+
+    def test_next_page_is_prefetched(self):
+        second_page_requested = threading.Event()
+
+        def fetch_page(start_index, count):
+            if start_index > 1:
+                second_page_requested.set()
+            return build_users_page(start_index, count, 4)
+
+        iterator = iterate_resources(fetch_page, page_size=2)
+        assert next(iterator).id == "W1"
+        # The second page is requested while the first one is being consumed
+        assert second_page_requested.wait(3)
+        assert [u.id for u in iterator] == ["W2", "W3", "W4"]
+
+    def test_errors_are_propagated(self):
+        with pytest.raises(SCIMApiError):
+            list(SCIMClient(token="invalid", base_url=self.client.base_url).iter_users(page_size=2))
+
+    def test_scan_in_order(self):
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        def fetch_page(start_index, count):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(random.random() * 0.02)
+            with lock:
+                running[0] -= 1
+            return build_users_page(start_index, count, 95)
+
+        events = []
+        ids = [u.id for u in scan_resources(fetch_page, page_size=10, concurrency=4, on_page=events.append)]
+        assert ids == [f"W{i}" for i in range(1, 96)]
+        assert sorted(e.start_index for e in events) == list(range(1, 96, 10))
+        assert 1 < max_running[0] <= 4
+
+    def test_scan_as_completed(self):
+        def fetch_page(start_index, count):
+            # the later pages come back first
+            time.sleep(0.05 if start_index < 30 else 0)
+            return build_users_page(start_index, count, 50)
+
+        ids = [u.id for u in scan_resources(fetch_page, page_size=10, concurrency=4, ordered=False)]
+        assert sorted(ids) == sorted(f"W{i}" for i in range(1, 51))
+        assert ids != [f"W{i}" for i in range(1, 51)]
+
+    def test_scan_uses_first_page_size(self):
+        requested = []
+
+        def fetch_page(start_index, count):
+            requested.append(start_index)
+            return build_users_page(start_index, count or 3, 7)
+
+        ids = [u.id for u in scan_resources(fetch_page)]
+        assert ids == [f"W{i}" for i in range(1, 8)]
+        assert sorted(requested) == [1, 4, 7]
+
+    def test_scan_fills_short_pages(self):
+        requested = []
+
+        def fetch_page(start_index, count):
+            requested.append((start_index, count))
+            # the server returns at most 4 resources, and only 2 for the page at 9
+            return build_users_page(start_index, min(count, 2 if start_index == 9 else 4), 20)
+
+        ids = [u.id for u in scan_resources(fetch_page, page_size=10, concurrency=2)]
+        assert ids == [f"W{i}" for i in range(1, 21)]
+        assert (11, 2) in requested
+
+    def test_scan_groups(self):
+        groups = list(self.client.scan_groups(page_size=3))
+        assert [g.id for g in groups] == ["S111", "S222", "S333"]
+
+    def test_iter_users(self):
+        events = []
+        users = list(itertools.islice(self.client.iter_users(page_size=3, on_page=events.append), 7))
+        assert len(users) == 7
+        assert [e.start_index for e in events] == [1, 4, 7]
+
+    def test_iter_groups(self):
+        groups = list(self.client.iter_groups(page_size=3))
+        assert [g.id for g in groups] == ["S111", "S222", "S333"]
+
+    def test_async_iter_groups(self):
+        client = AsyncSCIMClient(token=self.token, base_url=self.client.base_url)
+
+        async def collect():
+            return [g.id async for g in client.iter_groups(page_size=3)]
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(collect()) == ["S111", "S222", "S333"]
+        finally:
+            client.connection_pool.close()
+            loop.close()
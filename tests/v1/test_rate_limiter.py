@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+
+from slack_scim import SCIMClient, SCIMApiError, RateLimiter
+from slack_scim.v1.rate_limiter import TokenBucket, endpoint_family, parse_retry_after
+from tests.v1 import load_token, is_prod_test_mode
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        self.base_url = self.server_url or SCIMClient.production_base_url
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_endpoint_family(self):
+        assert endpoint_family("GET", "https://api.slack.com/scim/v1/Users?count=1") == "users_read"
+        assert endpoint_family("PATCH", "https://api.slack.com/scim/v1/Users/W111") == "users_write"
+        assert endpoint_family("GET", "https://api.slack.com/scim/v1/Groups/S111") == "groups_read"
+        assert endpoint_family("DELETE", "https://api.slack.com/scim/v1/Groups/S111") == "groups_write"
+        assert endpoint_family("GET", "https://api.slack.com/scim/v1/ServiceProviderConfigs") == \
+               "service_provider_configs"
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("invalid") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_token_bucket_paces_calls(self):
+        bucket = TokenBucket(requests_per_minute=600, burst=1)
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        # 1 token in the bucket, then 3 more tokens at 10 per second
+        assert 0.25 < time.monotonic() - started < 1.0
+
+    def test_token_bucket_pause(self):
+        bucket = TokenBucket()
+        bucket.pause(0.2)
+        assert bucket.budget("users_read").paused_for > 0
+        assert bucket.acquire() >= 0.15
+
+    def test_429_is_retried(self):
+        if is_prod_test_mode():
+            return
+        self.thread.server.rate_limited_requests = 2
+        client = SCIMClient(token=self.token, base_url=self.base_url)
+        user = client.read_user("W111")
+        assert user.id == "W111"
+        budget = client.rate_limiter.budget("users_read")
+        assert budget.throttled == 2
+        assert client.rate_limiter.budget("users_write").throttled == 0
+
+    def test_429_retries_exhausted(self):
+        if is_prod_test_mode():
+            return
+        self.thread.server.rate_limited_requests = 3
+        client = SCIMClient(token=self.token, base_url=self.base_url, rate_limiter=RateLimiter(max_retries=1))
+        with self.assertRaises(SCIMApiError) as cm:
+            client.patch_user("W111", {"title": "engineer"})
+        assert cm.exception.status == 429
+        # the connection is still usable
+        assert client.patch_user("W111", {"title": "engineer"}).id == "W111"
+
+    def test_retry_after_pauses_the_family(self):
+        if is_prod_test_mode():
+            return
+        self.thread.server.rate_limited_requests = 1
+        self.thread.server.retry_after = "1"
+        client = SCIMClient(token=self.token, base_url=self.base_url)
+        results = []
+
+        def read():
+            results.append(client.read_user("W111"))
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        threads[0].start()
+        time.sleep(0.2)
+        for t in threads[1:]:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 3
+        assert time.monotonic() - started >= 1.0
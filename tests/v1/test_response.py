@@ -0,0 +1,63 @@
+import unittest
+
+from slack_scim import SCIMClient
+from slack_scim.v1.request import SCIMRequest
+from slack_scim.v1.response import SCIMResponse
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestResponse(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_lazy_body(self):
+        resp = SCIMResponse(status=200, reason="OK", headers={}, raw_body='{"title": "Café"}'.encode("latin-1"),
+                            charset="latin-1")
+        assert resp.json == {"title": "Café"}
+        assert resp.json is resp.json
+        assert resp.body == '{"title": "Café"}'
+
+        resp = SCIMResponse(status=200, reason="OK", headers={}, body='{"id": "W1"}')
+        assert resp.raw_body == b'{"id": "W1"}'
+        assert resp.json == {"id": "W1"}
+
+        resp = SCIMResponse(status=204, reason="No Content", headers={}, raw_body=b"")
+        assert resp.body is None
+        assert resp.json is None
+
+        # the body can be replaced as before it became lazy
+        resp = SCIMResponse(status=200, reason="OK", headers={}, raw_body=b'{"id": "W1"}')
+        assert resp.json == {"id": "W1"}
+        resp.body = '{"id": "W2"}'
+        assert resp.raw_body == b'{"id": "W2"}'
+        assert resp.json == {"id": "W2"}
+
+    def test_passthrough(self):
+        resp = self.client.api_call(SCIMRequest(
+            token=self.token,
+            http_method="GET",
+            url=f"{self.client.base_url}/Users/W111",
+        ))
+        assert resp.is_success()
+        assert resp.raw_body.startswith(b"{")
+        assert resp.json["id"] == "W111"
+
+        if self.server_url is None:
+            return
+        body = b'{"schemas": ["urn:scim:schemas:core:1.0"], "title": "Engineer"}'
+        resp = self.client.api_call(SCIMRequest(
+            token=self.token,
+            http_method="PATCH",
+            url=f"{self.client.base_url}/Users/W111",
+            raw_body=body,
+        ))
+        assert resp.is_success()
+        assert self.thread.server.patch_bodies[-1] == {"schemas": ["urn:scim:schemas:core:1.0"], "title": "Engineer"}
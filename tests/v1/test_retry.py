@@ -0,0 +1,86 @@
+import unittest
+
+import pytest
+
+from slack_scim import SCIMClient, SCIMApiError, RetryPolicy
+from tests.v1 import load_token, is_prod_test_mode
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        self.base_url = self.server_url or SCIMClient.production_base_url
+        self.waits = []
+        self.retry_policy = RetryPolicy(sleep=self.waits.append)
+        self.client = SCIMClient(token=self.token, base_url=self.base_url, retry_policy=self.retry_policy)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_backoff_with_full_jitter(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        for _ in range(100):
+            assert 0 <= policy.backoff(1) <= 1.0
+            assert 0 <= policy.backoff(3) <= 4.0
+            assert 0 <= policy.backoff(10) <= 5.0
+
+    def test_retry_budget(self):
+        policy = RetryPolicy(budget_ratio=0.5, budget_min_retries=2)
+        assert policy.should_retry(http_method="GET", retry_count=0, status=503)
+        assert policy.should_retry(http_method="GET", retry_count=0, status=503)
+        assert not policy.should_retry(http_method="GET", retry_count=0, status=503)
+        policy.on_request()
+        policy.on_request()
+        assert policy.should_retry(http_method="GET", retry_count=0, status=503)
+        stats = policy.stats
+        assert stats.retries == 3
+        assert stats.denied_by_budget == 1
+
+    def test_idempotency_rules(self):
+        policy = RetryPolicy()
+        assert policy.should_retry(http_method="PUT", retry_count=0, error=ConnectionResetError())
+        assert not policy.should_retry(http_method="POST", retry_count=0, error=ConnectionResetError())
+        assert not policy.should_retry(http_method="GET", retry_count=0, error=ValueError())
+        assert not policy.should_retry(http_method="GET", retry_count=0, status=400)
+        assert not policy.should_retry(http_method="GET", retry_count=3, status=503)
+
+        policy = RetryPolicy(retryable_methods=("GET", "POST"))
+        assert policy.should_retry(http_method="POST", retry_count=0, status=502)
+
+    def test_5xx_is_retried(self):
+        if is_prod_test_mode():
+            return
+        self.thread.server.failing_requests = 2
+        user = self.client.read_user("W111")
+        assert user.id == "W111"
+        assert len(self.waits) == 2
+        stats = self.retry_policy.stats
+        assert stats.retries == 2
+        assert stats.retried_statuses == 2
+
+    def test_5xx_retries_exhausted(self):
+        if is_prod_test_mode():
+            return
+        self.thread.server.failing_requests = 4
+        with pytest.raises(SCIMApiError):
+            self.client.read_user("W111")
+        assert self.retry_policy.stats.exhausted == 1
+
+    def test_connection_error_is_retried(self):
+        if is_prod_test_mode():
+            return
+        self.thread.server.dropped_requests = 1
+        user = self.client.update_user("W111", {"title": "engineer"})
+        assert user.id == "W111"
+        assert self.retry_policy.stats.retried_errors == 1
+
+    def test_post_is_not_retried(self):
+        if is_prod_test_mode():
+            return
+        self.thread.server.dropped_requests = 1
+        with pytest.raises(ConnectionError):
+            self.client.create_user({"userName": "test", "name": {}, "emails": []})
+        assert self.retry_policy.stats.retries == 0
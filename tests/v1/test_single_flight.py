@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from slack_scim import AsyncSCIMClient, AsyncSingleFlight, SCIMClient, SingleFlight
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        self.base_url = self.server_url or SCIMClient.production_base_url
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_do(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            leader = executor.submit(single_flight.do, "key", slow)
+            started.wait()
+            followers = [executor.submit(single_flight.do, "key", slow) for _ in range(4)]
+            other = executor.submit(single_flight.do, "other", lambda: "other result")
+            assert other.result() == "other result"
+            while single_flight.coalesced < 4:
+                time.sleep(0.01)
+            release.set()
+            assert leader.result() == "result"
+            assert [f.result() for f in followers] == ["result"] * 4
+        assert len(calls) == 1
+        assert single_flight.to_dict() == {"executed": 2, "coalesced": 4, "in_flight": 0}
+
+        # the next call runs again
+        assert single_flight.do("key", lambda: "new result") == "new result"
+
+    def test_errors(self):
+        single_flight = SingleFlight()
+
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            single_flight.do("key", fail)
+        assert single_flight.do("key", lambda: 1) == 1
+
+    def test_async_do(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def run():
+            return await asyncio.gather(*[single_flight.do("key", slow) for _ in range(10)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(run()) == ["result"] * 10
+        finally:
+            loop.close()
+        assert len(calls) == 1
+        assert single_flight.coalesced == 9
+
+    def test_client(self):
+        if self.server_url is None:
+            return
+        self.thread.server.get_delay = 0.2
+        client = SCIMClient(token=self.token, base_url=self.base_url, single_flight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            users = list(executor.map(lambda _: client.read_user("W111"), range(10)))
+        assert all(u.id == "W111" for u in users)
+        # each caller decodes its own copy
+        assert len({id(u) for u in users}) == 10
+        assert client.single_flight.coalesced + client.single_flight.executed == 10
+        assert client.single_flight.coalesced > 0
+        assert self.thread.server.get_count == client.single_flight.executed
+
+    def test_async_client(self):
+        if self.server_url is None:
+            return
+        self.thread.server.get_delay = 0.2
+        client = AsyncSCIMClient(token=self.token, base_url=self.base_url, single_flight=AsyncSingleFlight())
+
+        async def read_all():
+            return await asyncio.gather(*[client.search_users(filter="userName eq \"bot-user\"") for _ in range(10)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(read_all())
+        finally:
+            client.connection_pool.close()
+            loop.close()
+        assert all(r.total_results == 360 for r in results)
+        assert client.single_flight.coalesced == 9
+        assert self.thread.server.get_count == 1
@@ -0,0 +1,133 @@
+import threading
+import time
+import unittest
+
+from slack_scim import DirectorySnapshot, SCIMClient
+from slack_scim.v1.groups import Resource as GroupsResource
+from slack_scim.v1.users import Resource as UsersResource
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+def build_user(id: str, user_name: str, external_id: str = "", emails: list = None) -> UsersResource:
+    return UsersResource.from_dict({
+        "id": id,
+        "userName": user_name,
+        "externalId": external_id,
+        "emails": emails or [],
+    })
+
+
+class CheckingDict(dict):
+    # Runs a check after every change, to see what the lookups running meanwhile would find
+    def __init__(self, items: dict, check):
+        super().__init__(items)
+        self.check = check
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.check()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.check()
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_load(self):
+        snapshot = DirectorySnapshot(self.client, concurrency=8)
+        assert snapshot.loaded_at is not None
+        assert snapshot.user_count == 3
+        assert snapshot.group_count == 3
+        assert snapshot.user("W222").user_name == "blaise.beahan"
+        assert snapshot.user_by_user_name("bot-user").id == "W111"
+        assert snapshot.user_by_email("Blaise.Beahan@Example.com ").id == "W222"
+        assert snapshot.user_by_email("") is None
+        assert snapshot.user_by_external_id("") is None
+        assert snapshot.group("S333").display_name == "test-group-333"
+        assert snapshot.user("W999") is None
+
+    def test_indexes(self):
+        snapshot = DirectorySnapshot(self.client, load=False)
+        assert snapshot.user_count == 0
+        alice = build_user("W1", "alice", "ext-1", [
+            {"value": "alice@example.com", "primary": True},
+            {"value": "shared@example.com", "primary": False},
+        ])
+        bob = build_user("W2", "bob", "ext-2", [
+            {"value": "shared@example.com", "primary": True},
+        ])
+        snapshot.replace([alice, bob], [GroupsResource.from_dict({"id": "S1", "displayName": "g"})])
+        assert snapshot.user_by_external_id("ext-1") is alice
+        assert snapshot.user_by_email("ALICE@example.com") is alice
+        # a primary email wins over a secondary one
+        assert snapshot.user_by_email("shared@example.com") is bob
+        assert snapshot.group("S1").display_name == "g"
+
+        with snapshot.lock:
+            renamed = build_user("W1", "alice2", "ext-1", [{"value": "alice2@example.com", "primary": True}])
+            snapshot.indexes.add_user(renamed)
+        assert snapshot.user_by_user_name("alice") is None
+        assert snapshot.user_by_email("alice@example.com") is None
+        assert snapshot.user_by_user_name("alice2") is renamed
+        assert snapshot.user_by_email("shared@example.com") is bob
+
+        snapshot.indexes.remove_user(bob)
+        assert snapshot.user("W2") is None
+        assert snapshot.user_by_email("shared@example.com") is None
+        assert [u.id for u in snapshot.users] == ["W1"]
+
+    def test_lookups_during_updates(self):
+        snapshot = DirectorySnapshot(self.client, load=False)
+        snapshot.replace([build_user("W1", "alice", "ext-1", [{"value": "alice@example.com", "primary": True}])], [])
+        indexes = snapshot.indexes
+
+        def check():
+            assert snapshot.user("W1") is not None
+            assert snapshot.user_by_external_id("ext-1") is not None
+            assert snapshot.user_by_email("alice@example.com") is not None
+
+        indexes.users_by_id = CheckingDict(indexes.users_by_id, check)
+        indexes.users_by_external_id = CheckingDict(indexes.users_by_external_id, check)
+        indexes.users_by_email = CheckingDict(indexes.users_by_email, check)
+        indexes.users_by_user_name = CheckingDict(indexes.users_by_user_name, check)
+        with snapshot.lock:
+            indexes.add_user(build_user("W1", "alice2", "ext-1", [
+                {"value": "alice@example.com", "primary": False},
+                {"value": "alice2@example.com", "primary": True},
+            ]))
+        assert snapshot.user_by_user_name("alice") is None
+        assert snapshot.user_by_email("alice@example.com").user_name == "alice2"
+        assert snapshot.user_by_email("alice2@example.com").user_name == "alice2"
+
+    def test_lookups_during_refresh(self):
+        snapshot = DirectorySnapshot(self.client)
+        errors = []
+        stop = threading.Event()
+
+        def lookup():
+            while not stop.is_set():
+                if snapshot.user_by_email("blaise.beahan@example.com") is None:
+                    errors.append("not found")
+                time.sleep(0.01)
+
+        readers = [threading.Thread(target=lookup) for _ in range(2)]
+        for t in readers:
+            t.start()
+        try:
+            snapshot.refresh()
+        finally:
+            stop.set()
+            for t in readers:
+                t.join()
+        assert errors == []
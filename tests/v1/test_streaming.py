@@ -0,0 +1,86 @@
+import json
+import random
+import unittest
+
+import pytest
+
+from slack_scim import SCIMClient, SCIMApiError
+from slack_scim.v1.streaming import ResourcesParser
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+def feed_in_chunks(parser: ResourcesParser, data: bytes, max_chunk_size: int) -> list:
+    elements = []
+    i = 0
+    while i < len(data):
+        size = random.randint(1, max_chunk_size)
+        elements.extend(parser.feed(data[i:i + size]))
+        i += size
+    return elements
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_parser_with_fixtures(self):
+        for name in ["v1_users_1.json", "v1_users_2.json", "v1_groups_1.json", "v1_groups_2.json"]:
+            with open(f"tests/fixture/{name}", "rb") as f:
+                data = f.read()
+            expected = json.loads(data)
+            for max_chunk_size in [1, 7, 64, len(data)]:
+                parser = ResourcesParser()
+                assert feed_in_chunks(parser, data, max_chunk_size) == expected["Resources"], name
+                header = parser.close()
+                assert header == dict(expected, Resources=[]), name
+
+    def test_parser_with_tricky_strings(self):
+        document = {
+            "note": "\"Resources\": [{",
+            "Resources": [
+                {"a": "}]\\", "b": [1, {"c": []}], "d": "あ\"{"},
+                {"e": None, "f": True, "g": -1.5e3},
+            ],
+            "schemas": ["Resources"],
+            "totalResults": 2,
+        }
+        data = json.dumps(document).encode("utf-8")
+        parser = ResourcesParser()
+        assert feed_in_chunks(parser, data, 3) == document["Resources"]
+        assert parser.close() == dict(document, Resources=[])
+
+    def test_parser_header_before_elements(self):
+        parser = ResourcesParser()
+        assert parser.feed(b'{"totalResults": 360, "startIndex": 1, "Resources": [{"id"') == []
+        assert parser.header["totalResults"] == 360
+        assert parser.feed(b': "W1"}, {"id": "W2"}') == [{"id": "W1"}, {"id": "W2"}]
+        with pytest.raises(ValueError):
+            parser.close()
+
+    def test_stream_users(self):
+        stream = self.client.stream_users(count=3)
+        ids = []
+        for user in stream:
+            assert stream.total_results == 360
+            ids.append(user.id)
+        assert ids == [u.id for u in self.client.search_users(count=3).resources]
+        stats = self.client.connection_pool.stats
+        assert stats.connections_created == 1
+
+    def test_stream_groups_closed_early(self):
+        with self.client.stream_groups(count=3) as stream:
+            first = next(iter(stream))
+            assert first.id == "S111"
+        assert self.client.read_group("S222").id == "S222"
+
+    def test_stream_errors(self):
+        with pytest.raises(SCIMApiError):
+            SCIMClient(token="invalid", base_url=self.client.base_url).stream_users(count=3)
@@ -0,0 +1,129 @@
+import re
+import unittest
+
+import pytest
+
+from slack_scim import DirectorySync, SCIMClient, SCIMApiError
+from slack_scim.v1.groups import Resource as GroupsResource
+from slack_scim.v1.sync import parse_timestamp
+from slack_scim.v1.users import Resource as UsersResource
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class FakeDirectoryClient:
+    # Evaluates the meta filters on an in-memory directory like Slack does
+    def __init__(self, supports_last_modified: bool = True):
+        self.supports_last_modified = supports_last_modified
+        self.users = {}
+        self.groups = {}
+        self.filters = []
+
+    def put_user(self, id: str, user_name: str, created: str, last_modified: str = None):
+        self.users[id] = {
+            "id": id,
+            "userName": user_name,
+            "meta": {"created": created, "lastModified": last_modified or created},
+        }
+
+    def put_group(self, id: str, display_name: str, created: str):
+        self.groups[id] = {"id": id, "displayName": display_name, "meta": {"created": created}}
+
+    def _select(self, resources: dict, filter: str) -> list:
+        self.filters.append(filter)
+        if filter is None:
+            return list(resources.values())
+        m = re.match(r'meta\.(\w+) ge "(.+)"', filter)
+        if m.group(1) == "lastModified" and not self.supports_last_modified:
+            raise SCIMApiError(status=400, headers={}, errors={"description": "invalid_filter", "code": 400})
+        since = parse_timestamp(m.group(2))
+        meta_values = [(r, r["meta"].get(m.group(1)) or r["meta"]["created"]) for r in resources.values()]
+        return [r for r, value in meta_values if parse_timestamp(value) >= since]
+
+    def scan_users(self, *, filter=None, page_size=None, concurrency=4):
+        return [UsersResource.from_dict(r) for r in self._select(self.users, filter)]
+
+    def scan_groups(self, *, filter=None, page_size=None, concurrency=4):
+        return [GroupsResource.from_dict(r) for r in self._select(self.groups, filter)]
+
+
+class TestSync(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        base_url = self.server_url or SCIMClient.production_base_url
+        self.client = SCIMClient(token=self.token, base_url=base_url)
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_parse_timestamp(self):
+        assert parse_timestamp("2019-12-14T01:26:43-08:00") == parse_timestamp("2019-12-14T09:26:43Z")
+        assert parse_timestamp("2019-12-14T01:26:43.123+09:00") is not None
+        assert parse_timestamp("yesterday") is None
+
+    def test_incremental_cycles(self):
+        client = FakeDirectoryClient()
+        client.put_user("W1", "alice", "2020-01-01T00:00:00-08:00")
+        client.put_user("W2", "bob", "2020-01-02T00:00:00-08:00")
+        client.put_group("S1", "group-1", "2020-01-01T00:00:00-08:00")
+        sync = DirectorySync(client, reconcile_every=3)
+
+        changes = sync.sync()
+        assert changes.reconciled
+        assert [u.id for u in changes.added_users] == ["W1", "W2"]
+        assert [g.id for g in changes.added_groups] == ["S1"]
+        assert sync.snapshot.user_by_user_name("bob").id == "W2"
+        assert sync.checkpoints["users"] == "2020-01-02T00:00:00-08:00"
+
+        # nothing changed; the last change is returned again by "ge" but not reported
+        changes = sync.sync()
+        assert changes.is_empty() and not changes.reconciled
+        assert client.filters[-2] == 'meta.lastModified ge "2020-01-02T00:00:00-08:00"'
+
+        client.put_user("W1", "alice2", "2020-01-01T00:00:00-08:00", "2020-01-03T00:00:00+09:00")
+        client.put_user("W3", "carol", "2020-01-04T00:00:00-08:00")
+        del client.users["W2"]
+        changes = sync.sync()
+        assert [u.id for u in changes.added_users] == ["W3"]
+        assert [u.user_name for u in changes.updated_users] == ["alice2"]
+        # removals are detected only by reconciliation
+        assert changes.removed_users == []
+        assert sync.snapshot.user_by_user_name("alice") is None
+        assert sync.snapshot.user_by_user_name("alice2").id == "W1"
+
+        changes = sync.sync()
+        assert changes.reconciled
+        assert [u.id for u in changes.removed_users] == ["W2"]
+        assert sync.snapshot.user("W2") is None
+        assert sync.snapshot.user_count == 2
+
+    def test_filter_fallback(self):
+        client = FakeDirectoryClient(supports_last_modified=False)
+        client.put_user("W1", "alice", "2020-01-01T00:00:00-08:00")
+        sync = DirectorySync(client, reconcile_every=0)
+        assert sync.sync().updates_covered
+        client.put_user("W2", "bob", "2020-01-02T00:00:00-08:00")
+        with self.assertLogs("slack_scim.v1.sync", level="WARNING") as logs:
+            changes = sync.sync()
+        assert "sync(reconcile=True)" in logs.output[0]
+        assert [u.id for u in changes.added_users] == ["W2"]
+        assert client.filters[-2] == 'meta.created ge "2020-01-01T00:00:00-08:00"'
+        # the modified users are not searched for anymore
+        assert not changes.updates_covered
+        assert not sync.updates_covered
+        assert sync.sync(reconcile=True).updates_covered
+
+    def test_full_scans_without_usable_filters(self):
+        # the mock server ignores filters, and its groups have no meta at all
+        sync = DirectorySync(self.client, reconcile_every=0)
+        assert sync.sync().reconciled
+        assert sync.snapshot.group_count == 3
+        assert sync.sync().is_empty()
+
+    def test_errors(self):
+        sync = DirectorySync(SCIMClient(token="invalid", base_url=self.client.base_url))
+        with pytest.raises(SCIMApiError):
+            sync.sync()
+        assert sync.cycles == 0
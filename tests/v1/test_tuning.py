@@ -0,0 +1,108 @@
+import itertools
+import json
+import unittest
+
+from slack_scim import ClientTuning, SCIMClient, ServiceProviderConfigs
+from tests.v1 import load_token
+from tests.v1.mock_server import setup_mock_server, cleanup_mock_server
+
+
+class RecordingSCIMClient(SCIMClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.configs_requests = 0
+        self.configs_failures = 0
+        self.counts = []
+
+    def get_service_provider_configs(self) -> ServiceProviderConfigs:
+        self.configs_requests += 1
+        if self.configs_failures > 0:
+            self.configs_failures -= 1
+            raise ConnectionError("unreachable")
+        return super().get_service_provider_configs()
+
+    def search_users(self, *, count: int = None, **kwargs):
+        self.counts.append(count)
+        return super().search_users(count=count, **kwargs)
+
+
+def load_configs(**changes) -> ServiceProviderConfigs:
+    with open("tests/fixture/v1_service_provider_configs.json") as f:
+        configs = json.load(f)
+    for key, value in changes.items():
+        configs[key].update(value)
+    return ServiceProviderConfigs.from_dict(configs)
+
+
+class TestTuning(unittest.TestCase):
+    def setUp(self):
+        setup_mock_server(self)
+        # `admin` scope required
+        self.token = load_token()
+        self.base_url = self.server_url or SCIMClient.production_base_url
+
+    def tearDown(self):
+        cleanup_mock_server(self)
+
+    def test_from_service_provider_configs(self):
+        # Slack reports 0 for the limits
+        tuning = ClientTuning.from_service_provider_configs(load_configs(), page_size=100, batch_chunk_size=10)
+        assert tuning.to_dict() == {"page_size": 100, "max_page_size": None, "batch_chunk_size": 10}
+        assert tuning.page_size_for(None) == 100
+        assert tuning.page_size_for(5000) == 5000
+
+        tuning = ClientTuning.from_service_provider_configs(load_configs(
+            filter={"supported": True, "maxResults": 500},
+            bulk={"supported": True, "maxOperations": 50},
+        ))
+        assert tuning.to_dict() == {"page_size": 500, "max_page_size": 500, "batch_chunk_size": 50}
+        assert tuning.page_size_for(None) == 500
+        assert tuning.page_size_for(100) == 100
+        assert tuning.page_size_for(5000) == 500
+
+        assert ClientTuning.from_service_provider_configs(None).to_dict() == ClientTuning().to_dict()
+
+    def test_client(self):
+        client = RecordingSCIMClient(token=self.token, base_url=self.base_url)
+        list(itertools.islice(client.iter_users(), 5))
+        list(itertools.islice(client.iter_users(page_size=2), 5))
+        # fetched only once
+        assert client.configs_requests == 1
+        assert client.tuning.configs is not None
+        assert client.counts[0] is None
+        assert client.counts[-1] == 2
+
+        client.tuning.page_size = 3
+        list(itertools.islice(client.iter_users(), 1))
+        assert client.counts[-1] == 3
+
+    def test_explicit_sizes(self):
+        client = RecordingSCIMClient(token=self.token, base_url=self.base_url)
+        list(itertools.islice(client.iter_users(page_size=2), 3))
+        list(client.scan_users(page_size=2))
+        client.batch(chunk_size=4).run(lambda item: item, range(10))
+        # nothing needs ServiceProviderConfigs
+        assert client.configs_requests == 0
+        assert client.counts[0] == 2
+
+    def test_fetch_failure_is_not_cached(self):
+        client = RecordingSCIMClient(token=self.token, base_url=self.base_url)
+        client.configs_failures = 1
+        list(itertools.islice(client.iter_users(), 1))
+        # the defaults are used, and the fetch isn't tried again until tuning_retry_interval passes
+        assert client.tuning.configs is None
+        assert client.configs_requests == 1
+
+        client = RecordingSCIMClient(token=self.token, base_url=self.base_url)
+        client.tuning_retry_interval = 0
+        client.configs_failures = 1
+        assert client.tuning.configs is None
+        assert client.tuning.configs is not None
+        assert client.tuning.configs is not None
+        assert client.configs_requests == 2
+
+    def test_override(self):
+        client = RecordingSCIMClient(token=self.token, base_url=self.base_url, tuning=ClientTuning(max_page_size=2))
+        list(itertools.islice(client.iter_users(page_size=1000), 1))
+        assert client.configs_requests == 0
+        assert client.counts == [2]
@@ -44,6 +44,14 @@ class TestUsers(unittest.TestCase):
         assert len(search_result.resources) == 2
         assert search_result.resources[0].id == user.id
 
+    def test_search_users_lazily(self):
+        search_result: Users = self.client.search_users(count=3, lazy=True)
+        assert len(search_result.resources) == 3
+        user_names = [r["userName"] for r in search_result.resources.raw]
+        assert search_result.resources.decoded_count == 0
+        assert search_result.resources[1].user_name == user_names[1]
+        assert search_result.resources.decoded_count == 1
+
     def test_user_crud(self):
         random_str = ''.join(random.choice(string.ascii_lowercase + string.digits) for _ in range(5))
         new_user: User = User.from_dict({